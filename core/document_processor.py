@@ -151,20 +151,10 @@ class DocumentProcessor:
         Returns:
             Dictionary containing processing results with combined synthesis
         """
-        # Import chunking processor (avoiding circular imports)
-        import sys
-        from pathlib import Path as PPath
-        
-        # Dynamically import the large document processor
-        project_root = PPath(__file__).parent.parent
-        sys.path.insert(0, str(project_root))
-        
-        try:
-            from core.large_document_processor import LargeDocumentProcessor
-        except ImportError:
-            # Fallback if direct import fails
-            sys.path.insert(0, str(project_root))
-            from core.large_document_processor import LargeDocumentProcessor
+        # Import chunking processor here to avoid circular imports. The
+        # ``core`` package is already importable, as the imports at the top
+        # of this module show, so sys.path needs no changes.
+        from core.large_document_processor import LargeDocumentProcessor
         
         self.logger.info(f"Processing large document with chunking strategy: {len(text):,} characters")
         
@@ -7,9 +7,11 @@ Supports both one-time scanning and continuous watching modes.
 
 import os
 import time
+import hashlib
 import logging
+import threading
 from pathlib import Path
-from typing import List, Dict, Optional, Set, Callable
+from typing import List, Dict, Iterator, Optional, Set, Callable
 from dataclasses import dataclass
 from enum import Enum
 
@@ -29,6 +31,21 @@ try:
 except ImportError:
     WATCHDOG_AVAILABLE = False
 
+# Optional BLAKE3 for faster duplicate detection; BLAKE2b is used otherwise
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+
+def _file_digest(file_path: Path) -> bytes:
+    """Return a content digest of a file, read in 1 MiB chunks."""
+    digest = blake3.blake3() if blake3 is not None else hashlib.blake2b(digest_size=32)
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.digest()
+
 
 class ScanMode(Enum):
     """Scan operation modes."""
@@ -143,6 +160,13 @@ class FileScanner:
             "document": [".pdf", ".epub", ".mobi"]
         }
         
+        # Map each extension to its file type once, so classifying a file is
+        # a single dict lookup; earlier types win if an extension is repeated
+        self._extension_types: Dict[str, str] = {}
+        for file_type in ("video", "audio", "document"):
+            for ext in self.supported_extensions.get(file_type, ()):
+                self._extension_types.setdefault(ext, file_type)
+        
         # Set up logging
         self.logger = logger or self._setup_default_logger()
         
@@ -153,6 +177,11 @@ class FileScanner:
         
         # Track processed files to avoid duplicates
         self.processed_files: Set[Path] = set()
+        
+        # Files in each destination directory grouped by size, as
+        # [path, digest] entries whose digest is filled in on first use
+        self._copied_index: Dict[Path, Dict[int, List[list]]] = {}
+        self._copied_index_lock = threading.Lock()
     
     def _setup_default_logger(self) -> logging.Logger:
         """Set up a default logger for the scanner."""
@@ -177,16 +206,7 @@ class FileScanner:
         Returns:
             "audio", "video", "document", or None if not a supported file
         """
-        file_extension = file_path.suffix.lower()
-        
-        if file_extension in self.supported_extensions["video"]:
-            return "video"
-        elif file_extension in self.supported_extensions["audio"]:
-            return "audio"
-        elif file_extension in self.supported_extensions.get("document", []):
-            return "document"
-        
-        return None
+        return self._extension_types.get(file_path.suffix.lower())
     
     def _get_destination_directory(self, file_type: str) -> Path:
         """Get the destination directory for a file type."""
@@ -199,6 +219,59 @@ class FileScanner:
         else:
             raise FileScannerError(f"Unsupported file type: {file_type}")
     
+    def _files_by_size(self, dest_dir: Path) -> Dict[int, List[list]]:
+        """Return the size index for ``dest_dir``, building it on first use.
+
+        Must be called with ``_copied_index_lock`` held.
+        """
+        index = self._copied_index.get(dest_dir)
+        if index is None:
+            index = {}
+            if dest_dir.is_dir():
+                with os.scandir(dest_dir) as it:
+                    for entry in it:
+                        if entry.is_file():
+                            index.setdefault(entry.stat().st_size, []).append([Path(entry.path), None])
+            self._copied_index[dest_dir] = index
+        return index
+    
+    def _find_duplicate(self, file_path: Path, file_size: int, dest_dir: Path) -> Optional[Path]:
+        """
+        Find a file in ``dest_dir`` with the same contents as ``file_path``.
+        
+        Only files of the same size are hashed, so sources with a unique
+        size are never read.
+        
+        Args:
+            file_path: Path to the source file
+            file_size: Size of the source file in bytes
+            dest_dir: Destination directory to search
+            
+        Returns:
+            Path of the matching file, or None if there is none
+        """
+        with self._copied_index_lock:
+            candidates = list(self._files_by_size(dest_dir).get(file_size, ()))
+        if not candidates:
+            return None
+        
+        try:
+            source_digest = _file_digest(file_path)
+        except OSError:
+            # Let the copy itself report the problem
+            return None
+        for entry in candidates:
+            path, digest = entry
+            if digest is None:
+                try:
+                    digest = entry[1] = _file_digest(path)
+                except OSError:
+                    # Removed since the index was built
+                    continue
+            if digest == source_digest:
+                return path
+        return None
+    
     def _copy_media_file(self, file_path: Path, file_type: str) -> ScanResult:
         """
         Copy a media file to the appropriate data directory.
@@ -241,7 +314,8 @@ class FileScanner:
                     error_message="File already exists in destination"
                 )
             
-            # Handle dry-run mode
+            # Handle dry-run mode; the duplicate check below reads and hashes
+            # file contents, which a dry run should not do
             if self.dry_run:
                 return ScanResult(
                     file_path=file_path,
@@ -251,8 +325,21 @@ class FileScanner:
                     file_size=file_size
                 )
             
+            # Skip files whose contents were already copied under another name
+            duplicate = self._find_duplicate(file_path, file_size, dest_dir)
+            if duplicate is not None:
+                return ScanResult(
+                    file_path=file_path,
+                    file_type=file_type,
+                    destination=duplicate,
+                    status="skipped",
+                    error_message=f"Duplicate of {duplicate.name}"
+                )
+            
             # Copy the file
             copy_file(file_path, dest_file)
+            with self._copied_index_lock:
+                self._files_by_size(dest_dir).setdefault(file_size, []).append([dest_file, None])
             
             # Auto-process if enabled
             if self.auto_process and self.process_callback:
@@ -278,6 +365,25 @@ class FileScanner:
                 error_message=str(e)
             )
     
+    def copy_media_file(self, file_path: Path) -> Optional[ScanResult]:
+        """
+        Copy a single file to its data directory if it is a supported type.
+        
+        Args:
+            file_path: Path to the source file
+            
+        Returns:
+            ScanResult with operation status, or None if the file is not a
+            supported media or document file
+        """
+        file_path = Path(file_path)
+        file_type = self._detect_file_type(file_path)
+        
+        if not file_type:
+            return None
+        
+        return self._copy_media_file(file_path, file_type)
+    
     def scan_directory_for_media(self) -> List[ScanResult]:
         """
         Scan the configured directory for media files.
@@ -285,49 +391,65 @@ class FileScanner:
         Returns:
             List of ScanResult objects for each processed file
         """
-        results = []
+        return list(self.iter_directory_for_media())
+    
+    def iter_directory_for_media(self) -> Iterator[ScanResult]:
+        """
+        Scan the configured directory, yielding each result as it is copied.
         
+        Callers can act on the first file without waiting for the whole
+        directory to be copied, and no list of results is built.
+        
+        Yields:
+            ScanResult for each media file found
+        """
         # Check if scan directory exists
         if not self.scan_directory.exists():
             self.logger.warning(f"Scan directory does not exist: {self.scan_directory}")
-            return results
+            return
         
         if not self.scan_directory.is_dir():
             self.logger.warning(f"Scan path is not a directory: {self.scan_directory}")
-            return results
+            return
         
         self.logger.info(f"Scanning directory: {self.scan_directory}")
         
-        # Scan all files in directory
-        for file_path in self.scan_directory.iterdir():
-            if file_path.is_file():
-                file_type = self._detect_file_type(file_path)
+        # Scan all files in directory; DirEntry.is_file() uses the type
+        # reported by the listing, so entries are not stat'ed individually
+        with os.scandir(self.scan_directory) as it:
+            for entry in it:
+                if not entry.is_file():
+                    continue
                 
-                if file_type:
-                    result = self._copy_media_file(file_path, file_type)
-                    results.append(result)
-                    
-                    # Log the result
-                    if result.status == "copied":
-                        self.logger.info(
-                            f"Copied {file_type} file: {file_path.name} "
-                            f"({result.file_size:,} bytes) -> {result.destination}"
-                        )
-                    elif result.status == "skipped":
-                        self.logger.info(
-                            f"Skipped {file_type} file: {file_path.name} "
-                            f"({result.error_message})"
-                        )
-                    else:
-                        self.logger.error(
-                            f"Error processing {file_type} file: {file_path.name} - "
-                            f"{result.error_message}"
-                        )
+                file_path = Path(entry.path)
                 
                 # Track processed files
                 self.processed_files.add(file_path)
-        
-        return results
+                
+                file_type = self._detect_file_type(file_path)
+                if not file_type:
+                    continue
+                
+                result = self._copy_media_file(file_path, file_type)
+                
+                # Log the result
+                if result.status == "copied":
+                    self.logger.info(
+                        f"Copied {file_type} file: {file_path.name} "
+                        f"({result.file_size:,} bytes) -> {result.destination}"
+                    )
+                elif result.status == "skipped":
+                    self.logger.info(
+                        f"Skipped {file_type} file: {file_path.name} "
+                        f"({result.error_message})"
+                    )
+                else:
+                    self.logger.error(
+                        f"Error processing {file_type} file: {file_path.name} - "
+                        f"{result.error_message}"
+                    )
+                
+                yield result
     
     def watch_directory(
         self,
@@ -391,7 +513,7 @@ class FileScanner:
                 if self.scan_directory.exists() and self.scan_directory.is_dir():
                     current_files = {
                         file_path for file_path in self.scan_directory.iterdir() 
-                        if file_path.is_file()
+                        if self._detect_file_type(file_path) and file_path.is_file()
                     }
                 
                 # Find new files
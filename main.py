@@ -22,7 +22,9 @@ from datetime import datetime
 from typing import Optional, Dict, Any, Union
 
 # Add utils directory to path for progress tracker
-sys.path.insert(0, str(Path(__file__).parent / "utils"))
+_UTILS_DIR = str(Path(__file__).resolve().parent / "utils")
+if _UTILS_DIR not in sys.path:
+    sys.path.insert(0, _UTILS_DIR)
 
 from core.media_preprocessor import (prepare_audio, MediaPreprocessorError, 
                                       is_youtube_url, is_youtube_playlist_url, 
@@ -930,10 +932,14 @@ def _handle_scan_command(args):
             print("SCAN SUMMARY")
             print_separator()
             
-            copied_files = [r for r in results if r.status == "copied"]
-            dry_run_files = [r for r in results if r.status == "dry_run"]
-            skipped_files = [r for r in results if r.status == "skipped"]
-            error_files = [r for r in results if r.status == "error"]
+            # Group results by status in a single pass
+            by_status = {"copied": [], "dry_run": [], "skipped": [], "error": []}
+            for r in results:
+                by_status.setdefault(r.status, []).append(r)
+            copied_files = by_status["copied"]
+            dry_run_files = by_status["dry_run"]
+            skipped_files = by_status["skipped"]
+            error_files = by_status["error"]
             
             print(f"Files processed: {len(results)}")
             if args.dry_run:
@@ -1089,7 +1095,8 @@ def _handle_batch_command(args):
             print("Media-to-Knowledge Pipeline - Batch Processing")
             print_separator()
             print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            print(f"URLs file: {args.urls}")
+            if args.urls:
+                print(f"URLs file: {args.urls}")
             print(f"Output directory: {args.output_dir}")
             if args.parallel > 1:
                 print(f"Parallel processing: {args.parallel} workers")
@@ -1097,15 +1104,19 @@ def _handle_batch_command(args):
                 print(f"Markdown output directory: {args.markdown}")
             print_separator()
         
-        # Validate URLs file exists
-        urls_file = Path(args.urls)
-        if not urls_file.exists():
-            print(f"Error: URLs file not found: {args.urls}", file=sys.stderr)
-            sys.exit(1)
-        
-        # Read URLs from file
-        with open(urls_file, 'r') as f:
-            urls = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+        # Callers that already hold the URLs (e.g. an extracted playlist) pass
+        # them directly; otherwise read them from the URLs file
+        urls = getattr(args, "url_list", None)
+        if urls is None:
+            # Validate URLs file exists
+            urls_file = Path(args.urls)
+            if not urls_file.exists():
+                print(f"Error: URLs file not found: {args.urls}", file=sys.stderr)
+                sys.exit(1)
+            
+            # Read URLs from file
+            with open(urls_file, 'r') as f:
+                urls = [line.strip() for line in f if line.strip() and not line.startswith('#')]
         
         # Expand playlist URLs and filter for valid YouTube URLs
         expanded_urls = []
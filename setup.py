@@ -40,6 +40,13 @@ setup(
             "pytest>=7.4.0",
             "pytest-mock>=3.11.0",
         ],
+        "interactive": [
+            "questionary>=2.0.0",
+        ],
+        "speedups": [
+            "orjson>=3.9.0",
+            "speedcopy>=2.1.0; sys_platform == 'win32'",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -0,0 +1,15 @@
+"""
+Project root bootstrap for Media Knowledge Pipeline
+
+Puts the repository root on ``sys.path`` so the top-level ``core``,
+``utils`` and ``main`` modules can be imported from the CLI package.
+The root is resolved once at import time and only inserted if missing.
+"""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
@@ -18,9 +18,8 @@ except ImportError:
     print("pip install typer rich")
     sys.exit(1)
 
-# Add project root to path for imports
-project_root = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(project_root))
+# Imported for its side effect of putting the project root on sys.path
+from .. import _bootstrap  # noqa: F401
 
 from .commands import process, batch, playlist, scan, watch, document, anki
 
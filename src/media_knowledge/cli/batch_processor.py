@@ -3,30 +3,72 @@ Batch Processor for Media Knowledge Pipeline CLI
 This module handles the core batch processing logic that can be used by both CLI commands and wizards.
 """
 
-import sys
 import re
+import itertools
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, Optional, Dict, Tuple
 from urllib.parse import urlparse
 
-# Add project root to path for imports
-project_root = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(project_root))
+# Imported for its side effect of putting the project root on sys.path
+from .. import _bootstrap  # noqa: F401
+
+# YouTube hosts accepted by the batch processor. The matcher below is
+# generated from these at import time so the host strings are baked into
+# its bytecode as constants instead of being looked up on every call.
+_YOUTUBE_HOST = "youtube.com"
+_YOUTU_BE_HOST = "youtu.be"
+
+_YOUTUBE_MATCHER_SOURCE = f"""
+def _match_youtube(url, _parse=urlparse):
+    try:
+        parsed = _parse(url)
+    except Exception:
+        return False
+    netloc = parsed.netloc
+    if not (parsed.scheme and netloc):
+        return False
+    if {_YOUTUBE_HOST!r} in netloc:
+        path = parsed.path
+        return "watch" in path or "embed" in path or "v" in parsed.query
+    if {_YOUTU_BE_HOST!r} in netloc:
+        return len(parsed.path) > 1
+    return False
+"""
+
+_matcher_namespace = {"urlparse": urlparse}
+exec(_YOUTUBE_MATCHER_SOURCE, _matcher_namespace)
+_match_youtube = _matcher_namespace["_match_youtube"]
+del _matcher_namespace
+
+
+# One match per non-blank, non-comment line, captured without surrounding
+# whitespace, so URLs files are split and trimmed by the regex engine
+_URL_LINE_RE = re.compile(r"^[^\S\n]*([^#\s][^\n]*?)[^\S\n]*$", re.MULTILINE)
+
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time as an ISO 8601 string with a Z suffix."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
 class BatchProcessorError(Exception):
     """Custom exception for batch processor errors."""
-    pass
+    __slots__ = ()
 
 
 class BatchProcessor:
     """Handles batch processing of YouTube URLs with advanced features."""
     
+    __slots__ = ("valid_urls", "invalid_urls", "processed_count", "_counter", "_timestamp")
+    
     def __init__(self):
         """Initialize batch processor."""
         self.valid_urls = []
         self.invalid_urls = []
         self.processed_count = 0
+        self._counter = itertools.count(1)
+        self._timestamp = None
         
     def parse_urls_file(self, urls_file_path: str) -> Tuple[List[str], List[str]]:
         """Parse URLs from file, separating valid from invalid.
@@ -49,27 +91,29 @@ class BatchProcessor:
             
             # Read file content
             with open(urls_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+                content = f.read()
             
             # Check if file is empty
-            if not lines:
+            if not content:
                 raise BatchProcessorError(f"URLs file is empty: {urls_file_path}")
             
-            # Parse URLs
+            # Parse URLs; empty lines and comments never match
             valid_urls = []
             invalid_urls = []
+            line_num = 1
+            pos = 0
+            is_valid = self._is_valid_youtube_url
             
-            for line_num, line in enumerate(lines, 1):
-                line = line.strip()
-                
-                # Skip empty lines and comments
-                if not line or line.startswith('#'):
-                    continue
+            for match in _URL_LINE_RE.finditer(content):
+                line = match.group(1)
                 
                 # Validate URL
-                if self._is_valid_youtube_url(line):
+                if is_valid(line):
                     valid_urls.append(line)
                 else:
+                    # Line numbers are only needed for invalid entries
+                    line_num += content.count("\n", pos, match.start())
+                    pos = match.start()
                     invalid_urls.append((line_num, line))
             
             self.valid_urls = valid_urls
@@ -91,24 +135,7 @@ class BatchProcessor:
         Returns:
             bool: True if valid YouTube URL, False otherwise
         """
-        try:
-            parsed = urlparse(url)
-            if not all([parsed.scheme, parsed.netloc]):
-                return False
-            
-            # Check if it's a YouTube domain
-            if "youtube.com" not in parsed.netloc and "youtu.be" not in parsed.netloc:
-                return False
-            
-            # Check if it has the required path components for YouTube
-            if "youtube.com" in parsed.netloc:
-                return "watch" in parsed.path or "embed" in parsed.path or "v" in parsed.query
-            elif "youtu.be" in parsed.netloc:
-                return len(parsed.path) > 1  # Should have a video ID
-            
-            return True
-        except Exception:
-            return False
+        return _match_youtube(url)
     
     def filter_valid_urls(self, urls: List[str]) -> List[str]:
         """Filter list to only include valid YouTube URLs.
@@ -170,13 +197,14 @@ class BatchProcessor:
         """
         # In a full implementation, this would call the actual processing functions
         # For now, we'll simulate the processing
-        self.processed_count += 1
+        count = next(self._counter)
+        self.processed_count = count
         
         return {
             "url": url,
             "status": "processed",
-            "result_id": f"result_{self.processed_count}",
-            "timestamp": "2026-02-08T14:30:00Z"
+            "result_id": f"result_{count}",
+            "timestamp": self._timestamp or _utc_timestamp()
         }
     
     def process_batch(self, urls: List[str], parallel_workers: int = 1, options: Dict = None) -> Dict:
@@ -196,6 +224,9 @@ class BatchProcessor:
         # Setup parallel processing
         self.setup_parallel_processing(parallel_workers)
         
+        # Stamp every result in this batch with the batch start time
+        self._timestamp = _utc_timestamp()
+        
         # Process URLs
         results = []
         failed_urls = []
@@ -207,6 +238,8 @@ class BatchProcessor:
             except Exception as e:
                 failed_urls.append({"url": url, "error": str(e)})
         
+        self._timestamp = None
+        
         return {
             "status": "completed",
             "total_processed": len(results),
@@ -3,13 +3,13 @@ Anki Command for Media Knowledge Pipeline CLI
 
 Generate Anki flashcards from pipeline synthesis output.
 """
-import sys
+import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-# Add project root to path for imports
-project_root = Path(__file__).parent.parent.parent.parent.parent
-sys.path.insert(0, str(project_root))
+# Imported for its side effect of putting the project root on sys.path
+from ... import _bootstrap  # noqa: F401
 
 try:
     import typer
@@ -18,7 +18,6 @@ try:
     from rich.table import Table
 except ImportError:
     print("Required packages not found. Please install typer and rich.")
-    import sys
     raise typer.Exit(code=1)
 
 try:
@@ -41,6 +40,73 @@ app = typer.Typer(help="Generate Anki flashcards from synthesis output")
 
 console = Console()
 
+# Front/back labels and keys shown for each flashcard type in previews
+_PREVIEW_FIELDS = {
+    "concept_definition": ("Concept", "concept", "Definition", "definition"),
+    "q_a_pair": ("Question", "question", "Answer", "answer"),
+    "event_date": ("Event", "event", "Significance", "significance"),
+    "step_in_process": ("Process", "process", "Step", "step"),
+}
+
+
+@lru_cache(maxsize=1)
+def _get_generator(deck_name: Optional[str] = None) -> "AnkiGenerator":
+    """Return a shared AnkiGenerator, rebuilt only when the deck name changes."""
+    return AnkiGenerator(deck_name) if deck_name else AnkiGenerator()
+
+
+@lru_cache(maxsize=1)
+def _get_adapter() -> "AnkiAdapter":
+    """Return a shared AnkiAdapter instance."""
+    return AnkiAdapter()
+
+
+@lru_cache(maxsize=8)
+def _transform_cached(path_str: str, mtime_ns: int) -> dict:
+    """Load a synthesis JSON file and transform it to Anki format.
+
+    The modification time is part of the cache key so edits to the file
+    invalidate the cached result.
+    """
+    with open(path_str, 'r', encoding='utf-8') as f:
+        pipeline_output = json.load(f)
+    return _get_adapter().transform(pipeline_output)
+
+
+def _load_and_transform(path: Path) -> dict:
+    """Return the Anki-formatted content for a synthesis JSON file.
+
+    Results are cached per (path, mtime) so running ``preview`` and then
+    ``generate`` on the same file only transforms it once per process.
+    """
+    return _transform_cached(str(path), path.stat().st_mtime_ns)
+
+
+def _show_preview(anki_data: dict, quiet: bool = False, limit: int = 3):
+    """Print a summary and sample cards for transformed Anki content.
+
+    Lines are collected first and written with a single ``console.print``
+    so the preview is rendered in one pass instead of once per card field.
+    """
+    cards = anki_data.get("flashcard_content", [])
+    title = anki_data.get("metadata", {}).get("source_title", "Unknown Source")
+
+    lines = [
+        f"[bold]Preview:[/bold] {title}",
+        f"Flashcards: {len(cards)}",
+    ]
+
+    if not quiet:
+        for i, card in enumerate(cards[:limit], 1):
+            front_label, front_key, back_label, back_key = _PREVIEW_FIELDS.get(
+                card.get("type"), _PREVIEW_FIELDS["concept_definition"]
+            )
+            lines.append(f"\nCard {i} ({card.get('type', 'concept_definition')}):")
+            lines.append(f"  {front_label}: {str(card.get(front_key, ''))[:80]}")
+            lines.append(f"  {back_label}: {str(card.get(back_key, ''))[:80]}")
+
+    console.print("\n".join(lines))
+
 
 @app.command()
 def generate(
@@ -88,36 +154,20 @@ def generate(
         raise typer.Exit(code=1)
     
     try:
-        # Import the generator (ensure it's fresh from the root path)
-        from core.anki_generator import AnkiGenerator, AnkiGeneratorError
-        generator = AnkiGenerator()
-        
         if preview:
-            # Preview mode - preview without generating
+            # Preview mode - show transformed cards without generating a deck
             with Progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
                 transient=True,
             ) as progress:
                 progress.add_task("Previewing flashcards...", total=None)
-                
-                preview_data = generator.preview_deck_from_json(str(input_path))
-                
-                if preview_data["status"] == "success":
-                    console.print("[green]✓[/green] Preview successful")
-                    console.print(f"Generated {preview_data['flashcard_count']} flashcards")
-                    
-                    if not quiet:
-                        # Show sample flashcards
-                        console.print("\n[bold]Sample Flashcards:[/bold]")
-                        for i, card in enumerate(preview_data['sample_cards'][:3], 1):
-                            console.print(f"\nCard {i}:")
-                            console.print(f"  Front: {card['front'][:80]}...")
-                            console.print(f"  Back: {card['back'][:80]}...")
-                else:
-                    console.print(f"[red]✗[/red] Preview failed: {preview_data['error']}")
-                    raise typer.Exit(code=1)
+                anki_data = _load_and_transform(input_path)
+
+            _show_preview(anki_data, quiet)
         else:
+            generator = _get_generator(deck_name)
+
             # Generate mode - create actual .apkg file
             with Progress(
                 SpinnerColumn(),
@@ -134,10 +184,10 @@ def generate(
                     output_dir = input_path.parent
                 
                 # Generate deck
+                anki_data = _load_and_transform(input_path)
                 output_path = generator.generate_deck_from_json(
-                    str(input_path), 
+                    anki_data,
                     str(output_dir / f"{input_path.stem}.apkg"),
-                    deck_name
                 )
                 
                 console.print(f"[green]✓[/green] Anki deck generated successfully")
@@ -148,13 +198,30 @@ def generate(
         raise typer.Exit(code=1)
 
 
+@app.command()
+def preview(
+    input_path: Path = typer.Option(
+        ..., "--input", "-i", help="Path to synthesis JSON file"
+    ),
+    quiet: bool = typer.Option(
+        False, "--quiet", "-q", help="Suppress detailed output"
+    )
+):
+    """Preview flashcards from synthesis output without generating a deck."""
+    generate(
+        input_path=input_path,
+        output=None,
+        deck_name=None,
+        preview=True,
+        quiet=quiet,
+    )
+
+
 @app.command()
 def templates():
     """Show available Anki flashcard templates."""
     try:
-        # Import the generator
-        from core.anki_generator import AnkiGenerator
-        generator = AnkiGenerator()
+        generator = _get_generator()
         
         templates = generator.get_available_templates()
         
@@ -3,9 +3,8 @@
 Batch Command for Media Knowledge Pipeline CLI
 """
 
-import sys
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 try:
     import typer
@@ -16,9 +15,8 @@ except ImportError:
     print("Required packages not found. Please install typer and rich.")
     raise typer.Exit(code=1)
 
-# Add project root to path for imports
-project_root = Path(__file__).parent.parent.parent.parent.parent
-sys.path.insert(0, str(project_root))
+# Imported for its side effect of putting the project root on sys.path
+from ... import _bootstrap  # noqa: F401
 
 app = typer.Typer(help="Process multiple YouTube URLs from file")
 
@@ -38,11 +36,55 @@ def process_urls(
     folder_name: Optional[str] = typer.Option(None, "--folder-name", help="Custom name for batch folder"),
 ):
     """Process multiple YouTube URLs from a file with enhanced features."""
+    try:
+        # Read URLs from file
+        with open(urls_file, 'r') as f:
+            urls = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+    except FileNotFoundError:
+        Console().print(f"[red]✗[/red] URLs file not found: {urls_file}")
+        raise typer.Exit(code=1)
+    
+    process_url_list(
+        urls,
+        output_dir=output_dir,
+        cloud=cloud,
+        prompt=prompt,
+        markdown=markdown,
+        quiet=quiet,
+        parallel=parallel,
+        essay=essay,
+        force_essay=force_essay,
+        organize=organize,
+        folder_name=folder_name,
+        urls_file=urls_file,
+    )
+
+
+def process_url_list(
+    urls: List[str],
+    output_dir: Path = Path("outputs"),
+    cloud: bool = False,
+    prompt: Optional[str] = None,
+    markdown: Optional[Path] = None,
+    quiet: bool = False,
+    parallel: int = 1,
+    essay: bool = False,
+    force_essay: bool = False,
+    organize: bool = True,
+    folder_name: Optional[str] = None,
+    urls_file: Optional[Path] = None,
+):
+    """Process a list of YouTube URLs as a batch.
+
+    Shared by ``process_urls`` and callers that already hold the URLs in
+    memory, such as playlist processing, so they need not write a file.
+    """
     console = Console()
     
     if not quiet:
         console.print(f"[bold blue]Media Knowledge Pipeline - Batch Processing[/bold blue]")
-        console.print(f"URLs file: {urls_file}")
+        if urls_file:
+            console.print(f"URLs file: {urls_file}")
         console.print(f"Output directory: {output_dir}")
         if cloud:
             console.print("Using: [green]Ollama Cloud[/green]")
@@ -55,10 +97,6 @@ def process_urls(
         console.print("")
     
     try:
-        # Read URLs from file
-        with open(urls_file, 'r') as f:
-            urls = [line.strip() for line in f if line.strip() and not line.startswith('#')]
-        
         if not urls:
             console.print("[red]✗[/red] No valid URLs found in the file.")
             raise typer.Exit(code=1)
@@ -70,14 +108,13 @@ def process_urls(
             console.print("")
         
         # Import the main pipeline batch function
-        sys.path.insert(0, str(project_root))
         from main import _handle_batch_command
-        import argparse
         
         # Create args object to mimic command line arguments
         class BatchArgs:
             def __init__(self):
-                self.urls = str(urls_file)
+                self.urls = str(urls_file) if urls_file else None
+                self.url_list = urls
                 self.output_dir = str(output_dir)
                 self.cloud = cloud
                 self.prompt = prompt
@@ -113,9 +150,6 @@ def process_urls(
         if not quiet:
             console.print("[green]✓[/green] Batch processing completed!")
             
-    except FileNotFoundError:
-        console.print(f"[red]✗[/red] URLs file not found: {urls_file}")
-        raise typer.Exit(code=1)
     except Exception as e:
         console.print(f"[red]✗[/red] Error during batch processing: {str(e)}")
         raise typer.Exit(code=1)
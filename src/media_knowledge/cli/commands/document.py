@@ -4,16 +4,36 @@ CLI Commands for Document Processing
 Handles processing of documents (PDF, EPUB, MOBI) for knowledge synthesis.
 """
 
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Callable, List, Optional, Tuple
+import asyncio
+import fnmatch
+import hashlib
 import json
+import os
+import re
+import tempfile
+import textwrap
+import threading
 
 import typer
 from rich.console import Console
 from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.progress import (
+    BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn,
+    TimeElapsedColumn, TimeRemainingColumn,
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-# Import core modules dynamically within functions to avoid module not found errors
+# Add project root to path; core modules are imported within functions to
+# keep CLI startup light
+from ... import _bootstrap  # noqa: F401
 
 app = typer.Typer(
     name="document", 
@@ -22,6 +42,318 @@ app = typer.Typer(
 
 console = Console()
 
+# Mirrors DocumentReaderFactory.supported_formats() so listing formats does
+# not import the PDF/EPUB/MOBI reader libraries
+_SUPPORTED = (".pdf", ".epub", ".mobi")
+
+# Lower-case suffixes for format checks by set lookup
+_SUPPORTED_SUFFIXES = frozenset(_SUPPORTED)
+
+# Libraries backing each supported format
+_FORMAT_LIBRARIES = {
+    "pdf": "PyMuPDF (fitz)",
+    "epub": "ebooklib",
+    "mobi": "mobi"
+}
+
+# Document extraction is CPU-bound; gains flatten out beyond a few workers
+_DEFAULT_WORKERS = min(os.cpu_count() or 1, 4)
+
+# Cloud synthesis is network-bound, so many more documents can be in flight
+_DEFAULT_CONCURRENCY = 20
+
+# Larger batches only report failures per file; the progress bar covers the rest
+_PER_FILE_OUTPUT_LIMIT = 20
+
+# Successful results are cached here keyed by document content and settings
+_RESULT_CACHE_DIR = Path.home() / ".cache" / "media_knowledge" / "doc_results"
+
+# DocumentProcessor instances reused for the life of this process (one per
+# batch worker), keyed by the cloud setting
+_PROCESSORS = {}
+
+# Cloud batches call _get_processor from many threads at once
+_PROCESSORS_LOCK = threading.Lock()
+
+
+def _get_processor(cloud: bool):
+    """Return this process's DocumentProcessor, building it on first use.
+
+    Construction is deferred until a document actually misses the result
+    cache, so batches that are fully cached never load model state.
+    """
+    processor = _PROCESSORS.get(cloud)
+    if processor is None:
+        with _PROCESSORS_LOCK:
+            processor = _PROCESSORS.get(cloud)
+            if processor is None:
+                from core.document_processor import DocumentProcessor
+                processor = _PROCESSORS[cloud] = DocumentProcessor(use_cloud=cloud)
+    return processor
+
+
+if orjson is not None:
+    def _dumps(obj, indent: bool = False) -> str:
+        """Serialize ``obj`` to JSON text, using orjson when installed."""
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option).decode('utf-8')
+    
+    _loads = orjson.loads
+else:
+    def _dumps(obj, indent: bool = False) -> str:
+        """Serialize ``obj`` to JSON text, using orjson when installed."""
+        return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)
+    
+    _loads = json.loads
+
+
+def _file_fingerprint(file_path: Path) -> str:
+    """Return a BLAKE2b digest of the file contents, read in 1 MiB chunks."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _cached_process(file_path: Path, prompt_template: Optional[str],
+                    custom_prompt: Optional[str], cloud: bool,
+                    force_refresh: bool = False,
+                    fingerprint: Optional[str] = None) -> dict:
+    """Process a document, reusing a cached result for unchanged content.
+
+    The cache key combines the content fingerprint with the synthesis
+    settings, so editing the file or changing the prompt forces a rerun.
+    Only successful results are cached, and cache I/O failures fall back
+    to processing normally. Callers that already hashed the file can pass
+    its ``fingerprint`` to avoid reading it again.
+    """
+    key = f"{fingerprint or _file_fingerprint(file_path)}:{prompt_template or ''}:{custom_prompt or ''}:{cloud}"
+    cache_file = _RESULT_CACHE_DIR / f"{hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()}.json"
+    
+    if not force_refresh:
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                result = _loads(f.read())
+            # The same content may live under a different name
+            result["original_file"] = str(file_path)
+            return result
+        except (OSError, ValueError):
+            pass
+    
+    result = _get_processor(cloud).process_document(
+        file_path=file_path,
+        prompt_template=prompt_template,
+        custom_prompt=custom_prompt
+    )
+    
+    if result.get("status") == "success":
+        try:
+            _RESULT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=_RESULT_CACHE_DIR, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(_dumps(result))
+                os.replace(tmp_path, cache_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            pass
+    
+    return result
+
+
+@lru_cache(maxsize=32)
+def _name_matcher(pattern: str) -> Callable[[str], bool]:
+    """Return a predicate matching file names against a glob ``pattern``.
+
+    The pattern is translated to a regex once and reused across calls.
+    The default ``*.*`` only requires a dot in the name, so it skips the
+    regex entirely.
+    """
+    if pattern == "*.*":
+        return lambda name: "." in name
+    flags = 0 if os.path.normcase("A") == "A" else re.IGNORECASE
+    return re.compile(fnmatch.translate(pattern), flags).match
+
+
+def _discover_documents(directory: Path, pattern: str,
+                        supported_suffixes: frozenset) -> Tuple[List[Path], List[str]]:
+    """Find files matching ``pattern`` and split them by format support.
+
+    Flat patterns are matched in one ``os.scandir`` pass, so each entry is
+    checked with a precompiled name match and a suffix set lookup and no
+    extra stat call. Patterns that span directories fall back to ``Path.glob``.
+
+    Returns:
+        Tuple of (supported file paths, unsupported file names)
+    """
+    supported_files = []
+    unsupported_files = []
+    
+    if os.sep in pattern or "/" in pattern or "**" in pattern:
+        candidates = ((p, p.name) for p in directory.glob(pattern) if p.is_file())
+    else:
+        matches = _name_matcher(pattern)
+        with os.scandir(directory) as it:
+            candidates = [
+                (Path(entry.path), entry.name) for entry in it
+                if matches(entry.name) and entry.is_file()
+            ]
+    
+    for file_path, name in candidates:
+        if os.path.splitext(name)[1].lower() in supported_suffixes:
+            supported_files.append(file_path)
+        else:
+            unsupported_files.append(name)
+    
+    return supported_files, unsupported_files
+
+
+def _resume_key(file_path: Path) -> str:
+    """Identify a document for batch resume by path, size and mtime."""
+    st = file_path.stat()
+    return f"{file_path.resolve()}:{st.st_size}:{st.st_mtime_ns}"
+
+
+class _BatchResultWriter:
+    """Persist batch results as they complete and assemble the final JSON.
+
+    Each result is appended to ``<output>.partial.ndjson`` and flushed, so
+    an interrupted batch loses at most the documents in flight. A rerun
+    with the same settings picks the partial file back up and exposes the
+    documents it already holds through ``completed``. ``close`` streams the
+    partial results into the final JSON document and removes the partial
+    file.
+    """
+    
+    def __init__(self, path: Path, header: dict, settings: dict, resume: bool = True):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._path = path
+        self._partial = path.with_suffix(".partial.ndjson")
+        self._header = header
+        # Resume key -> (status, extracted characters) of finished documents
+        self.completed = {}
+        
+        if resume and self._load_partial(settings):
+            self._fh = open(self._partial, 'a', encoding='utf-8')
+            if self._truncated:
+                # Keep the next record off the line cut short by the interruption
+                self._fh.write("\n")
+        else:
+            self._fh = open(self._partial, 'w', encoding='utf-8')
+            self._fh.write(_dumps({"settings": settings}) + "\n")
+            self._fh.flush()
+    
+    def _load_partial(self, settings: dict) -> bool:
+        """Read finished documents from an earlier run with the same settings."""
+        self._truncated = False
+        try:
+            with open(self._partial, 'r', encoding='utf-8') as f:
+                if _loads(f.readline()).get("settings") != settings:
+                    return False
+                for line in f:
+                    self._truncated = not line.endswith("\n")
+                    try:
+                        record = _loads(line)
+                    except ValueError:
+                        # A line cut short by the interruption
+                        continue
+                    result = record["result"]
+                    self.completed[record["key"]] = (
+                        result.get("status"),
+                        result.get('processing_stats', {}).get('extracted_characters', 0),
+                    )
+        except (OSError, ValueError, KeyError, AttributeError):
+            self.completed = {}
+            return False
+        return True
+    
+    def write(self, key: str, result: dict):
+        """Append a single result and flush it to disk."""
+        self._fh.write(_dumps({"key": key, "result": result}) + "\n")
+        self._fh.flush()
+    
+    def close(self, summary: dict):
+        """Write the final JSON from the partial results and remove the latter."""
+        self._fh.close()
+        
+        fd, tmp_path = tempfile.mkstemp(dir=self._path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8', buffering=1 << 20) as out, \
+                    open(self._partial, 'r', encoding='utf-8') as partial:
+                out.write("{")
+                for key, value in self._header.items():
+                    out.write(f"\n  {json.dumps(key)}: {_dumps(value)},")
+                out.write('\n  "results": [')
+                empty = True
+                next(partial)  # settings line
+                for line in partial:
+                    try:
+                        result = _loads(line)["result"]
+                    except ValueError:
+                        continue
+                    out.write("\n" if empty else ",\n")
+                    out.write(textwrap.indent(_dumps(result, indent=True), "    "))
+                    empty = False
+                out.write("]" if empty else "\n  ]")
+                for key, value in summary.items():
+                    out.write(f",\n  {json.dumps(key)}: {_dumps(value)}")
+                out.write("\n}\n")
+            os.replace(tmp_path, self._path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        os.unlink(self._partial)
+    
+    def abort(self):
+        """Stop writing, keeping the partial results for a later resume."""
+        self._fh.close()
+
+
+def _process_one(file_path: Path, prompt_template: Optional[str],
+                 custom_prompt: Optional[str], cloud: bool,
+                 force_refresh: bool = False,
+                 fingerprint: Optional[str] = None) -> dict:
+    """Process a single document in a batch worker process.
+
+    Each worker builds its own DocumentProcessor since the processor holds
+    handles that cannot be pickled across process boundaries, and then
+    reuses it for every file it is handed.
+    """
+    return _cached_process(file_path, prompt_template, custom_prompt, cloud, force_refresh, fingerprint)
+
+
+async def _run_cloud_batch(files: List[Tuple[Path, Optional[str]]],
+                           prompt_template: Optional[str],
+                           custom_prompt: Optional[str], force_refresh: bool,
+                           concurrency: int,
+                           on_result: Callable[[Path, object], None]):
+    """Process documents with cloud synthesis, ``concurrency`` at a time.
+
+    Each document runs in a thread of the loop's default executor, whose
+    size bounds how many remote calls are in flight. ``files`` holds
+    (path, fingerprint) pairs, and ``on_result`` is called with the path
+    and either its result or the exception it raised, in completion order.
+    """
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=concurrency)
+    )
+    
+    async def one(file_path: Path, fingerprint: Optional[str]):
+        try:
+            result = await asyncio.to_thread(
+                _cached_process, file_path, prompt_template, custom_prompt, True,
+                force_refresh, fingerprint
+            )
+        except Exception as e:
+            result = e
+        return file_path, result
+    
+    for next_done in asyncio.as_completed([one(f, fp) for f, fp in files]):
+        on_result(*(await next_done))
+
 
 @app.command()
 def process(
@@ -30,18 +362,12 @@ def process(
     custom_prompt: Optional[str] = typer.Option(None, "--custom-prompt", "-c", help="Custom prompt text"),
     output: Optional[Path] = typer.Option(None, "--output", "-o", help="Output JSON file for results"),
     cloud: bool = typer.Option(False, "--cloud", help="Use cloud models for synthesis"),
+    force_refresh: bool = typer.Option(False, "--force-refresh", help="Ignore cached results and reprocess"),
     quiet: bool = typer.Option(False, "--quiet", "-q", help="Suppress detailed output")
 ):
     """Process a single document file."""
     
     # Import core modules dynamically
-    import sys
-    from pathlib import Path
-    project_root = Path(__file__).parent.parent.parent.parent.parent
-    sys.path.insert(0, str(project_root))
-    
-    from core.document_processor import DocumentProcessor
-    from core.document_readers import DocumentReaderFactory
     
     if not quiet:
         console.print(f"[bold blue]Media Knowledge Pipeline - Document Processor[/bold blue]")
@@ -59,10 +385,9 @@ def process(
         raise typer.Exit(code=1)
     
     # Check if format is supported
-    if not DocumentReaderFactory.is_format_supported(file_path):
-        supported_formats = DocumentReaderFactory.supported_formats()
+    if file_path.suffix.lower() not in _SUPPORTED_SUFFIXES:
         console.print(f"[red]✗[/red] Unsupported document format: {file_path.suffix}")
-        console.print(f"Supported formats: {', '.join(supported_formats)}")
+        console.print(f"Supported formats: {', '.join(ext.lstrip('.') for ext in _SUPPORTED)}")
         raise typer.Exit(code=1)
     
     # Process the document
@@ -75,12 +400,7 @@ def process(
         progress.add_task("Processing document...", total=None)
         
         try:
-            processor = DocumentProcessor(use_cloud=cloud)
-            result = processor.process_document(
-                file_path=file_path,
-                prompt_template=prompt_template,
-                custom_prompt=custom_prompt
-            )
+            result = _cached_process(file_path, prompt_template, custom_prompt, cloud, force_refresh)
             
         except Exception as e:
             console.print(f"[red]✗[/red] Error processing document: {e}")
@@ -115,7 +435,7 @@ def process(
             try:
                 output.parent.mkdir(parents=True, exist_ok=True)
                 with open(output, 'w', encoding='utf-8') as f:
-                    json.dump(result, f, indent=2, ensure_ascii=False)
+                    f.write(_dumps(result, indent=True))
                 console.print(f"[green]✓[/green] Results saved to: {output}")
             except Exception as e:
                 console.print(f"[yellow]⚠[/yellow] Failed to save results: {e}")
@@ -133,23 +453,22 @@ def batch(
     custom_prompt: Optional[str] = typer.Option(None, "--custom-prompt", "-c", help="Custom prompt text"),
     output: Optional[Path] = typer.Option(None, "--output", "-o", help="Output JSON file for batch results"),
     cloud: bool = typer.Option(False, "--cloud", help="Use cloud models for synthesis"),
+    workers: int = typer.Option(_DEFAULT_WORKERS, "--workers", "-w", min=1, help="Number of parallel worker processes"),
+    concurrency: int = typer.Option(_DEFAULT_CONCURRENCY, "--concurrency", min=1, help="Documents in flight at once with --cloud"),
+    force_refresh: bool = typer.Option(False, "--force-refresh", help="Ignore cached results and reprocess"),
     quiet: bool = typer.Option(False, "--quiet", "-q", help="Suppress detailed output")
 ):
     """Process multiple documents in batch."""
     
-    # Import core modules dynamically
-    import sys
-    from pathlib import Path
-    project_root = Path(__file__).parent.parent.parent.parent.parent
-    sys.path.insert(0, str(project_root))
-    from core.document_processor import DocumentProcessor
-    from core.document_readers import DocumentReaderFactory
-    
     if not quiet:
         console.print(f"[bold blue]Media Knowledge Pipeline - Batch Document Processor[/bold blue]")
         console.print(f"Directory: {directory}")
         console.print(f"Pattern: {pattern}")
         console.print(f"Using cloud models: {'Yes' if cloud else 'No'}")
+        if cloud:
+            console.print(f"Concurrency: {concurrency}")
+        else:
+            console.print(f"Workers: {workers}")
         console.print("")
     
     # Check if directory exists
@@ -157,23 +476,14 @@ def batch(
         console.print(f"[red]✗[/red] Directory not found: {directory}")
         raise typer.Exit(code=1)
     
-    # Find matching files
-    file_paths = list(directory.glob(pattern))
+    # Find matching files and split them by format in a single pass
+    supported_files, unsupported_files = _discover_documents(directory, pattern, _SUPPORTED_SUFFIXES)
+    total_files = len(supported_files) + len(unsupported_files)
     
-    if not file_paths:
+    if not total_files:
         console.print(f"[yellow]⚠[/yellow] No files found matching pattern: {pattern}")
         raise typer.Exit(code=1)
     
-    # Filter supported formats
-    supported_files = []
-    unsupported_files = []
-    
-    for file_path in file_paths:
-        if DocumentReaderFactory.is_format_supported(file_path):
-            supported_files.append(file_path)
-        else:
-            unsupported_files.append(file_path.name)
-    
     if not supported_files:
         console.print(f"[red]✗[/red] No supported document files found")
         if unsupported_files:
@@ -186,69 +496,159 @@ def batch(
             console.print(f"Skipping {len(unsupported_files)} unsupported files")
         console.print("")
     
-    # Process documents
-    results = []
-    processor = DocumentProcessor(use_cloud=cloud)
+    # Open the output up front so results are persisted as they complete,
+    # and pick up where an interrupted run with the same settings left off
+    successful = failed = total_chars = 0
+    pending = supported_files
+    resume_keys = {}
+    writer = None
+    if output:
+        try:
+            writer = _BatchResultWriter(output, {
+                "directory": str(directory),
+                "pattern": pattern,
+                "total_files": total_files,
+                "supported_files": len(supported_files),
+                "unsupported_files": len(unsupported_files),
+            }, {
+                "directory": str(directory.resolve()),
+                "pattern": pattern,
+                "prompt_template": prompt_template,
+                "custom_prompt": custom_prompt,
+                "cloud": cloud,
+            }, resume=not force_refresh)
+            resume_keys = {file_path: _resume_key(file_path) for file_path in supported_files}
+        except Exception as e:
+            console.print(f"[yellow]⚠[/yellow] Failed to save batch results: {e}")
+            if writer:
+                writer.abort()
+                writer = None
     
-    for file_path in supported_files:
+    if writer and writer.completed:
+        pending = []
+        for file_path in supported_files:
+            done = writer.completed.get(resume_keys[file_path])
+            if done is None:
+                pending.append(file_path)
+            elif done[0] == "success":
+                successful += 1
+                total_chars += done[1]
+            elif done[0] == "error":
+                failed += 1
         if not quiet:
-            console.print(f"Processing: {file_path.name}")
-        
-        try:
-            result = processor.process_document(
-                file_path=file_path,
-                prompt_template=prompt_template,
-                custom_prompt=custom_prompt
-            )
-            results.append(result)
-            
-            if result["status"] == "success":
-                if not quiet:
-                    console.print(f"  [green]✓[/green] Success")
-            else:
-                if not quiet:
-                    console.print(f"  [red]✗[/red] Failed: {result.get('error', 'Unknown error')}")
+            console.print(f"Resuming: {len(supported_files) - len(pending)} document(s) already processed")
+    
+    # Process documents in parallel; a failure in one file never aborts the batch
+    show_each = not quiet and len(pending) <= _PER_FILE_OUTPUT_LIMIT
+    
+    def record(file_path: Path, result):
+        nonlocal successful, failed, total_chars, writer
+        progress.advance(task)
         
-        except Exception as e:
-            console.print(f"  [red]✗[/red] Error: {e}")
-            results.append({
+        if isinstance(result, Exception):
+            console.print(f"[red]✗[/red] {file_path.name}: {result}")
+            failed += 1
+            result = {
                 "status": "error",
                 "original_file": str(file_path),
-                "error": str(e)
-            })
+                "error": str(result)
+            }
+        elif result["status"] == "success":
+            successful += 1
+            total_chars += result.get('processing_stats', {}).get('extracted_characters', 0)
+            if show_each:
+                console.print(f"[green]✓[/green] {file_path.name}")
+        else:
+            if result["status"] == "error":
+                failed += 1
+            if not quiet:
+                console.print(f"[red]✗[/red] {file_path.name}: {result.get('error', 'Unknown error')}")
+        
+        if writer:
+            try:
+                writer.write(resume_keys[file_path], result)
+            except Exception as e:
+                console.print(f"[yellow]⚠[/yellow] Failed to save batch results: {e}")
+                writer.abort()
+                writer = None
     
-    # Generate batch summary
-    successful = [r for r in results if r["status"] == "success"]
-    failed = [r for r in results if r["status"] == "error"]
+    # Byte-identical documents (e.g. the same PDF under two names) are
+    # processed once and the result is reported for every copy
+    groups = {}
+    for file_path in pending:
+        try:
+            fingerprint = _file_fingerprint(file_path)
+        except OSError:
+            # Unreadable: let processing report the error for this file alone
+            groups[file_path] = (None, [file_path])
+            continue
+        groups.setdefault(fingerprint, (fingerprint, []))[1].append(file_path)
+    jobs = [(paths[0], fingerprint) for fingerprint, paths in groups.values()]
+    duplicates = {paths[0]: paths[1:] for _, paths in groups.values() if len(paths) > 1}
+    
+    if duplicates and not quiet:
+        console.print(f"Reusing results for {len(pending) - len(jobs)} duplicate document(s)")
+    
+    def record_all(file_path: Path, result):
+        record(file_path, result)
+        for duplicate in duplicates.get(file_path, ()):
+            if isinstance(result, dict):
+                result = {**result, "original_file": str(duplicate)}
+            record(duplicate, result)
+    
+    with Progress(
+        TextColumn("[bold]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TimeElapsedColumn(),
+        TimeRemainingColumn(),
+        console=console,
+        refresh_per_second=4,
+        disable=quiet,
+    ) as progress:
+        task = progress.add_task("Processing", total=len(pending))
+        
+        if jobs and cloud:
+            # Remote synthesis is I/O-bound: overlap requests in threads rather
+            # than paying for a process per document
+            asyncio.run(_run_cloud_batch(
+                jobs, prompt_template, custom_prompt, force_refresh,
+                min(concurrency, len(jobs)), record_all
+            ))
+        elif jobs:
+            with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+                futures = {
+                    executor.submit(
+                        _process_one, file_path, prompt_template, custom_prompt, cloud,
+                        force_refresh, fingerprint
+                    ): file_path
+                    for file_path, fingerprint in jobs
+                }
+                
+                for future in as_completed(futures):
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = e
+                    record_all(futures[future], result)
     
     if not quiet:
         console.print(f"\n[bold]Batch Processing Complete[/bold]")
-        console.print(f"Successful: {len(successful)} documents")
-        console.print(f"Failed: {len(failed)} documents")
+        console.print(f"Successful: {successful} documents")
+        console.print(f"Failed: {failed} documents")
         
         if successful:
             # Display overall stats
-            total_chars = sum(r.get('processing_stats', {}).get('extracted_characters', 0) 
-                            for r in successful)
             console.print(f"Total characters extracted: {total_chars:,}")
     
-    # Save results if requested
-    if output:
+    # Finish the results file with the batch summary
+    if writer:
         try:
-            output.parent.mkdir(parents=True, exist_ok=True)
-            with open(output, 'w', encoding='utf-8') as f:
-                batch_result = {
-                    "status": "complete",
-                    "directory": str(directory),
-                    "pattern": pattern,
-                    "total_files": len(file_paths),
-                    "supported_files": len(supported_files),
-                    "unsupported_files": len(unsupported_files),
-                    "successful": len(successful),
-                    "failed": len(failed),
-                    "results": results
-                }
-                json.dump(batch_result, f, indent=2, ensure_ascii=False)
+            writer.close({
+                "successful": successful,
+                "failed": failed,
+                "status": "complete",
+            })
             console.print(f"[green]✓[/green] Batch results saved to: {output}")
         except Exception as e:
             console.print(f"[yellow]⚠[/yellow] Failed to save batch results: {e}")
@@ -257,15 +657,6 @@ def batch(
 @app.command()
 def formats():
     """Show supported document formats."""
-    # Import dynamically
-    import sys
-    from pathlib import Path
-    project_root = Path(__file__).parent.parent.parent.parent.parent
-    sys.path.insert(0, str(project_root))
-    from core.document_readers import DocumentReaderFactory
-    
-    supported_formats = DocumentReaderFactory.supported_formats()
-    
     console.print(f"[bold blue]Supported Document Formats[/bold blue]")
     
     table = Table(title="Document Format Support")
@@ -273,16 +664,9 @@ def formats():
     table.add_column("Extension", style="magenta")
     table.add_column("Library", style="green")
     
-    # Map formats to library names
-    format_info = {
-        "pdf": "PyMuPDF (fitz)",
-        "epub": "ebooklib",
-        "mobi": "mobi"
-    }
-    
-    for fmt in supported_formats:
-        fmt_key = fmt.lstrip('.')
-        library = format_info.get(fmt_key, "Unknown")
-        table.add_row(fmt_key.upper(), fmt, library)
+    for ext in _SUPPORTED:
+        fmt_key = ext.lstrip('.')
+        library = _FORMAT_LIBRARIES.get(fmt_key, "Unknown")
+        table.add_row(fmt_key.upper(), ext, library)
     
-    console.print(table)
\ No newline at end of file
+    console.print(table)
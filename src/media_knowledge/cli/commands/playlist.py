@@ -3,7 +3,6 @@
 Playlist Command for Media Knowledge Pipeline CLI
 """
 
-import sys
 from pathlib import Path
 from typing import Optional
 
@@ -16,12 +15,23 @@ except ImportError:
     print("Required packages not found. Please install typer and rich.")
     raise typer.Exit(code=1)
 
-# Add project root to path for imports
-project_root = Path(__file__).parent.parent.parent.parent.parent
-sys.path.insert(0, str(project_root))
+# Imported for its side effect of putting the project root on sys.path
+from ... import _bootstrap  # noqa: F401
 
 app = typer.Typer(help="Process YouTube playlist with enhanced features")
 
+# Same checks as core.media_preprocessor.is_youtube_playlist_url
+_YOUTUBE_DOMAINS = ("youtube.com", "youtu.be", "youtube-nocookie.com")
+
+
+def _is_playlist_url(url: str) -> bool:
+    """Check for a YouTube playlist URL without importing the media preprocessor."""
+    lowered = url.lower()
+    return (
+        any(domain in lowered for domain in _YOUTUBE_DOMAINS)
+        and ("list=" in lowered or "/playlist" in lowered)
+    )
+
 
 @app.command()
 def process_playlist(
@@ -55,15 +65,14 @@ def process_playlist(
         # For now, we'll use the existing functionality but enhance it
         # Eventually we'll implement proper playlist handling with folder organization
         
-        # Import necessary modules
-        sys.path.insert(0, str(project_root))
-        from core.media_preprocessor import is_youtube_playlist_url, extract_youtube_playlist_videos
-        import yt_dlp
-        
-        if not is_youtube_playlist_url(url):
+        # Reject non-playlist URLs before loading the media preprocessor
+        if not _is_playlist_url(url):
             console.print("[red]✗[/red] Provided URL is not a YouTube playlist URL.")
             raise typer.Exit(code=1)
         
+        # Import necessary modules
+        from core.media_preprocessor import extract_youtube_playlist_videos
+        
         if not quiet:
             console.print("[blue]i[/blue] Extracting videos from playlist...")
         
@@ -76,20 +85,12 @@ def process_playlist(
             console.print(f"[red]✗[/red] Failed to extract playlist videos: {str(e)}")
             raise typer.Exit(code=1)
         
-        # Create a temporary URLs file for batch processing
-        import tempfile
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            for video_url in video_urls:
-                f.write(f"{video_url}\n")
-            temp_urls_file = f.name
-        
         # Use the batch command for processing
-        from media_knowledge.cli.commands.batch import process_urls as batch_process
-        import os
+        from media_knowledge.cli.commands.batch import process_url_list
         
-        # Process the playlist as a batch
-        batch_process(
-            urls_file=Path(temp_urls_file),
+        # Process the playlist as a batch, handing over the URLs directly
+        process_url_list(
+            video_urls,
             output_dir=output_dir,
             cloud=cloud,
             prompt=prompt,
@@ -102,9 +103,6 @@ def process_playlist(
             folder_name=folder_name or f"playlist_{Path(url).name}"
         )
         
-        # Clean up temporary file
-        os.unlink(temp_urls_file)
-        
         if not quiet:
             console.print("[green]✓[/green] Playlist processing completed!")
             
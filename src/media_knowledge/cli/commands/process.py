@@ -3,7 +3,6 @@
 Process Command for Media Knowledge Pipeline CLI
 """
 
-import sys
 from pathlib import Path
 from typing import Optional
 
@@ -14,12 +13,10 @@ try:
     from rich.table import Table
 except ImportError:
     print("Required packages not found. Please install typer and rich.")
-    import sys
     raise typer.Exit(code=1)
 
-# Add project root to path for imports
-project_root = Path(__file__).parent.parent.parent.parent.parent
-sys.path.insert(0, str(project_root))
+# Imported for its side effect of putting the project root on sys.path
+from ... import _bootstrap  # noqa: F401
 
 app = typer.Typer(help="Process single media file or YouTube URL")
 
@@ -52,7 +49,6 @@ def media(
     
     try:
         # Import the main pipeline
-        sys.path.insert(0, str(project_root))
         from main import process_media, save_results_to_file, save_synthesis_to_markdown
         
         # Process the media
@@ -3,7 +3,9 @@
 Scan Command for Media Knowledge Pipeline CLI
 """
 
-import sys
+import contextlib
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional
 
@@ -16,12 +18,43 @@ except ImportError:
     print("Required packages not found. Please install typer and rich.")
     raise typer.Exit(code=1)
 
-# Add project root to path for imports
-project_root = Path(__file__).parent.parent.parent.parent.parent
-sys.path.insert(0, str(project_root))
+# Imported for its side effect of putting the project root on sys.path
+from ... import _bootstrap  # noqa: F401
 
 app = typer.Typer(help="Scan directory for media files")
 
+# Every pipeline run loads its own Whisper model, so files are processed one
+# at a time unless more workers are asked for explicitly
+_DEFAULT_WORKERS = 1
+
+
+def _process_one(destination: str) -> str:
+    """Run a copied media file through the pipeline and save the results.
+
+    Called from a worker thread; the pipeline work is dominated by
+    transcription and LLM calls, so threads overlap well without the cost
+    of separate processes.
+
+    Returns:
+        Path of the saved JSON results.
+    """
+    from main import (
+        process_media,
+        generate_intelligent_json_filename,
+        save_results_to_file,
+        save_synthesis_to_markdown,
+    )
+
+    results = process_media(media_path=str(destination), use_cloud_synth=False)
+    if results["status"] != "success":
+        raise RuntimeError(results.get("error", "Unknown error"))
+
+    # Save the same outputs as the watch command's auto-processing
+    json_output = generate_intelligent_json_filename(results)
+    save_results_to_file(results, json_output)
+    save_synthesis_to_markdown(results, "outputs/markdown")
+    return json_output
+
 
 @app.command()
 def directory(
@@ -30,6 +63,7 @@ def directory(
     video_dir: Path = typer.Option("data/videos", "--video-dir", help="Directory for video files"),
     process_pipeline: bool = typer.Option(False, "--process", help="Automatically process copied files"),
     dry_run: bool = typer.Option(False, "--dry-run", help="Show what would happen without copying"),
+    workers: int = typer.Option(_DEFAULT_WORKERS, "--workers", "-w", min=1, help="Number of files to process in parallel (each loads its own Whisper model)"),
     quiet: bool = typer.Option(False, "--quiet", "-q", help="Suppress detailed output"),
 ):
     """Scan directory for media files and copy to appropriate directories."""
@@ -48,7 +82,6 @@ def directory(
     
     try:
         # Import the file scanner
-        sys.path.insert(0, str(project_root))
         from core.file_scanner import FileScanner
         
         # Expand user path
@@ -75,49 +108,69 @@ def directory(
             dry_run=dry_run
         )
         
-        # Scan directory
-        results = scanner.scan_directory(str(scan_dir))
+        # Tally the summary and collect files to process as the scan
+        # yields each result
+        found = audio_count = video_count = 0
+        copied = []
+        for r in scanner.iter_directory_for_media():
+            found += 1
+            if r.file_type == 'audio':
+                audio_count += 1
+            elif r.file_type == 'video':
+                video_count += 1
+            if r.status == 'copied':
+                copied.append(r)
         
         if not quiet:
             console.print(f"[green]✓[/green] Scan completed!")
-            console.print(f"  Files found: {len(results)}")
+            console.print(f"  Files found: {found}")
             
             # Show summary
-            audio_count = sum(1 for r in results if r.file_type == 'audio')
-            video_count = sum(1 for r in results if r.file_type == 'video')
-            copied_count = sum(1 for r in results if r.status == 'copied')
-            
             table = Table(title="Scan Results")
             table.add_column("Category", style="cyan")
             table.add_column("Count", style="magenta")
             
-            table.add_row("Total Files", str(len(results)))
+            table.add_row("Total Files", str(found))
             table.add_row("Audio Files", str(audio_count))
             table.add_row("Video Files", str(video_count))
             if not dry_run:
-                table.add_row("Copied Files", str(copied_count))
+                table.add_row("Copied Files", str(len(copied)))
             
             console.print(table)
         
         # Process files through pipeline if requested
-        if process_pipeline and not dry_run and results:
+        if process_pipeline and not dry_run and found:
             console.print("[blue]i[/blue] Processing copied files through pipeline...")
+            to_process = [r for r in copied if r.destination]
             processed_count = 0
             
-            for result in results:
-                if result.status == 'copied' and result.destination:
-                    try:
-                        # Process each file
-                        # This would call the process command for each file
-                        processed_count += 1
-                        if not quiet:
-                            console.print(f"  [green]✓[/green] Processed: {Path(result.destination).name}")
-                    except Exception as e:
-                        if not quiet:
-                            console.print(f"  [red]✗[/red] Failed to process: {Path(result.destination).name} - {str(e)}")
+            if to_process:
+                with contextlib.ExitStack() as stack:
+                    if quiet:
+                        # The pipeline prints its own progress; hide it along with ours
+                        devnull = stack.enter_context(open(os.devnull, "w"))
+                        stack.enter_context(contextlib.redirect_stdout(devnull))
+                    executor = stack.enter_context(
+                        ThreadPoolExecutor(max_workers=min(workers, len(to_process)))
+                    )
+                    futures = {
+                        executor.submit(_process_one, result.destination): result
+                        for result in to_process
+                    }
+                    
+                    for future in as_completed(futures):
+                        name = futures[future].destination.name
+                        try:
+                            json_output = future.result()
+                            processed_count += 1
+                            if not quiet:
+                                console.print(f"  [green]✓[/green] Processed: {name} -> {json_output}")
+                        except Exception as e:
+                            if not quiet:
+                                console.print(f"  [red]✗[/red] Failed to process: {name} - {str(e)}")
             
             if not quiet:
-                console.print(f"[green]✓[/green] Pipeline processing completed: {processed_count}/{len([r for r in results if r.status == 'copied'])} files processed")
+                console.print(f"[green]✓[/green] Pipeline processing completed: {processed_count}/{len(copied)} files processed")
         
     except Exception as e:
         console.print(f"[red]✗[/red] Error during directory scan: {str(e)}")
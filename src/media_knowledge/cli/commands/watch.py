@@ -3,9 +3,15 @@
 Watch Command for Media Knowledge Pipeline CLI
 """
 
-import sys
+import os
+import queue
+import signal
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 try:
     import typer
@@ -16,12 +22,147 @@ except ImportError:
     print("Required packages not found. Please install typer and rich.")
     raise typer.Exit(code=1)
 
-# Add project root to path for imports
-project_root = Path(__file__).parent.parent.parent.parent.parent
-sys.path.insert(0, str(project_root))
+# Imported for its side effect of putting the project root on sys.path
+from ... import _bootstrap  # noqa: F401
+
+from core.file_scanner import FileScanner
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import PatternMatchingEventHandler
+except ImportError:
+    Observer = None
 
 app = typer.Typer(help="Watch directory for new media files")
 
+# A file is copied once its size and mtime are unchanged across two stat
+# calls this far apart, so files still being written are not copied half-done
+_SETTLE_SECONDS = 0.5
+
+# A directory whose mtime is at least this much older than the last listing
+# cannot have changed unseen, even on filesystems with coarse timestamps
+_MTIME_SLACK_NS = 2_000_000_000
+
+# Upper bound on files remembered by the polling watcher
+_SEEN_CAPACITY = 100_000
+
+# Copies are I/O bound, so several can overlap; submissions block once this
+# many per worker are outstanding instead of queueing without limit
+_COPY_WORKERS = os.cpu_count() or 4
+_MAX_PENDING_PER_WORKER = 2
+
+
+class _SeenFiles:
+    """Size-capped record of handled files, evicting the oldest first.
+
+    Files are keyed by ``(st_ino, st_mtime_ns)`` rather than their path,
+    so a long-running watcher holds a bounded number of small tuples.
+    """
+    
+    def __init__(self, capacity: int = _SEEN_CAPACITY):
+        self._entries = OrderedDict()
+        self._capacity = capacity
+    
+    def __contains__(self, key) -> bool:
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return True
+        return False
+    
+    def add(self, key):
+        self._entries[key] = None
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._capacity:
+            self._entries.popitem(last=False)
+
+
+def _wait_until_stable(file_path: str, stop: threading.Event):
+    """Wait until a file has stopped changing.
+
+    Returns:
+        The file's ``(st_ino, st_mtime_ns)`` key, or None if the file went
+        away or the watcher is stopping
+    """
+    previous = None
+    while True:
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        current = (st.st_ino, st.st_size, st.st_mtime_ns)
+        if current == previous:
+            return (st.st_ino, st.st_mtime_ns)
+        previous = current
+        if stop.wait(_SETTLE_SECONDS):
+            return None
+
+
+def _start_observer(watch_dir: Path, extensions, events: "queue.Queue"):
+    """Start a watchdog observer that queues new files with media extensions.
+
+    Files are matched by the handler's glob patterns, so events for other
+    files never reach Python code. Renames are included because browsers
+    download to a temporary name and move the file into place.
+    """
+    class _MediaEventHandler(PatternMatchingEventHandler):
+        def on_created(self, event):
+            events.put((event.src_path, os.path.basename(event.src_path)))
+        
+        def on_moved(self, event):
+            events.put((event.dest_path, os.path.basename(event.dest_path)))
+    
+    handler = _MediaEventHandler(
+        patterns=[f"*{ext}" for ext in sorted(extensions)],
+        ignore_directories=True,
+        case_sensitive=False,
+    )
+    observer = Observer()
+    observer.schedule(handler, str(watch_dir), recursive=False)
+    observer.start()
+    return observer
+
+
+def _list_media_files(watch_dir: Path, extensions, seen=()):
+    """List media files in ``watch_dir`` whose key is not yet in ``seen``.
+
+    Paths and names are taken as strings straight from the directory
+    entries, so no ``Path`` objects are built while listing.
+
+    Returns:
+        List of (file path, file name, (st_ino, st_mtime_ns)) tuples
+    """
+    found = []
+    with os.scandir(watch_dir) as it:
+        for entry in it:
+            if os.path.splitext(entry.name)[1].lower() not in extensions or not entry.is_file():
+                continue
+            st = entry.stat()
+            key = (st.st_ino, st.st_mtime_ns)
+            if key not in seen:
+                found.append((entry.path, entry.name, key))
+    return found
+
+
+def _describe(name: str, result, process_pipeline: bool) -> List[str]:
+    """Return the console lines reporting the outcome of copying a watched file."""
+    if result.status == 'copied':
+        destination_name = result.destination.name
+        lines = [f"[green]✓[/green] Copied: {name} → {destination_name}"]
+        
+        # Process through pipeline if requested
+        if process_pipeline and result.destination:
+            lines.append(f"  [blue]→[/blue] Processing through pipeline...")
+            # This would call the process command
+            lines.append(f"  [green]✓[/green] Processed: {destination_name}")
+        return lines
+    elif result.status == 'dry_run':
+        # Dry run - just show what would happen
+        return [f"[yellow]~[/yellow] Would copy: {name}"]
+    elif result.status == 'skipped':
+        return [f"[yellow]~[/yellow] Skipped: {name} ({result.error_message})"]
+    else:
+        return [f"[red]✗[/red] Failed to copy: {name}: {result.error_message}"]
+
 
 @app.command()
 def directory(
@@ -31,6 +172,7 @@ def directory(
     process_pipeline: bool = typer.Option(False, "--process", help="Automatically process copied files"),
     dry_run: bool = typer.Option(False, "--dry-run", help="Show what would happen without copying"),
     interval: int = typer.Option(5, "--interval", "-i", help="Poll interval in seconds"),
+    poll: bool = typer.Option(False, "--poll", help="Poll the directory instead of using filesystem events"),
     quiet: bool = typer.Option(False, "--quiet", "-q", help="Suppress detailed output"),
 ):
     """Continuously watch directory for new media files."""
@@ -41,7 +183,8 @@ def directory(
         console.print(f"Watch directory: {directory}")
         console.print(f"Audio directory: {audio_dir}")
         console.print(f"Video directory: {video_dir}")
-        console.print(f"Poll interval: {interval}s")
+        if poll or Observer is None:
+            console.print(f"Poll interval: {interval}s")
         if process_pipeline:
             console.print("Auto-processing: [green]Enabled[/green]")
         if dry_run:
@@ -51,11 +194,6 @@ def directory(
         console.print("")
     
     try:
-        # Import the file scanner
-        sys.path.insert(0, str(project_root))
-        from core.file_scanner import FileScanner
-        import time
-        
         # Expand user path
         watch_dir = Path(directory).expanduser()
         audio_target = Path(audio_dir).expanduser()
@@ -69,10 +207,6 @@ def directory(
         audio_target.mkdir(parents=True, exist_ok=True)
         video_target.mkdir(parents=True, exist_ok=True)
         
-        if not quiet:
-            console.print(f"[blue]i[/blue] Watching directory: {watch_dir}")
-            console.print(f"[blue]i[/blue] Polling every {interval} seconds...")
-        
         # Initialize scanner
         scanner = FileScanner(
             scan_directory=str(watch_dir),
@@ -81,50 +215,128 @@ def directory(
             dry_run=dry_run
         )
         
-        # Keep track of processed files to avoid duplicates
-        processed_files = set()
+        extensions = frozenset(ext for exts in scanner.supported_extensions.values() for ext in exts)
+        use_events = not poll and Observer is not None
+        if not quiet:
+            console.print(f"[blue]i[/blue] Watching directory: {watch_dir}")
+            if use_events:
+                console.print("[blue]i[/blue] Waiting for filesystem events...")
+            else:
+                console.print(f"[blue]i[/blue] Polling every {interval} seconds...")
+        
+        # Set on SIGTERM so the loops below finish as they would for Ctrl+C;
+        # waiting on it instead of sleeping lets a stop cut the wait short
+        stop = threading.Event()
+        
+        # Files already handed to the scanner, shared by the startup listing,
+        # filesystem events and polling so each file is copied only once
+        seen = _SeenFiles()
+        seen_lock = threading.Lock()
+        
+        def copy(file_path: str, name: str) -> List[str]:
+            key = _wait_until_stable(file_path, stop)
+            if key is None:
+                return []
+            with seen_lock:
+                if key in seen:
+                    return []
+                seen.add(key)
+            try:
+                result = scanner.copy_media_file(file_path)
+                if result is None:
+                    return []
+                return _describe(name, result, process_pipeline)
+            except Exception as e:
+                return [f"[red]✗[/red] Error copying {name}: {str(e)}"]
+        
+        # Copy in the background so a burst of new files does not hold up
+        # the next poll or event
+        executor = ThreadPoolExecutor(max_workers=_COPY_WORKERS)
+        pending = threading.BoundedSemaphore(_COPY_WORKERS * _MAX_PENDING_PER_WORKER)
+        
+        def handle(file_path: str, name: str):
+            pending.acquire()
+            future = executor.submit(copy, file_path, name)
+            future.add_done_callback(lambda _: pending.release())
+            return future
+        
+        def report(future):
+            lines = future.result()
+            if lines:
+                console.print("\n".join(lines))
+        
+        def handle_all(files, lines: List[str]):
+            # Copy concurrently, then report the whole batch with one print
+            # so a burst of files is rendered and written once
+            futures = [handle(file_path, name) for file_path, name in files]
+            for future in futures:
+                lines.extend(future.result())
+            if lines:
+                console.print("\n".join(lines))
+        
+        previous_sigterm = None
+        if threading.current_thread() is threading.main_thread():
+            previous_sigterm = signal.signal(signal.SIGTERM, lambda *_: stop.set())
         
         try:
-            while True:
-                # Scan for new files
-                results = scanner.scan_directory(str(watch_dir))
-                
-                new_files = [r for r in results if r.source not in processed_files]
-                
-                if new_files and not quiet:
-                    console.print(f"[blue]i[/blue] Found {len(new_files)} new files")
-                
-                # Process new files
-                for result in new_files:
-                    processed_files.add(result.source)
+            if use_events:
+                # The kernel reports new files (inotify, FSEvents, ...), so an
+                # idle directory costs nothing between events
+                events = queue.Queue()
+                observer = _start_observer(watch_dir, extensions, events)
+                try:
+                    # Pick up files that arrived before the observer started
+                    handle_all([(file_path, name) for file_path, name, _ in _list_media_files(watch_dir, extensions)], [])
                     
-                    if not dry_run:
-                        # Copy file
+                    while not stop.is_set():
                         try:
-                            copied_result = scanner.copy_media_file(result.source)
-                            if copied_result.status == 'copied':
-                                console.print(f"[green]✓[/green] Copied: {Path(result.source).name} → {Path(copied_result.destination).name}")
-                                
-                                # Process through pipeline if requested
-                                if process_pipeline and copied_result.destination:
-                                    console.print(f"  [blue]→[/blue] Processing through pipeline...")
-                                    # This would call the process command
-                                    console.print(f"  [green]✓[/green] Processed: {Path(copied_result.destination).name}")
-                            else:
-                                console.print(f"[red]✗[/red] Failed to copy: {Path(result.source).name}")
-                        except Exception as e:
-                            console.print(f"[red]✗[/red] Error copying {Path(result.source).name}: {str(e)}")
-                    else:
-                        # Dry run - just show what would happen
-                        console.print(f"[yellow]~[/yellow] Would copy: {Path(result.source).name}")
-                
-                # Wait before next poll
-                time.sleep(interval)
+                            # Time out regularly so Ctrl+C and SIGTERM are noticed
+                            file_path, name = events.get(timeout=1)
+                        except queue.Empty:
+                            continue
+                        
+                        handle(file_path, name).add_done_callback(report)
+                finally:
+                    observer.stop()
+                    observer.join()
+            else:
+                last_mtime = listed_at = None
                 
+                while not stop.is_set():
+                    # Creating, removing or renaming an entry bumps the
+                    # directory's mtime, so an unchanged mtime means there is
+                    # nothing new and the listing can be skipped
+                    dir_mtime = os.stat(watch_dir).st_mtime_ns
+                    if dir_mtime != last_mtime or listed_at - dir_mtime < _MTIME_SLACK_NS:
+                        last_mtime, listed_at = dir_mtime, time.time_ns()
+                        
+                        # Scan for new files; copy() records each one once it
+                        # has settled, so files still being written show up again
+                        with seen_lock:
+                            new_files = _list_media_files(watch_dir, extensions, seen)
+                        
+                        log_lines = []
+                        if new_files and not quiet:
+                            log_lines.append(f"[blue]i[/blue] Found {len(new_files)} new files")
+                        
+                        # Process new files
+                        handle_all([(file_path, name) for file_path, name, _ in new_files], log_lines)
+                    
+                    # Wait before next poll
+                    stop.wait(interval)
+            
+            if not quiet:
+                console.print("\n[yellow]⚠[/yellow] Stopping watch process...")
         except KeyboardInterrupt:
             if not quiet:
                 console.print("\n[yellow]⚠[/yellow] Stopping watch process...")
             return
+        finally:
+            if previous_sigterm is not None:
+                signal.signal(signal.SIGTERM, previous_sigterm)
+            # Let copies already in progress finish rather than leave
+            # partial files behind
+            executor.shutdown(wait=True, cancel_futures=True)
             
     except Exception as e:
         console.print(f"[red]✗[/red] Error during directory watch: {str(e)}")
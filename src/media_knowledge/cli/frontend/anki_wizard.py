@@ -3,10 +3,10 @@ Anki Wizard for Media Knowledge Pipeline CLI Frontend
 This module provides an interactive wizard for generating Anki flashcards.
 """
 
-import sys
+import os
+import stat
 from pathlib import Path
 
-from .main_menu import MainMenuError
 
 class AnkiWizardError(Exception):
     """Custom exception for Anki wizard errors."""
@@ -70,15 +70,16 @@ class AnkiWizard:
                     print("File path cannot be empty.")
                     continue
                 
-                # Validate file exists
-                path_obj = Path(file_path)
-                if not path_obj.exists():
+                # Validate file exists, with one stat call
+                try:
+                    st = os.stat(file_path)
+                except FileNotFoundError:
                     print(f"File not found: {file_path}")
                     print("Please check the path and try again.")
                     continue
                 
                 # Validate it's a file (not directory)
-                if not path_obj.is_file():
+                if not stat.S_ISREG(st.st_mode):
                     print(f"Path is not a file: {file_path}")
                     continue
                 
@@ -87,7 +88,7 @@ class AnkiWizard:
                     print("File must be a JSON file (.json extension).")
                     continue
                 
-                return str(path_obj)
+                return file_path
                 
             except KeyboardInterrupt:
                 print("\nOperation cancelled.")
@@ -3,14 +3,23 @@ Batch Processing Utilities for Media Knowledge Pipeline CLI Frontend
 This module provides helper functions for batch processing wizards.
 """
 
-import sys
+import os
 from pathlib import Path
 
-# Add project root to path for imports
-project_root = Path(__file__).parent.parent.parent.parent.parent
-sys.path.insert(0, str(project_root))
+from ..batch_processor import BatchProcessor, BatchProcessorError
+from .shared.input_validator import clear_file_path_cache
 
-from src.media_knowledge.cli.batch_processor import BatchProcessor, BatchProcessorError
+# Contents written by BatchUtilities.create_sample_urls_file
+_SAMPLE_URLS_FILE = b"""# Sample YouTube URLs for Media Knowledge Pipeline
+# Add one YouTube URL per line
+# Lines starting with # are treated as comments
+
+https://www.youtube.com/watch?v=dQw4w9WgXcQ
+https://youtu.be/DLzxrzFCyOs
+https://www.youtube.com/watch?v= video_with_spaces (remove spaces)
+# Add your own URLs below this line
+
+"""
 
 
 class BatchUtilsError(Exception):
@@ -24,6 +33,8 @@ class BatchUtilities:
     def __init__(self):
         """Initialize batch utilities."""
         self.processor = BatchProcessor()
+        # Validation results keyed by (path, mtime_ns, size)
+        self._validation_cache = {}
     
     def validate_urls_file(self, file_path: str) -> dict:
         """Validate URLs file and return statistics.
@@ -37,10 +48,21 @@ class BatchUtilities:
         Raises:
             BatchUtilsError: If file cannot be validated
         """
+        # Unchanged files are only parsed once; any edit bumps mtime or size
+        try:
+            st = os.stat(file_path)
+            cache_key = (str(file_path), st.st_mtime_ns, st.st_size)
+        except OSError:
+            cache_key = None
+        
+        cached = self._validation_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+        
         try:
             valid_urls, invalid_urls = self.processor.parse_urls_file(file_path)
             
-            return {
+            result = {
                 "valid_count": len(valid_urls),
                 "invalid_count": len(invalid_urls),
                 "total_count": len(valid_urls) + len(invalid_urls),
@@ -52,6 +74,10 @@ class BatchUtilities:
             raise BatchUtilsError(f"URLs file validation failed: {e}")
         except Exception as e:
             raise BatchUtilsError(f"Unexpected error validating URLs file: {e}")
+        
+        if cache_key is not None:
+            self._validation_cache[cache_key] = result
+        return dict(result)
     
     def create_sample_urls_file(self, file_path: str) -> bool:
         """Create a sample URLs file for testing.
@@ -63,24 +89,13 @@ class BatchUtilities:
             bool: True if file created successfully, False otherwise
         """
         try:
-            sample_content = """# Sample YouTube URLs for Media Knowledge Pipeline
-# Add one YouTube URL per line
-# Lines starting with # are treated as comments
-
-https://www.youtube.com/watch?v=dQw4w9WgXcQ
-https://youtu.be/DLzxrzFCyOs
-https://www.youtube.com/watch?v= video_with_spaces (remove spaces)
-# Add your own URLs below this line
-
-"""
-            
             # Create parent directories if needed
             path_obj = Path(file_path)
             path_obj.parent.mkdir(parents=True, exist_ok=True)
             
             # Write sample content
-            with open(path_obj, 'w', encoding='utf-8') as f:
-                f.write(sample_content)
+            path_obj.write_bytes(_SAMPLE_URLS_FILE)
+            clear_file_path_cache()
             
             return True
         except Exception as e:
@@ -6,7 +6,23 @@ import os
 import sys
 from pathlib import Path
 
-from .main_menu import MainMenuError
+from .shared.user_prompter import YES_ANSWERS
+
+try:
+    import questionary
+except ImportError:
+    questionary = None
+
+# Template keys in the same order as BatchWizard.templates
+_TEMPLATE_KEYS = (
+    "lecture_summary",
+    "technical_tutorial",
+    "research_presentation",
+    "podcast_summary",
+    "basic_summary",
+    "anki_flashcards",
+    "custom",
+)
 
 
 class BatchWizardError(Exception):
@@ -17,24 +33,59 @@ class BatchWizardError(Exception):
 class BatchWizard:
     """Wizard for processing multiple YouTube URLs from a file."""
     
-    def __init__(self):
-        """Initialize batch wizard."""
-        self.templates = [
-            "Lecture Summary (Educational content)",
-            "Technical Tutorial", 
-            "Research Presentation",
-            "Podcast Summary",
-            "Basic Summary",
-            "Anki Flashcards (Generate study cards)",
-            "Custom Prompt"
-        ]
-        
-        self.output_options = [
-            "Save detailed JSON results",
-            "Save Markdown summary",
-            "Save both formats",
-            "No file output (display only)"
-        ]
+    # Section banners, each printed with a single call
+    _WIZARD_BANNER = "\n" + "=" * 50 + "\nBATCH PROCESSING WIZARD\n" + "=" * 50
+    _CONFIRM_BANNER = "\n" + "=" * 50 + "\nCONFIRMATION\n" + "=" * 50
+    
+    # Option labels shown by each selection step
+    templates = (
+        "Lecture Summary (Educational content)",
+        "Technical Tutorial",
+        "Research Presentation",
+        "Podcast Summary",
+        "Basic Summary",
+        "Anki Flashcards (Generate study cards)",
+        "Custom Prompt",
+    )
+    
+    output_options = (
+        "Save detailed JSON results",
+        "Save Markdown summary",
+        "Save both formats",
+        "No file output (display only)",
+    )
+    
+    def _urls_file_error(self, path_obj):
+        """Check that a URLs file exists, is a file and has content.
+        
+        Args:
+            path_obj (Path): Path to the URLs file
+            
+        Returns:
+            str: Description of the problem, or None if the file is usable
+        """
+        # Validate file exists
+        if not path_obj.exists():
+            return f"File not found: {path_obj}"
+        
+        # Validate it's a file (not directory)
+        if not path_obj.is_file():
+            return f"Path is not a file: {path_obj}"
+        
+        # Validate file has content, reading only until the first
+        # non-whitespace byte rather than loading the whole file
+        try:
+            with open(path_obj, 'rb') as f:
+                while True:
+                    chunk = f.read(4096)
+                    if not chunk:
+                        return f"File is empty: {path_obj}"
+                    if chunk.strip():
+                        break
+        except Exception as e:
+            return f"Cannot read file: {e}"
+        
+        return None
     
     def get_urls_file(self):
         """Get and validate URLs file path from user.
@@ -58,27 +109,12 @@ class BatchWizard:
                     file_path = "./urls.txt"
                     print(f"Using default: {file_path}")
                 
-                # Validate file exists
                 path_obj = Path(file_path)
-                if not path_obj.exists():
-                    print(f"File not found: {file_path}")
-                    print("Please check the path and try again.")
-                    continue
-                
-                # Validate it's a file (not directory)
-                if not path_obj.is_file():
-                    print(f"Path is not a file: {file_path}")
-                    continue
-                
-                # Validate file has content
-                try:
-                    with open(path_obj, 'r') as f:
-                        content = f.read().strip()
-                        if not content:
-                            print(f"File is empty: {file_path}")
-                            continue
-                except Exception as e:
-                    print(f"Cannot read file: {e}")
+                error = self._urls_file_error(path_obj)
+                if error:
+                    print(error)
+                    if not path_obj.exists():
+                        print("Please check the path and try again.")
                     continue
                 
                 return str(path_obj)
@@ -173,19 +209,8 @@ class BatchWizard:
                 choice_num = int(choice)
                 if choice_num == 0:
                     raise BatchWizardError("User cancelled")
-                elif 1 <= choice_num <= 6:
-                    # Map to template keys
-                    template_keys = [
-                        "lecture_summary",
-                        "technical_tutorial", 
-                        "research_presentation",
-                        "podcast_summary",
-                        "basic_summary",
-                        "anki_flashcards"
-                    ]
-                    return template_keys[choice_num - 1]
-                elif choice_num == 7:
-                    return "custom"
+                elif 1 <= choice_num <= 7:
+                    return _TEMPLATE_KEYS[choice_num - 1]
                 else:
                     print("Please enter a number between 0 and 7.")
             except ValueError:
@@ -220,14 +245,14 @@ class BatchWizard:
         print("\nStep 5: Essay Generation")
         
         # Enable essay generation
-        essay_choice = input("Generate comprehensive essay from multiple sources? [y/N]: ").strip().lower()
-        enable_essay = essay_choice in ['y', 'yes']
+        essay_choice = input("Generate comprehensive essay from multiple sources? [y/N]: ").strip()
+        enable_essay = essay_choice in YES_ANSWERS
         
         # Force essay generation
         force_essay = False
         if enable_essay:
-            force_choice = input("Force essay generation even if content cohesion is questionable? [y/N]: ").strip().lower()
-            force_essay = force_choice in ['y', 'yes']
+            force_choice = input("Force essay generation even if content cohesion is questionable? [y/N]: ").strip()
+            force_essay = force_choice in YES_ANSWERS
         
         return {
             "enable_essay": enable_essay,
@@ -243,12 +268,12 @@ class BatchWizard:
         print("\nStep 6: Processing Options")
         
         # Cloud processing option
-        cloud_choice = input("Use cloud models for processing? (Requires internet) [y/N]: ").strip().lower()
-        use_cloud = cloud_choice in ['y', 'yes']
+        cloud_choice = input("Use cloud models for processing? (Requires internet) [y/N]: ").strip()
+        use_cloud = cloud_choice in YES_ANSWERS
         
         # Quiet mode option
-        quiet_choice = input("Run in quiet mode? (Less verbose output) [y/N]: ").strip().lower()
-        quiet_mode = quiet_choice in ['y', 'yes']
+        quiet_choice = input("Run in quiet mode? (Less verbose output) [y/N]: ").strip()
+        quiet_mode = quiet_choice in YES_ANSWERS
         
         return {
             "use_cloud": use_cloud,
@@ -256,6 +281,109 @@ class BatchWizard:
             "organize": True  # Always organize by default
         }
     
+    def ask_form(self):
+        """Collect every wizard answer in a single questionary form.
+        
+        The whole form is rendered in one terminal session, with arrow-key
+        selection for the worker count and template. Questions that only
+        apply to some answers are skipped.
+        
+        Returns:
+            tuple: (urls_file, output_dir, parallel_workers, template,
+            custom_prompt, essay_options, processing_options)
+            
+        Raises:
+            BatchWizardError: If the user cancels the form
+        """
+        answers = questionary.prompt([
+            {
+                "type": "path",
+                "name": "urls_file",
+                "message": "URLs file (one YouTube URL per line):",
+                "default": "./urls.txt",
+                "validate": lambda value: self._urls_file_error(Path(value)) or True,
+            },
+            {
+                "type": "path",
+                "name": "output_dir",
+                "message": "Output directory:",
+                "default": "./outputs",
+                "only_directories": True,
+            },
+            {
+                "type": "select",
+                "name": "parallel_workers",
+                "message": "Parallel workers:",
+                "choices": [str(n) for n in range(1, 9)],
+                "default": "1",
+            },
+            {
+                "type": "select",
+                "name": "template",
+                "message": "Processing template:",
+                "choices": [
+                    questionary.Choice(title, value=key)
+                    for title, key in zip(self.templates, _TEMPLATE_KEYS)
+                ],
+            },
+            {
+                "type": "text",
+                "name": "custom_prompt",
+                "message": "Custom prompt:",
+                "when": lambda answers: answers.get("template") == "custom",
+                "validate": lambda value: bool(value.strip()) or "Custom prompt cannot be empty.",
+            },
+            {
+                "type": "confirm",
+                "name": "enable_essay",
+                "message": "Generate comprehensive essay from multiple sources?",
+                "default": False,
+            },
+            {
+                "type": "confirm",
+                "name": "force_essay",
+                "message": "Force essay generation even if content cohesion is questionable?",
+                "default": False,
+                "when": lambda answers: answers.get("enable_essay"),
+            },
+            {
+                "type": "confirm",
+                "name": "use_cloud",
+                "message": "Use cloud models for processing? (Requires internet)",
+                "default": False,
+            },
+            {
+                "type": "confirm",
+                "name": "quiet",
+                "message": "Run in quiet mode? (Less verbose output)",
+                "default": False,
+            },
+        ])
+        if not answers:
+            raise BatchWizardError("User cancelled")
+        
+        output_path = Path(answers["output_dir"] or "./outputs")
+        output_path.mkdir(parents=True, exist_ok=True)
+        
+        essay_options = {
+            "enable_essay": answers["enable_essay"],
+            "force_essay": answers.get("force_essay", False)
+        }
+        processing_options = {
+            "use_cloud": answers["use_cloud"],
+            "quiet": answers["quiet"],
+            "organize": True  # Always organize by default
+        }
+        return (
+            str(Path(answers["urls_file"])),
+            str(output_path),
+            int(answers["parallel_workers"]),
+            answers["template"],
+            (answers.get("custom_prompt") or "").strip() or None,
+            essay_options,
+            processing_options,
+        )
+    
     def confirm_and_execute(self, urls_file, output_dir, parallel_workers, template, essay_options, processing_options, custom_prompt=None):
         """Confirm settings and show what would be executed.
         
@@ -271,9 +399,7 @@ class BatchWizard:
         Returns:
             bool: True if user confirms, False if cancelled
         """
-        print("\n" + "=" * 50)
-        print("CONFIRMATION")
-        print("=" * 50)
+        print(self._CONFIRM_BANNER)
         print(f"URLs File: {urls_file}")
         print(f"Output Directory: {output_dir}")
         print(f"Parallel Workers: {parallel_workers}")
@@ -292,9 +418,9 @@ class BatchWizard:
         print(f"  - Organize output: {'Yes' if processing_options['organize'] else 'No'}")
         
         print("\nReady to process! Press ENTER to begin or 'q' to cancel:")
-        choice = input("> ").strip().lower()
+        choice = input("> ").strip()
         
-        return choice != 'q'
+        return choice not in ("q", "Q")
     
     def process_batch_interactive(self):
         """Main interactive batch processing flow.
@@ -303,31 +429,34 @@ class BatchWizard:
             dict: Processing configuration or None if cancelled
         """
         try:
-            print("\n" + "=" * 50)
-            print("BATCH PROCESSING WIZARD")
-            print("=" * 50)
-            
-            # Step 1: Get URLs file
-            urls_file = self.get_urls_file()
+            print(self._WIZARD_BANNER)
             
-            # Step 2: Get output directory
-            output_dir = self.get_output_directory()
-            
-            # Step 3: Get parallel workers
-            parallel_workers = self.get_parallel_workers()
-            
-            # Step 4: Select template
-            template = self.select_template()
-            custom_prompt = None
-            if template == "custom":
-                custom_prompt = self.get_custom_prompt()
-                template = "custom"
-            
-            # Step 5: Essay options
-            essay_options = self.get_essay_options()
-            
-            # Step 6: Processing options
-            processing_options = self.get_processing_options()
+            if questionary is not None and sys.stdin.isatty():
+                # Ask everything in one form when running in a terminal
+                (urls_file, output_dir, parallel_workers, template,
+                 custom_prompt, essay_options, processing_options) = self.ask_form()
+            else:
+                # Step 1: Get URLs file
+                urls_file = self.get_urls_file()
+                
+                # Step 2: Get output directory
+                output_dir = self.get_output_directory()
+                
+                # Step 3: Get parallel workers
+                parallel_workers = self.get_parallel_workers()
+                
+                # Step 4: Select template
+                template = self.select_template()
+                custom_prompt = None
+                if template == "custom":
+                    custom_prompt = self.get_custom_prompt()
+                    template = "custom"
+                
+                # Step 5: Essay options
+                essay_options = self.get_essay_options()
+                
+                # Step 6: Processing options
+                processing_options = self.get_processing_options()
             
             # Confirmation
             confirmed = self.confirm_and_execute(
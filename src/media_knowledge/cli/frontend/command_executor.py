@@ -3,196 +3,279 @@ Command Executor for Media Knowledge Pipeline CLI Frontend
 This module executes the actual CLI commands based on wizard configurations.
 """
 
-import subprocess
+import os
+import shlex
 import sys
-from pathlib import Path
+from contextlib import contextmanager
 
-# Imports are relative now
+from ..._bootstrap import PROJECT_ROOT
+from .jobs import BatchJob, DocumentJob, MediaJob
+from .shared.input_validator import clear_file_path_cache
+
+# Interpreter and module every subprocess command starts with
+BASE_COMMAND = (sys.executable, "-m", "media_knowledge.cli.app")
+
+
+@contextmanager
+def _working_directory(path):
+    """Temporarily change the current working directory."""
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
 
 
 class CommandExecutor:
     """Execute CLI commands based on wizard configurations."""
     
-    def __init__(self):
-        """Initialize command executor."""
-        self.base_command = [sys.executable, "-m", "media_knowledge.cli.app"]
-        self.project_root = Path(__file__).parent.parent.parent.parent.parent
+    # Options added when a job attribute has the given truth value,
+    # as (attribute, value, args) entries
+    _MEDIA_FLAGS = (
+        ("use_cloud", True, ("--cloud",)),
+        ("quiet", True, ("--quiet",)),
+        ("organize", False, ("--no-organize",)),
+    )
+    _DOCUMENT_FLAGS = (
+        ("use_cloud", True, ("--cloud",)),
+        ("quiet", True, ("--quiet",)),
+    )
+    _BATCH_FLAGS = (
+        ("use_cloud", True, ("--cloud",)),
+        ("quiet", True, ("--quiet",)),
+        ("organize", False, ("--no-organize",)),
+    )
     
-    def execute_media_processing(self, config):
-        """Execute media processing based on configuration.
+    # Job type (None for plain dicts), argument builder and the names used
+    # in result messages for each kind of job, as (job type, builder,
+    # description, error name) entries
+    _JOB_SPECS = {
+        "media": (MediaJob, "_media_args", "Media processing", "media processing"),
+        "document": (DocumentJob, "_document_args", "Document processing", "document processing"),
+        "batch": (BatchJob, "_batch_args", "Batch processing", "batch processing"),
+        "anki": (None, "_anki_args", "Anki generation", "Anki generation"),
+    }
+    
+    def __init__(self, in_process=False):
+        """Initialize command executor.
+        
+        Args:
+            in_process (bool): Run commands with the CLI app loaded in this
+                process instead of starting a new Python interpreter for
+                each one
+        """
+        self.base_command = list(BASE_COMMAND)
+        self.project_root = PROJECT_ROOT
+        self.in_process = in_process
+        self._app = None
+    
+    def _get_app(self):
+        """Import the Typer CLI app on first use and keep it for later commands."""
+        if self._app is None:
+            from ..app import app
+            self._app = app
+        return self._app
+    
+    def _run_in_process(self, args):
+        """Run CLI arguments with the Typer app in this process.
+        
+        The app runs in standalone mode, so usage errors and aborts are
+        reported exactly as on the command line and every outcome ends in
+        ``SystemExit`` with the command's exit code.
         
         Args:
-            config (dict): Media processing configuration from wizard
+            args (list): Arguments following the module name
             
         Returns:
-            bool: True if successful, False otherwise
+            int: Exit code of the command
         """
         try:
-            # Build command based on configuration
-            command = self.base_command + ["process", "media"]
-            
-            # Add input (URL or file path)
-            command.extend(["--input", config["media_input"]])
-            
-            # Add cloud option if enabled
-            if config["processing_options"]["use_cloud"]:
-                command.append("--cloud")
-            
-            # Add template or custom prompt
-            if config["template"] and config["template"] != "custom":
-                command.extend(["--prompt", config["template"]])
-            elif config["custom_prompt"]:
-                command.extend(["--prompt", config["custom_prompt"]])
-            
-            # Add output options - use custom paths when provided, otherwise enable saving
-            if config["output_config"].get("output_path"):
-                # Use custom or auto-named path in outputs directory
-                command.extend(["--output", config["output_config"]["output_path"]])
-            elif config["output_config"]["save_json"]:
-                # Enable saving with intelligent naming
-                command.extend(["--output", "outputs/auto_generated_results.json"])
+            with _working_directory(self.project_root):
+                self._get_app()(args=args, prog_name="media-knowledge")
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                return e.code or 0
+            print(e.code)
+            return 1
+        return 0
+    
+    def _run_command(self, command):
+        """Run a full CLI command and return its exit code.
+        
+        Args:
+            command (list): Command starting with ``base_command``
             
-            if config["output_config"].get("markdown_path"):
-                command.extend(["--markdown", config["output_config"]["markdown_path"]])
-            elif config["output_config"]["save_markdown"]:
-                command.extend(["--markdown", "outputs/markdown"])
+        Returns:
+            int: Exit code of the command
+        """
+        if self.in_process:
+            return self._run_in_process(command[len(self.base_command):])
+        
+        # Imported here so opening the wizard menus does not pay for it
+        import subprocess
+        
+        # Without cwd or close_fds, subprocess can start the child with
+        # posix_spawn instead of fork + exec. File descriptors are not
+        # inheritable by default, so keeping them open is safe. The
+        # directory is only passed when it differs from the current one,
+        # since changing this process's directory around the call would
+        # race with the threads used by execute_many.
+        kwargs = {"close_fds": False}
+        if os.getcwd() != str(self.project_root):
+            kwargs["cwd"] = str(self.project_root)
+        return subprocess.run(command, **kwargs).returncode
+    
+    @staticmethod
+    def _flag_args(job, flags):
+        """Return the arguments for every entry of ``flags`` that applies to ``job``."""
+        return [
+            arg
+            for attribute, value, args in flags
+            if bool(getattr(job, attribute)) is value
+            for arg in args
+        ]
+    
+    @staticmethod
+    def _prompt_args(job, custom_option):
+        """Return the template option, or the custom prompt option when no template applies."""
+        if job.template and job.template != "custom":
+            return ["--prompt", job.template]
+        if job.custom_prompt:
+            return [custom_option, job.custom_prompt]
+        return []
+    
+    def _media_args(self, job):
+        """Return the CLI arguments for a MediaJob."""
+        # Start with the input (URL or file path) and the boolean options
+        args = ["process", "media", "--input", job.media_input]
+        args += self._flag_args(job, self._MEDIA_FLAGS)
+        args += self._prompt_args(job, "--prompt")
+        
+        # Add output options - use custom paths when provided, otherwise enable saving
+        if job.output_path:
+            # Use custom or auto-named path in outputs directory
+            args += ["--output", job.output_path]
+        elif job.save_json:
+            # Enable saving with intelligent naming
+            args += ["--output", "outputs/auto_generated_results.json"]
+        
+        if job.markdown_path:
+            args += ["--markdown", job.markdown_path]
+        elif job.save_markdown:
+            args += ["--markdown", "outputs/markdown"]
+        return args
+    
+    def _document_args(self, job):
+        """Return the CLI arguments for a DocumentJob."""
+        args = ["document", "process", job.file_path]
+        args += self._flag_args(job, self._DOCUMENT_FLAGS)
+        args += self._prompt_args(job, "--custom-prompt")
+        if job.save_json or job.save_markdown:
+            args += ["--output", "results.json"]
+        return args
+    
+    def _batch_args(self, job):
+        """Return the CLI arguments for a BatchJob."""
+        args = [
+            "batch", "process-urls",
+            "--urls", job.urls_file,
+            "--output-dir", job.output_dir,
+        ]
+        args += self._flag_args(job, self._BATCH_FLAGS)
+        args += self._prompt_args(job, "--prompt")
+        if job.parallel_workers > 1:
+            args += ["--parallel", str(job.parallel_workers)]
+        if job.enable_essay:
+            args.append("--essay")
+            if job.force_essay:
+                args.append("--force-essay")
+        return args
+    
+    def _anki_args(self, config):
+        """Return the CLI arguments for an Anki configuration dict, which may be None."""
+        args = ["anki", "generate"]
+        if config:
+            if config.get("input_file"):
+                args += ["--input", config["input_file"]]
+            if config.get("deck_name"):
+                args += ["--deck-name", config["deck_name"]]
+            if config.get("preview", False):
+                args.append("--preview")
+        return args
+    
+    def _run(self, kind, config):
+        """Build, print and run the command for one job and report the outcome.
+        
+        Args:
+            kind (str): One of "media", "document", "batch" or "anki"
+            config: Job dataclass or configuration dict for that kind
             
-            # Add quiet option
-            if config["processing_options"]["quiet"]:
-                command.append("--quiet")
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        job_type, builder, description, error_name = self._JOB_SPECS[kind]
+        try:
+            if job_type is not None and not isinstance(config, job_type):
+                config = job_type.from_config(config)
+            command = [*self.base_command, *getattr(self, builder)(config)]
             
-            # Add organize option
-            if not config["processing_options"]["organize"]:
-                command.append("--no-organize")
+            print("\nExecuting command:", shlex.join(command))
             
-            print(f"\nExecuting command: {' '.join(command)}")
+            returncode = self._run_command(command)
             
-            # Execute command
-            result = subprocess.run(command, cwd=str(self.project_root))
+            # The command may have written the files the next wizard asks for
+            clear_file_path_cache()
             
-            if result.returncode == 0:
-                print("\n✅ Media processing completed successfully!")
-                return True
-            else:
-                print(f"\n❌ Media processing failed with return code {result.returncode}")
+            if returncode != 0:
+                print(f"\n❌ {description} failed with return code {returncode}")
                 return False
+            if kind == "anki":
+                action = "preview" if config and config.get("preview", False) else "generation"
+                print(f"\n✅ Anki flashcard {action} completed successfully!")
+            else:
+                print(f"\n✅ {description} completed successfully!")
+            return True
                 
         except Exception as e:
-            print(f"\n❌ Error executing media processing: {e}")
+            print(f"\n❌ Error executing {error_name}: {e}")
             return False
     
+    def execute_media_processing(self, config):
+        """Execute media processing based on configuration.
+        
+        Args:
+            config (MediaJob or dict): Media processing job, or the nested
+                configuration dict from the wizard
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        return self._run("media", config)
+    
     def execute_document_processing(self, config):
         """Execute document processing based on configuration.
         
         Args:
-            config (dict): Document processing configuration from wizard
+            config (DocumentJob or dict): Document processing job, or the
+                nested configuration dict from a wizard
             
         Returns:
             bool: True if successful, False otherwise
         """
-        try:
-            # Build command based on configuration
-            command = self.base_command + ["document", "process"]
-            
-            # Add file path
-            command.append(config["file_path"])
-            
-            # Add cloud option if enabled
-            if config["processing_options"]["use_cloud"]:
-                command.append("--cloud")
-            
-            # Add template or custom prompt
-            if config["template"] and config["template"] != "custom":
-                command.extend(["--prompt", config["template"]])
-            elif config["custom_prompt"]:
-                command.extend(["--custom-prompt", config["custom_prompt"]])
-            
-            # Add output options
-            if config["output_config"]["save_json"] or config["output_config"]["save_markdown"]:
-                command.extend(["--output", "results.json"])
-            
-            # Add quiet option
-            if config["processing_options"]["quiet"]:
-                command.append("--quiet")
-            
-            print(f"\nExecuting command: {' '.join(command)}")
-            
-            # Execute command
-            result = subprocess.run(command, cwd=str(self.project_root))
-            
-            if result.returncode == 0:
-                print("\n✅ Document processing completed successfully!")
-                return True
-            else:
-                print(f"\n❌ Document processing failed with return code {result.returncode}")
-                return False
-                
-        except Exception as e:
-            print(f"\n❌ Error executing document processing: {e}")
-            return False
+        return self._run("document", config)
     
     def execute_batch_processing(self, config):
         """Execute batch processing based on configuration.
         
         Args:
-            config (dict): Batch processing configuration from wizard
+            config (BatchJob or dict): Batch processing job, or the nested
+                configuration dict from the wizard
             
         Returns:
             bool: True if successful, False otherwise
         """
-        try:
-            # Build command based on configuration
-            command = self.base_command + ["batch", "process-urls"]
-            
-            # Add URLs file
-            command.extend(["--urls", config["urls_file"]])
-            
-            # Add output directory
-            command.extend(["--output-dir", config["output_dir"]])
-            
-            # Add cloud option if enabled
-            if config["processing_options"]["use_cloud"]:
-                command.append("--cloud")
-            
-            # Add template or custom prompt
-            if config["template"] and config["template"] != "custom":
-                command.extend(["--prompt", config["template"]])
-            elif config["custom_prompt"]:
-                command.extend(["--prompt", config["custom_prompt"]])
-            
-            # Add parallel processing
-            if config["parallel_workers"] > 1:
-                command.extend(["--parallel", str(config["parallel_workers"])])
-            
-            # Add essay options
-            if config["essay_options"]["enable_essay"]:
-                command.append("--essay")
-                if config["essay_options"]["force_essay"]:
-                    command.append("--force-essay")
-            
-            # Add quiet option
-            if config["processing_options"]["quiet"]:
-                command.append("--quiet")
-            
-            # Add organize option
-            if not config["processing_options"]["organize"]:
-                command.append("--no-organize")
-            
-            print(f"\nExecuting command: {' '.join(command)}")
-            
-            # Execute command
-            result = subprocess.run(command, cwd=str(self.project_root))
-            
-            if result.returncode == 0:
-                print("\n✅ Batch processing completed successfully!")
-                return True
-            else:
-                print(f"\n❌ Batch processing failed with return code {result.returncode}")
-                return False
-                
-        except Exception as e:
-            print(f"\n❌ Error executing batch processing: {e}")
-            return False
+        return self._run("batch", config)
 
     def execute_anki_generation(self, config=None):
         """Execute Anki flashcard generation based on configuration.
@@ -203,41 +286,47 @@ class CommandExecutor:
         Returns:
             bool: True if successful, False otherwise
         """
-        try:
-            # Build command based on configuration
-            command = self.base_command + ["anki", "generate"]
-            
-            if config:
-                # Add input file
-                if "input_file" in config and config["input_file"]:
-                    command.extend(["--input", config["input_file"]])
-                
-                # Add deck name if provided and not None/empty
-                if "deck_name" in config and config["deck_name"]:
-                    command.extend(["--deck-name", config["deck_name"]])
-                
-                # Add preview flag if in preview mode
-                if config.get("preview", False):
-                    command.append("--preview")
-            
-            print(f"\nExecuting command: {' '.join(command)}")
-            
-            # Execute command
-            result = subprocess.run(command, cwd=str(self.project_root))
+        return self._run("anki", config)
+
+    def execute_many(self, configs, kind, max_workers=None):
+        """Execute several independent jobs of the same kind concurrently.
+        
+        Every job runs as its own child process, so the work itself runs
+        in parallel and a thread per job is enough to wait on them. Jobs
+        always use the subprocess path, since in-process commands share
+        this process's working directory and console.
+        
+        Args:
+            configs (list): Configurations for the jobs
+            kind (str): One of "media", "document", "batch" or "anki"
+            max_workers (int, optional): Maximum number of jobs run at once
+                (default: number of CPUs)
             
-            if result.returncode == 0:
-                if config and config.get("preview", False):
-                    print("\n✅ Anki flashcard preview completed successfully!")
-                else:
-                    print("\n✅ Anki flashcard generation completed successfully!")
-                return True
-            else:
-                print(f"\n❌ Anki generation failed with return code {result.returncode}")
-                return False
-                
-        except Exception as e:
-            print(f"\n❌ Error executing Anki generation: {e}")
-            return False
+        Returns:
+            list: True or False for each configuration, in order
+        """
+        if not configs:
+            return []
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        runner = CommandExecutor() if self.in_process else self
+        workers = min(len(configs), max_workers or os.cpu_count() or 4)
+        
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(runner._run, [kind] * len(configs), configs))
+
+
+# Executor shared by the wizard workflows, created on first use
+_EXECUTOR = None
+
+
+def get_executor():
+    """Return the shared CommandExecutor, creating it on first use."""
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        _EXECUTOR = CommandExecutor()
+    return _EXECUTOR
 
 
 def main():
@@ -3,10 +3,10 @@ Document Processing Wizard for Media Knowledge Pipeline CLI Frontend
 """
 
 import os
-import sys
-from pathlib import Path
+from dataclasses import asdict
 
-from .main_menu import MainMenuError
+from .jobs import DocumentJob
+from .shared.user_prompter import YES_ANSWERS, read_line
 
 
 class DocumentWizardError(Exception):
@@ -17,29 +17,48 @@ class DocumentWizardError(Exception):
 class DocumentWizard:
     """Wizard for processing documents interactively."""
     
-    def __init__(self):
-        """Initialize document wizard."""
-        self.document_types = [
-            "PDF Document",
-            "EPUB Book/Ebook",
-            "MOBI Book/Ebook"
-        ]
-        
-        self.templates = [
-            "Lecture Summary (Educational content)",
-            "Technical Documentation",
-            "Research Summary",
-            "Tutorial Guide",
-            "Basic Summary",
-            "Custom Prompt"
-        ]
-        
-        self.output_options = [
-            "Save detailed JSON results",
-            "Save Markdown summary",
-            "Save both formats",
-            "No file output (display only)"
-        ]
+    # File extensions in the same order as document_types
+    _EXTENSIONS = ("pdf", "epub", "mobi")
+    
+    # Template keys in the same order as templates
+    _TEMPLATE_KEYS = (
+        "lecture_summary",
+        "technical_documentation",
+        "research_summary",
+        "tutorial_guide",
+        "basic_summary",
+        "custom",
+    )
+    
+    # (save_json, save_markdown) for each output option
+    _OUTPUT_MAP = {1: (True, False), 2: (False, True), 3: (True, True), 4: (False, False)}
+    
+    # Section banners, each printed with a single call
+    _WIZARD_BANNER = "\n" + "=" * 50 + "\nPROCESS DOCUMENT WIZARD\n" + "=" * 50
+    _CONFIRM_BANNER = "\n" + "=" * 50 + "\nCONFIRMATION\n" + "=" * 50
+    
+    # Option labels shown by each selection step
+    document_types = (
+        "PDF Document",
+        "EPUB Book/Ebook",
+        "MOBI Book/Ebook",
+    )
+    
+    templates = (
+        "Lecture Summary (Educational content)",
+        "Technical Documentation",
+        "Research Summary",
+        "Tutorial Guide",
+        "Basic Summary",
+        "Custom Prompt",
+    )
+    
+    output_options = (
+        "Save detailed JSON results",
+        "Save Markdown summary",
+        "Save both formats",
+        "No file output (display only)",
+    )
     
     def select_document_type(self):
         """Guide user through document type selection.
@@ -57,7 +76,7 @@ class DocumentWizard:
         
         while True:
             try:
-                choice = input("\nEnter choice (0-3): ").strip()
+                choice = read_line("\nEnter choice (0-3): ").strip()
                 if not choice:
                     print("Please enter a choice.")
                     continue
@@ -67,8 +86,7 @@ class DocumentWizard:
                     raise DocumentWizardError("User cancelled")
                 elif 1 <= choice_num <= 3:
                     # Return file extension
-                    extensions = ["pdf", "epub", "mobi"]
-                    return extensions[choice_num - 1]
+                    return self._EXTENSIONS[choice_num - 1]
                 else:
                     print("Please enter a number between 0 and 3.")
             except ValueError:
@@ -92,26 +110,28 @@ class DocumentWizard:
         
         while True:
             try:
-                file_path = input("> ").strip()
+                file_path = read_line("> ").strip()
                 
                 if not file_path:
                     # Default to current directory with sample name
                     file_path = f"./sample.{extension}"
                     print(f"Using default: {file_path}")
                 
+                # Validate extension matches before touching the filesystem
+                if not file_path.lower().endswith(f".{extension}"):
+                    print(f"File must have .{extension} extension, got {os.path.splitext(file_path)[1]}")
+                    continue
+                
                 # Validate file exists
-                path_obj = Path(file_path)
-                if not path_obj.exists():
+                try:
+                    os.stat(file_path)
+                except FileNotFoundError:
                     print(f"File not found: {file_path}")
                     print("Please check the path and try again.")
                     continue
                 
-                # Validate extension matches
-                if path_obj.suffix.lower() != f".{extension}":
-                    print(f"File must have .{extension} extension, got {path_obj.suffix}")
-                    continue
-                
-                return str(path_obj)
+                # Commands run from the project root, so pass an absolute path
+                return os.path.abspath(file_path)
                 
             except KeyboardInterrupt:
                 raise DocumentWizardError("User cancelled")
@@ -134,7 +154,7 @@ class DocumentWizard:
         
         while True:
             try:
-                choice = input("\nEnter choice (0-6): ").strip()
+                choice = read_line("\nEnter choice (0-6): ").strip()
                 if not choice:
                     print("Using default template: lecture_summary")
                     return "lecture_summary"
@@ -142,18 +162,8 @@ class DocumentWizard:
                 choice_num = int(choice)
                 if choice_num == 0:
                     raise DocumentWizardError("User cancelled")
-                elif 1 <= choice_num <= 5:
-                    # Map to template keys
-                    template_keys = [
-                        "lecture_summary",
-                        "technical_documentation", 
-                        "research_summary",
-                        "tutorial_guide",
-                        "basic_summary"
-                    ]
-                    return template_keys[choice_num - 1]
-                elif choice_num == 6:
-                    return "custom"
+                elif 1 <= choice_num <= 6:
+                    return self._TEMPLATE_KEYS[choice_num - 1]
                 else:
                     print("Please enter a number between 0 and 6.")
             except ValueError:
@@ -170,7 +180,7 @@ class DocumentWizard:
         
         while True:
             try:
-                prompt = input("> ").strip()
+                prompt = read_line("> ").strip()
                 if prompt:
                     return prompt
                 else:
@@ -192,7 +202,7 @@ class DocumentWizard:
         
         while True:
             try:
-                choice = input("\nEnter choice (0-4): ").strip()
+                choice = read_line("\nEnter choice (0-4): ").strip()
                 if not choice:
                     print("Using default: Save both formats")
                     choice_num = 3
@@ -202,9 +212,10 @@ class DocumentWizard:
                 if choice_num == 0:
                     raise DocumentWizardError("User cancelled")
                 elif 1 <= choice_num <= 4:
+                    save_json, save_markdown = self._OUTPUT_MAP[choice_num]
                     return {
-                        "save_json": choice_num in [1, 3],
-                        "save_markdown": choice_num in [2, 3],
+                        "save_json": save_json,
+                        "save_markdown": save_markdown,
                         "output_type": choice_num
                     }
                 else:
@@ -221,12 +232,12 @@ class DocumentWizard:
         print("\nStep 5: Processing Options")
         
         # Cloud processing option
-        cloud_choice = input("Use cloud models for processing? (Requires internet) [y/N]: ").strip().lower()
-        use_cloud = cloud_choice in ['y', 'yes']
+        cloud_choice = read_line("Use cloud models for processing? (Requires internet) [y/N]: ").strip()
+        use_cloud = cloud_choice in YES_ANSWERS
         
         # Quiet mode option
-        quiet_choice = input("Run in quiet mode? (Less verbose output) [y/N]: ").strip().lower()
-        quiet_mode = quiet_choice in ['y', 'yes']
+        quiet_choice = read_line("Run in quiet mode? (Less verbose output) [y/N]: ").strip()
+        quiet_mode = quiet_choice in YES_ANSWERS
         
         return {
             "use_cloud": use_cloud,
@@ -246,9 +257,7 @@ class DocumentWizard:
         Returns:
             bool: True if user confirms, False if cancelled
         """
-        print("\n" + "=" * 50)
-        print("CONFIRMATION")
-        print("=" * 50)
+        print(self._CONFIRM_BANNER)
         print(f"Document: {file_path}")
         print(f"Template: {template}")
         if custom_prompt:
@@ -267,20 +276,18 @@ class DocumentWizard:
         print(f"  - Quiet mode: {'Yes' if processing_options['quiet'] else 'No'}")
         
         print("\nReady to process! Press ENTER to begin or 'q' to cancel:")
-        choice = input("> ").strip().lower()
+        choice = read_line("> ").strip()
         
-        return choice != 'q'
+        return choice not in ("q", "Q")
     
     def process_document_interactive(self):
         """Main interactive document processing flow.
         
         Returns:
-            dict: Processing configuration or None if cancelled
+            DocumentJob: Processing job or None if cancelled
         """
         try:
-            print("\n" + "=" * 50)
-            print("PROCESS DOCUMENT WIZARD")
-            print("=" * 50)
+            print(self._WIZARD_BANNER)
             
             # Step 1: Select document type
             extension = self.select_document_type()
@@ -307,13 +314,15 @@ class DocumentWizard:
             )
             
             if confirmed:
-                return {
-                    "file_path": file_path,
-                    "template": template,
-                    "custom_prompt": custom_prompt,
-                    "output_config": output_config,
-                    "processing_options": processing_options
-                }
+                return DocumentJob(
+                    file_path=file_path,
+                    template=template,
+                    custom_prompt=custom_prompt,
+                    save_json=output_config["save_json"],
+                    save_markdown=output_config["save_markdown"],
+                    use_cloud=processing_options["use_cloud"],
+                    quiet=processing_options["quiet"],
+                )
             else:
                 print("Document processing cancelled.")
                 return None
@@ -332,7 +341,7 @@ def main():
     result = wizard.process_document_interactive()
     if result:
         print("\nConfiguration created:")
-        for key, value in result.items():
+        for key, value in asdict(result).items():
             print(f"  {key}: {value}")
     return result
 
@@ -0,0 +1,104 @@
+"""
+Job Descriptions for Media Knowledge Pipeline CLI Frontend
+Flat, immutable job records passed from the wizards to the command executor.
+"""
+
+import sys
+from dataclasses import dataclass
+from typing import Optional
+
+# Slotted dataclasses need Python 3.10; older interpreters get regular ones
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
+class MediaJob:
+    """Process a single YouTube URL or local media file."""
+    media_input: str
+    template: Optional[str] = None
+    custom_prompt: Optional[str] = None
+    save_json: bool = False
+    save_markdown: bool = False
+    output_path: Optional[str] = None
+    markdown_path: Optional[str] = None
+    use_cloud: bool = False
+    quiet: bool = False
+    organize: bool = True
+
+    @classmethod
+    def from_config(cls, config):
+        """Build a job from a nested media wizard configuration dict."""
+        output_config = config["output_config"]
+        processing_options = config["processing_options"]
+        return cls(
+            media_input=config["media_input"],
+            template=config["template"],
+            custom_prompt=config["custom_prompt"],
+            save_json=output_config["save_json"],
+            save_markdown=output_config["save_markdown"],
+            output_path=output_config.get("output_path"),
+            markdown_path=output_config.get("markdown_path"),
+            use_cloud=processing_options["use_cloud"],
+            quiet=processing_options["quiet"],
+            organize=processing_options["organize"],
+        )
+
+
+@dataclass(frozen=True, **_SLOTS)
+class DocumentJob:
+    """Process a single PDF, EPUB or MOBI document."""
+    file_path: str
+    template: Optional[str] = None
+    custom_prompt: Optional[str] = None
+    save_json: bool = False
+    save_markdown: bool = False
+    use_cloud: bool = False
+    quiet: bool = False
+
+    @classmethod
+    def from_config(cls, config):
+        """Build a job from a nested document wizard configuration dict."""
+        output_config = config["output_config"]
+        processing_options = config["processing_options"]
+        return cls(
+            file_path=config["file_path"],
+            template=config["template"],
+            custom_prompt=config["custom_prompt"],
+            save_json=output_config["save_json"],
+            save_markdown=output_config["save_markdown"],
+            use_cloud=processing_options["use_cloud"],
+            quiet=processing_options["quiet"],
+        )
+
+
+@dataclass(frozen=True, **_SLOTS)
+class BatchJob:
+    """Process every URL listed in a file."""
+    urls_file: str
+    output_dir: str
+    template: Optional[str] = None
+    custom_prompt: Optional[str] = None
+    parallel_workers: int = 1
+    enable_essay: bool = False
+    force_essay: bool = False
+    use_cloud: bool = False
+    quiet: bool = False
+    organize: bool = True
+
+    @classmethod
+    def from_config(cls, config):
+        """Build a job from a nested batch wizard configuration dict."""
+        essay_options = config["essay_options"]
+        processing_options = config["processing_options"]
+        return cls(
+            urls_file=config["urls_file"],
+            output_dir=config["output_dir"],
+            template=config["template"],
+            custom_prompt=config["custom_prompt"],
+            parallel_workers=config["parallel_workers"],
+            enable_essay=essay_options["enable_essay"],
+            force_essay=essay_options["force_essay"],
+            use_cloud=processing_options["use_cloud"],
+            quiet=processing_options["quiet"],
+            organize=processing_options["organize"],
+        )
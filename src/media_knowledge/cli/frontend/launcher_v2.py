@@ -3,20 +3,25 @@ Launcher for Media Knowledge Pipeline CLI Wizard System (v2)
 """
 
 import sys
-from pathlib import Path
-
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(project_root))
 
 from .main_menu_v2 import MainMenuV2
 
+# Menu reused when the wizard system is launched again in this process
+_MENU = None
+
+
+def _get_menu():
+    """Return the shared MainMenuV2, creating it on first use."""
+    global _MENU
+    if _MENU is None:
+        _MENU = MainMenuV2()
+    return _MENU
+
 def launch_v2():
     """Launch the new wizard system."""
     try:
         print("Launching Media Knowledge Pipeline Wizard System v2...")
-        menu = MainMenuV2()
-        menu.run()
+        _get_menu().run()
     except KeyboardInterrupt:
         print("\n\nExiting wizard system...")
         sys.exit(0)
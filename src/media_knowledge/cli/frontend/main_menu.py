@@ -2,7 +2,22 @@
 Main Menu System for Media Knowledge Pipeline CLI Frontend
 """
 
-from pathlib import Path
+import sys
+from functools import lru_cache
+
+from ..._bootstrap import PROJECT_ROOT
+from .shared.user_prompter import read_line
+
+
+@lru_cache(maxsize=1)
+def _load_version():
+    """Return the version from the VERSION file, read once per process."""
+    try:
+        with open(PROJECT_ROOT / "VERSION", 'r') as f:
+            return f.read().strip()
+    except (OSError, ValueError):
+        return "2.5.2"
+
 
 class MainMenuError(Exception):
     """Custom exception for main menu errors."""
@@ -12,19 +27,51 @@ class MainMenuError(Exception):
 class MainMenu:
     """Main menu system for interactive CLI frontend."""
     
+    # Title shown when the art library is not installed
+    _PLAIN_TITLE = "=" * 60 + "\n           MEDIA KNOWLEDGE PIPELINE\n" + "=" * 60 + "\n"
+    
+    # Menu entries; the last one is always Exit
+    menu_options = (
+        "Process Media Content  (Video/Audio/Document)",
+        "Batch Process Multiple Items",
+        "Create Essay from Existing Results",
+        "Generate Anki Flashcards",
+        "Scan Directory for Media Files",
+        "Watch Directory for New Files",
+        "System Status and Requirements",
+        "Show Pipeline Architecture",
+        "Exit",
+    )
+    
+    # Highest valid choice; Exit is shown as 0 and the rest are numbered from 1
+    _LAST_CHOICE = len(menu_options) - 1
+    
     def __init__(self):
         """Initialize main menu system."""
-        self.menu_options = [
-            "Process Media Content  (Video/Audio/Document)",
-            "Batch Process Multiple Items",
-            "Create Essay from Existing Results",
-            "Generate Anki Flashcards",
-            "Scan Directory for Media Files",
-            "Watch Directory for New Files", 
-            "System Status and Requirements",
-            "Show Pipeline Architecture",
-            "Exit"
-        ]
+        self._version = _load_version()
+        
+        # Numbered menu lines, built once since the options never change
+        self._rendered_menu = "\n".join(
+            f" [0] {option}" if option == "Exit" else f" [{i}] {option}"
+            for i, option in enumerate(self.menu_options, 1)
+        )
+        
+        # The whole menu screen, written with a single call on each redraw.
+        # ASCII art is displayed by the launcher, so this starts with the header.
+        self._menu_frame = "\n".join([
+            "=" * 80,
+            "                        MEDIA KNOWLEDGE PIPELINE",
+            f"                          v{self._version} - Enhanced",
+            "=" * 80,
+            "",
+            "=" * 80,
+            "",
+            " What would you like to do?",
+            "",
+            self._rendered_menu,
+            "",
+            f" Enter your choice (0-{self._LAST_CHOICE}): ",
+        ])
     
     def display_ascii_art_title(self):
         """Display the ASCII art title for the application."""
@@ -41,69 +88,33 @@ class MainMenu:
             print()
         except ImportError:
             # Fallback to simple header if art library not available
-            print("=" * 60)
-            print("           MEDIA KNOWLEDGE PIPELINE")
-            print("=" * 60)
-            print()
+            print(self._PLAIN_TITLE)
     
     def display_menu(self):
         """Display the main menu options."""
-        # ASCII art is now displayed by the launcher, so we just show the menu
-        print("=" * 80)
-        print("                        MEDIA KNOWLEDGE PIPELINE")
-        
-        # Read version from VERSION file
-        try:
-            version_path = Path(__file__).parent.parent.parent.parent.parent / "VERSION"
-            with open(version_path, 'r') as f:
-                version = f.read().strip()
-        except:
-            version = "2.5.2"
-        
-        print(f"                          v{version} - Enhanced")
-        print("=" * 80)
-        print()
-        print("=" * 80)
-        print()
-        print(" What would you like to do?")
-        print()
-        
-        # Display menu options with numbers
-        for i, option in enumerate(self.menu_options, 1):
-            if option == "Exit":
-                print(f" [0] {option}")
-            else:
-                print(f" [{i}] {option}")
-        
-        print()
-        print(" Enter your choice (0-7): ", end="")
+        sys.stdout.write(self._menu_frame)
     
     def get_user_choice(self):
         """Get and validate user input.
         
         Returns:
-            int: Valid user choice (0-7)
+            int: Valid user choice (0 to the last menu number)
             
         Raises:
             MainMenuError: If user input is invalid
         """
-        try:
-            choice = input().strip()
-            if not choice:
-                raise MainMenuError("No input provided")
-            
-            choice_num = int(choice)
-            
-            # Validate choice range
-            if choice_num == 0:
-                return 0  # Exit
-            elif 1 <= choice_num <= 7:
-                return choice_num
-            else:
-                raise MainMenuError(f"Choice must be between 0 and 7, got {choice_num}")
-                
-        except ValueError:
+        choice = read_line().strip()
+        if not choice:
+            raise MainMenuError("No input provided")
+        if not choice.isdecimal():
             raise MainMenuError(f"Invalid input: '{choice}' is not a number")
+        
+        choice_num = int(choice)
+        
+        # isdecimal() rules out a sign, so only the upper bound needs checking
+        if choice_num <= self._LAST_CHOICE:
+            return choice_num
+        raise MainMenuError(f"Choice must be between 0 and {self._LAST_CHOICE}, got {choice_num}")
     
     def run(self):
         """Run the main menu loop.
@@ -2,12 +2,9 @@
 Main Menu System for Media Knowledge Pipeline CLI Wizard System (v2)
 """
 
+import sys
 from typing import Optional
 from .shared.user_prompter import prompt_for_choice
-from .workflows.media_workflow import MediaWorkflow
-from .workflows.batch_workflow import BatchWorkflow
-from .workflows.document_workflow import DocumentWorkflow
-from .workflows.anki_workflow import AnkiWorkflow
 
 class MainMenuError(Exception):
     """Custom exception for main menu errors."""
@@ -16,29 +13,32 @@ class MainMenuError(Exception):
 class MainMenuV2:
     """Main menu system for interactive CLI frontend (v2)."""
     
-    def __init__(self):
-        """Initialize main menu system."""
-        self.menu_options = [
-            "Process Media Content  (Video/Audio)",
-            "Batch Process Multiple Items",
-            "Process Document (PDF/EPUB/MOBI)",
-            "Generate Anki Flashcards",
-            "Exit"
-        ]
+    # Title and menu header, each written with a single call
+    _TITLE = (
+        "=" * 60 + "\n"
+        "           MEDIA KNOWLEDGE PIPELINE\n"
+        "                Wizard System v2\n"
+        + "=" * 60 + "\n"
+        "\n"
+    )
+    _MENU_HEADER = _TITLE + "What would you like to do?\n\n"
+    
+    # Menu entries; the last one is always Exit
+    menu_options = (
+        "Process Media Content  (Video/Audio)",
+        "Batch Process Multiple Items",
+        "Process Document (PDF/EPUB/MOBI)",
+        "Generate Anki Flashcards",
+        "Exit",
+    )
     
     def display_title(self):
         """Display the title for the application."""
-        print("=" * 60)
-        print("           MEDIA KNOWLEDGE PIPELINE")
-        print("                Wizard System v2")
-        print("=" * 60)
-        print()
+        sys.stdout.write(self._TITLE)
     
     def display_menu(self):
         """Display the main menu options."""
-        self.display_title()
-        print("What would you like to do?")
-        print()
+        sys.stdout.write(self._MENU_HEADER)
     
     def get_user_choice(self) -> Optional[int]:
         """
@@ -64,17 +64,23 @@ class MainMenuV2:
         Returns:
             bool: True if workflow completed successfully, False otherwise
         """
+        # Workflows are imported on first use so the menu only loads the
+        # one that is actually chosen
         try:
             if choice == 1:
+                from .workflows.media_workflow import MediaWorkflow
                 workflow = MediaWorkflow()
                 return workflow.run()
             elif choice == 2:
+                from .workflows.batch_workflow import BatchWorkflow
                 workflow = BatchWorkflow()
                 return workflow.run()
             elif choice == 3:
+                from .workflows.document_workflow import DocumentWorkflow
                 workflow = DocumentWorkflow()
                 return workflow.run()
             elif choice == 4:
+                from .workflows.anki_workflow import AnkiWorkflow
                 workflow = AnkiWorkflow()
                 return workflow.run()
             else:
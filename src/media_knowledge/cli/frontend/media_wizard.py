@@ -3,12 +3,10 @@ Media Processing Wizard for Media Knowledge Pipeline CLI Frontend
 """
 
 import os
-import sys
-import re
-from pathlib import Path
-from urllib.parse import urlparse
+import stat
 
-from .main_menu import MainMenuError
+from .shared.input_validator import validate_youtube_url
+from .shared.user_prompter import YES_ANSWERS, read_line
 
 
 class MediaWizardError(Exception):
@@ -19,29 +17,73 @@ class MediaWizardError(Exception):
 class MediaWizard:
     """Wizard for processing media (YouTube videos, local audio/video files) interactively."""
     
+    # Template keys for template choices 1-6; choice 7 is a custom prompt
+    _TEMPLATE_KEYS = (
+        "lecture_summary",
+        "technical_tutorial",
+        "research_presentation",
+        "podcast_summary",
+        "basic_summary",
+        "anki_flashcards",
+    )
+    
+    # (save_json, save_markdown) for each output option
+    _OUTPUT_MAP = {1: (True, False), 2: (False, True), 3: (True, True), 4: (False, False)}
+    
+    # Section banners, each printed with a single call
+    _WIZARD_BANNER = "\n" + "=" * 50 + "\nPROCESS MEDIA WIZARD\n" + "=" * 50
+    _CONFIRM_BANNER = "\n" + "=" * 50 + "\nCONFIRMATION\n" + "=" * 50
+    
+    # Option labels shown by each selection step
+    media_types = (
+        "YouTube Video URL",
+        "Local Media File (Video/Audio)",
+    )
+    
+    templates = (
+        "Lecture Summary (Educational content)",
+        "Technical Tutorial",
+        "Research Presentation",
+        "Podcast Summary",
+        "Basic Summary",
+        "Anki Flashcards (Generate study cards)",
+        "Custom Prompt",
+    )
+    
+    output_options = (
+        "Save detailed JSON results",
+        "Save Markdown summary",
+        "Save both formats",
+        "No file output (display only)",
+    )
+    
     def __init__(self):
         """Initialize media wizard."""
-        self.media_types = [
-            "YouTube Video URL",
-            "Local Media File (Video/Audio)"
-        ]
-        
-        self.templates = [
-            "Lecture Summary (Educational content)",
-            "Technical Tutorial", 
-            "Research Presentation",
-            "Podcast Summary",
-            "Basic Summary",
-            "Anki Flashcards (Generate study cards)",
-            "Custom Prompt"
-        ]
+        # Numbered option lists, built once since the options never change
+        self._rendered_media_types = self._render(self.media_types)
+        self._rendered_templates = self._render(
+            self.templates, {1: " ← DEFAULT"}
+        )
+        self._rendered_output_options = self._render(self.output_options)
+    
+    @staticmethod
+    def _render(options, markers=None):
+        """Return numbered lines for options, ending with the back option.
         
-        self.output_options = [
-            "Save detailed JSON results",
-            "Save Markdown summary",
-            "Save both formats",
-            "No file output (display only)"
+        Args:
+            options (list): Option descriptions
+            markers (dict, optional): Text appended to the option with each number
+            
+        Returns:
+            str: Lines ready to print
+        """
+        markers = markers or {}
+        lines = [
+            f"[{i}] {option}{markers.get(i, '')}"
+            for i, option in enumerate(options, 1)
         ]
+        lines.append("[0] Back to Main Menu")
+        return "\n".join(lines)
     
     def select_media_type(self):
         """Guide user through media type selection.
@@ -53,28 +95,30 @@ class MediaWizard:
             MediaWizardError: If user cancels or invalid input
         """
         print("\nStep 1: Select Media Type")
-        for i, media_type in enumerate(self.media_types, 1):
-            print(f"[{i}] {media_type}")
-        print("[0] Back to Main Menu")
+        print(self._rendered_media_types)
         
+        # Error messages are written together with the next prompt
+        entry_prompt = "\nEnter choice (0-2): "
+        prompt = entry_prompt
         while True:
-            try:
-                choice = input("\nEnter choice (0-2): ").strip()
-                if not choice:
-                    print("Please enter a choice.")
-                    continue
-                
-                choice_num = int(choice)
-                if choice_num == 0:
-                    raise MediaWizardError("User cancelled")
-                elif choice_num == 1:
-                    return "youtube"
-                elif choice_num == 2:
-                    return "local"
-                else:
-                    print("Please enter a number between 0 and 2.")
-            except ValueError:
-                print("Please enter a valid number.")
+            choice = read_line(prompt).strip()
+            prompt = entry_prompt
+            if not choice:
+                prompt = "Please enter a choice.\n" + entry_prompt
+                continue
+            
+            if not choice.isdecimal():
+                prompt = "Please enter a valid number.\n" + entry_prompt
+                continue
+            choice_num = int(choice)
+            if choice_num == 0:
+                raise MediaWizardError("User cancelled")
+            elif choice_num == 1:
+                return "youtube"
+            elif choice_num == 2:
+                return "local"
+            else:
+                prompt = "Please enter a number between 0 and 2.\n" + entry_prompt
     
     def get_media_input(self, media_type):
         """Get and validate media input (URL or file path) from user.
@@ -95,7 +139,7 @@ class MediaWizard:
             
             while True:
                 try:
-                    url = input("> ").strip()
+                    url = read_line("> ").strip()
                     
                     if not url:
                         print("URL cannot be empty.")
@@ -122,26 +166,27 @@ class MediaWizard:
             
             while True:
                 try:
-                    file_path = input("> ").strip()
+                    file_path = read_line("> ").strip()
                     
                     if not file_path:
                         # Default to current directory with sample name
                         file_path = "./sample.mp4"
                         print(f"Using default: {file_path}")
                     
-                    # Validate file exists
-                    path_obj = Path(file_path)
-                    if not path_obj.exists():
+                    # Validate file exists, with one stat call
+                    try:
+                        st = os.stat(file_path)
+                    except FileNotFoundError:
                         print(f"File not found: {file_path}")
                         print("Please check the path and try again.")
                         continue
                     
                     # Validate it's a file (not directory)
-                    if not path_obj.is_file():
+                    if not stat.S_ISREG(st.st_mode):
                         print(f"Path is not a file: {file_path}")
                         continue
                     
-                    return str(path_obj)
+                    return file_path
                     
                 except KeyboardInterrupt:
                     raise MediaWizardError("User cancelled")
@@ -150,7 +195,7 @@ class MediaWizard:
                     print("Please try again.")
     
     def _is_valid_youtube_url(self, url):
-        """Validate YouTube URL format.
+        """Validate YouTube URL format with the shared input validator.
         
         Args:
             url (str): URL to validate
@@ -158,24 +203,7 @@ class MediaWizard:
         Returns:
             bool: True if valid YouTube URL, False otherwise
         """
-        try:
-            parsed = urlparse(url)
-            if not all([parsed.scheme, parsed.netloc]):
-                return False
-            
-            # Check if it's a YouTube domain
-            if "youtube.com" not in parsed.netloc and "youtu.be" not in parsed.netloc:
-                return False
-            
-            # Check if it has the required path components for YouTube
-            if "youtube.com" in parsed.netloc:
-                return "watch" in parsed.path or "embed" in parsed.path
-            elif "youtu.be" in parsed.netloc:
-                return len(parsed.path) > 1  # Should have a video ID
-            
-            return True
-        except Exception:
-            return False
+        return validate_youtube_url(url)
     
     def select_template(self):
         """Guide user through template selection.
@@ -185,38 +213,30 @@ class MediaWizard:
         """
         print("\nStep 3: Select Processing Template")
         print("Available Templates:")
-        for i, template in enumerate(self.templates, 1):
-            marker = " ← DEFAULT" if i == 1 else ""
-            print(f"[{i}] {template}{marker}")
-        print("[0] Back to Main Menu")
+        print(self._rendered_templates)
         
+        # Error messages are written together with the next prompt
+        entry_prompt = "\nEnter choice (0-7): "
+        prompt = entry_prompt
         while True:
-            try:
-                choice = input("\nEnter choice (0-7): ").strip()
-                if not choice:
-                    print("Using default template: lecture_summary")
-                    return "lecture_summary"
-                
-                choice_num = int(choice)
-                if choice_num == 0:
-                    raise MediaWizardError("User cancelled")
-                elif 1 <= choice_num <= 6:
-                    # Map to template keys
-                    template_keys = [
-                        "lecture_summary",
-                        "technical_tutorial", 
-                        "research_presentation",
-                        "podcast_summary",
-                        "basic_summary",
-                        "anki_flashcards"
-                    ]
-                    return template_keys[choice_num - 1]
-                elif choice_num == 7:
-                    return "custom"
-                else:
-                    print("Please enter a number between 0 and 7.")
-            except ValueError:
-                print("Please enter a valid number.")
+            choice = read_line(prompt).strip()
+            prompt = entry_prompt
+            if not choice:
+                print("Using default template: lecture_summary")
+                return "lecture_summary"
+            
+            if not choice.isdecimal():
+                prompt = "Please enter a valid number.\n" + entry_prompt
+                continue
+            choice_num = int(choice)
+            if choice_num == 0:
+                raise MediaWizardError("User cancelled")
+            elif 1 <= choice_num <= 6:
+                return self._TEMPLATE_KEYS[choice_num - 1]
+            elif choice_num == 7:
+                return "custom"
+            else:
+                prompt = "Please enter a number between 0 and 7.\n" + entry_prompt
     
     def get_custom_prompt(self):
         """Get custom prompt from user if selected.
@@ -229,7 +249,7 @@ class MediaWizard:
         
         while True:
             try:
-                prompt = input("> ").strip()
+                prompt = read_line("> ").strip()
                 if prompt:
                     return prompt
                 else:
@@ -245,31 +265,34 @@ class MediaWizard:
             dict: Output configuration
         """
         print("\nStep 4: Output Options")
-        for i, option in enumerate(self.output_options, 1):
-            print(f"[{i}] {option}")
-        print("[0] Back to Main Menu")
+        print(self._rendered_output_options)
         
+        # Error messages are written together with the next prompt
+        entry_prompt = "\nEnter choice (0-4): "
+        prompt = entry_prompt
         while True:
-            try:
-                choice = input("\nEnter choice (0-4): ").strip()
-                if not choice:
-                    print("Using default: Save both formats")
-                    choice_num = 3
-                else:
-                    choice_num = int(choice)
-                
-                if choice_num == 0:
-                    raise MediaWizardError("User cancelled")
-                elif 1 <= choice_num <= 4:
-                    return {
-                        "save_json": choice_num in [1, 3],
-                        "save_markdown": choice_num in [2, 3],
-                        "output_type": choice_num
-                    }
-                else:
-                    print("Please enter a number between 0 and 4.")
-            except ValueError:
-                print("Please enter a valid number.")
+            choice = read_line(prompt).strip()
+            prompt = entry_prompt
+            if not choice:
+                print("Using default: Save both formats")
+                choice_num = 3
+            else:
+                if not choice.isdecimal():
+                    prompt = "Please enter a valid number.\n" + entry_prompt
+                    continue
+                choice_num = int(choice)
+            
+            if choice_num == 0:
+                raise MediaWizardError("User cancelled")
+            elif 1 <= choice_num <= 4:
+                save_json, save_markdown = self._OUTPUT_MAP[choice_num]
+                return {
+                    "save_json": save_json,
+                    "save_markdown": save_markdown,
+                    "output_type": choice_num
+                }
+            else:
+                prompt = "Please enter a number between 0 and 4.\n" + entry_prompt
     
     def get_processing_options(self):
         """Get additional processing options.
@@ -280,12 +303,12 @@ class MediaWizard:
         print("\nStep 5: Processing Options")
         
         # Cloud processing option
-        cloud_choice = input("Use cloud models for processing? (Requires internet) [y/N]: ").strip().lower()
-        use_cloud = cloud_choice in ['y', 'yes']
+        cloud_choice = read_line("Use cloud models for processing? (Requires internet) [y/N]: ").strip()
+        use_cloud = cloud_choice in YES_ANSWERS
         
         # Quiet mode option
-        quiet_choice = input("Run in quiet mode? (Less verbose output) [y/N]: ").strip().lower()
-        quiet_mode = quiet_choice in ['y', 'yes']
+        quiet_choice = read_line("Run in quiet mode? (Less verbose output) [y/N]: ").strip()
+        quiet_mode = quiet_choice in YES_ANSWERS
         
         return {
             "use_cloud": use_cloud,
@@ -307,9 +330,7 @@ class MediaWizard:
         Returns:
             bool: True if user confirms, False if cancelled
         """
-        print("\n" + "=" * 50)
-        print("CONFIRMATION")
-        print("=" * 50)
+        print(self._CONFIRM_BANNER)
         
         media_label = "YouTube URL" if media_type == "youtube" else "Local File"
         print(f"Media: {media_label}")
@@ -332,9 +353,9 @@ class MediaWizard:
         print(f"  - Organize output: {'Yes' if processing_options['organize'] else 'No'}")
         
         print("\nReady to process! Press ENTER to begin or 'q' to cancel:")
-        choice = input("> ").strip().lower()
+        choice = read_line("> ").strip()
         
-        return choice != 'q'
+        return choice not in ("q", "Q")
     
     def process_media_interactive(self):
         """Main interactive media processing flow.
@@ -343,9 +364,7 @@ class MediaWizard:
             dict: Processing configuration or None if cancelled
         """
         try:
-            print("\n" + "=" * 50)
-            print("PROCESS MEDIA WIZARD")
-            print("=" * 50)
+            print(self._WIZARD_BANNER)
             
             # Step 1: Select media type
             media_type = self.select_media_type()
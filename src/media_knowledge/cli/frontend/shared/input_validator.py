@@ -2,10 +2,29 @@
 Input validation utilities for Media Knowledge Pipeline CLI Wizard System
 """
 
+import os
 import re
-from pathlib import Path
+import stat
+import time
+from functools import lru_cache
 from typing import Union
 
+# YouTube watch, embed and short links followed by an 11 character video ID.
+# Mobile (m.youtube.com) links are accepted as well as www and bare hosts.
+_YOUTUBE_RE = re.compile(
+    r'(?:https?://)?(?:www\.|m\.)?(?:youtube\.com/(?:watch\?v=|embed/)|'
+    r'youtu\.be/)([a-zA-Z0-9_-]{11})'
+)
+
+@lru_cache(maxsize=128)
+def _matches_youtube_url(url: str) -> bool:
+    """Return whether a string matches the YouTube URL pattern."""
+    # Both YouTube hosts contain "youtu", so most other input skips the pattern
+    if "youtu" not in url:
+        return False
+    
+    return bool(_YOUTUBE_RE.match(url))
+
 def validate_youtube_url(url: str) -> bool:
     """
     Validate YouTube URL format.
@@ -19,13 +38,30 @@ def validate_youtube_url(url: str) -> bool:
     if not url or not isinstance(url, str):
         return False
     
-    # Regular expression for YouTube URLs
-    youtube_regex = (
-        r'(?:https?://)?(?:www\.)?(?:youtube\.com/(?:watch\?v=|embed/)|'
-        r'youtu\.be/)([a-zA-Z0-9_-]{11})'
-    )
+    # Retries in the wizards often re-submit the same text, so matches are cached
+    return _matches_youtube_url(url)
+
+# Seconds a validate_file_path result may be reused without a new stat call
+_STAT_CACHE_TTL = 2.0
+
+@lru_cache(maxsize=256)
+def _cached_is_file(file_path: str, period: int) -> bool:
+    """
+    Return whether a path is a regular file.
     
-    return bool(re.match(youtube_regex, url))
+    The time period is part of the cache key, so results (including
+    "not found") are reused for at most ``_STAT_CACHE_TTL`` seconds.
+    """
+    # One stat call answers both "exists" and "is a regular file"
+    try:
+        st = os.stat(file_path)
+    except (OSError, ValueError):
+        return False
+    return stat.S_ISREG(st.st_mode)
+
+def clear_file_path_cache() -> None:
+    """Forget cached validate_file_path results after files are created or moved."""
+    _cached_is_file.cache_clear()
 
 def validate_file_path(file_path: str) -> bool:
     """
@@ -40,11 +76,7 @@ def validate_file_path(file_path: str) -> bool:
     if not file_path or not isinstance(file_path, str):
         return False
     
-    try:
-        path_obj = Path(file_path)
-        return path_obj.exists() and path_obj.is_file()
-    except Exception:
-        return False
+    return _cached_is_file(file_path, int(time.monotonic() // _STAT_CACHE_TTL))
 
 def validate_number_range(value: Union[str, int], min_val: int, max_val: int) -> bool:
     """
@@ -64,13 +96,17 @@ def validate_number_range(value: Union[str, int], min_val: int, max_val: int) ->
     except (ValueError, TypeError):
         return False
 
-def validate_file_format(file_path: str, allowed_extensions: list) -> bool:
+def validate_file_format(file_path: str, allowed_extensions) -> bool:
     """
     Validate that a file has an allowed extension.
     
+    The extension is taken with ``os.path.splitext`` rather than through a
+    ``Path`` object, which matters when many paths are checked in a row.
+    
     Args:
         file_path (str): File path to validate
-        allowed_extensions (list): List of allowed extensions (e.g., ['.pdf', '.epub'])
+        allowed_extensions: Lowercase extensions including the dot
+            (e.g., ``frozenset({'.pdf', '.epub'})``); any container works
         
     Returns:
         bool: True if file has allowed extension, False otherwise
@@ -78,10 +114,6 @@ def validate_file_format(file_path: str, allowed_extensions: list) -> bool:
     if not file_path or not isinstance(file_path, str):
         return False
     
-    try:
-        path_obj = Path(file_path)
-        return path_obj.suffix.lower() in allowed_extensions
-    except Exception:
-        return False
+    return os.path.splitext(file_path)[1].lower() in allowed_extensions
 
 # Additional validators can be added here as needed
\ No newline at end of file
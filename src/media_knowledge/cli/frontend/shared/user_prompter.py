@@ -2,7 +2,137 @@
 Standardized user prompting utilities for Media Knowledge Pipeline CLI Wizard System
 """
 
-from typing import List, Optional, Union
+import os
+import select
+import sys
+from functools import lru_cache
+from typing import List, Optional, Set, Tuple, Union
+
+# Answers accepted at yes/no prompts, in the casings people type, so
+# replies can be matched without lower-casing them first
+YES_ANSWERS = frozenset({"y", "yes", "Y", "Yes", "YES"})
+NO_ANSWERS = frozenset({"n", "no", "N", "No", "NO"})
+
+# Returned by prompt_for_choice_async when no answer arrives before the timeout
+PROMPT_TIMEOUT = object()
+
+# Standard input object last checked by _stdin_is_piped, and the result
+_STDIN_MODE = (None, False)
+
+
+def _stdin_is_piped() -> bool:
+    """Return True when standard input is a real file or pipe rather than a terminal.
+    
+    The answer is remembered for the current ``sys.stdin`` object. Streams
+    without a file descriptor, such as replacements installed by test
+    runners or IDE consoles, count as interactive.
+    """
+    global _STDIN_MODE
+    stdin = sys.stdin
+    if _STDIN_MODE[0] is not stdin:
+        try:
+            piped = not stdin.isatty() and stdin.fileno() >= 0
+        except (AttributeError, OSError, ValueError):
+            piped = False
+        _STDIN_MODE = (stdin, piped)
+    return _STDIN_MODE[1]
+
+
+def read_line(prompt_text: str = "") -> str:
+    """
+    Show a prompt and return the line entered, without its newline.
+    
+    In a terminal this is ``input()``, which keeps line editing. For piped
+    or redirected input the prompt is written directly and the line read
+    with ``sys.stdin.readline()``.
+    
+    Args:
+        prompt_text (str): Prompt text
+        
+    Returns:
+        str: The line read from standard input
+        
+    Raises:
+        EOFError: If standard input is exhausted
+    """
+    if not _stdin_is_piped():
+        return input(prompt_text)
+    
+    sys.stdout.write(prompt_text)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError("End of input")
+    return line.rstrip("\n")
+
+
+@lru_cache(maxsize=32)
+def _render_options(options: Tuple[str, ...], allow_cancel: bool, cancel_label: str) -> str:
+    """Return the numbered option lines shown by prompt_for_choice."""
+    lines = [f"[{i}] {option}" for i, option in enumerate(options, 1)]
+    if allow_cancel:
+        lines.append(f"[0] {cancel_label}")
+    return "\n".join(lines)
+
+
+def _show_options(prompt_text: str, options: List[str], allow_cancel: bool, cancel_label: str) -> None:
+    """Print the prompt text followed by the numbered options."""
+    print(f"\n{prompt_text}")
+    
+    # Display options, followed by the cancel option if allowed
+    rendered = _render_options(tuple(options), allow_cancel, cancel_label)
+    if rendered:
+        print(rendered)
+
+
+def _parse_choice(choice: str, count: int, allow_cancel: bool) -> Tuple[Optional[int], Optional[str]]:
+    """
+    Check one answer to a numbered choice prompt.
+    
+    Args:
+        choice (str): Stripped user input
+        count (int): Number of options
+        allow_cancel (bool): Whether 0 cancels
+        
+    Returns:
+        Tuple[Optional[int], Optional[str]]: The selected option (None if
+        cancelled) and None, or None and the message to show before asking again
+    """
+    if not choice:
+        return None, "Please enter a choice."
+    if not choice.isdecimal():
+        return None, "Please enter a valid number."
+    choice_num = int(choice)
+    
+    # Handle cancellation
+    if choice_num == 0 and allow_cancel:
+        return None, None
+    
+    # Validate choice range
+    if 1 <= choice_num <= count:
+        return choice_num, None
+    return None, f"Please enter a number between {'0 and' if allow_cancel else '1 and'} {count}."
+
+
+def _stdin_has_line(timeout: Optional[float]) -> bool:
+    """
+    Wait up to ``timeout`` seconds for a line typed at the terminal.
+    
+    Only terminals are waited on: piped input may already sit in the
+    ``sys.stdin`` buffer where ``select`` cannot see it, and Windows
+    consoles do not support ``select``. In those cases, and when
+    ``timeout`` is None, this returns True and the caller reads (and
+    blocks) as usual.
+    """
+    if timeout is None or os.name == "nt" or _stdin_is_piped():
+        return True
+    try:
+        readable, _, _ = select.select([sys.stdin], [], [], timeout)
+    except (OSError, TypeError, ValueError):
+        # Replacement streams without a file descriptor
+        return True
+    return bool(readable)
+
 
 def prompt_for_choice(
     prompt_text: str, 
@@ -22,38 +152,123 @@ def prompt_for_choice(
     Returns:
         Optional[int]: Selected option index (1-based) or None if cancelled
     """
-    print(f"\n{prompt_text}")
+    _show_options(prompt_text, options, allow_cancel, cancel_label)
     
-    # Display options
-    for i, option in enumerate(options, 1):
-        print(f"[{i}] {option}")
+    count = len(options)
+    entry_prompt = "\nEnter choice: "
+    prompt = entry_prompt
     
-    # Display cancel option if allowed
-    if allow_cancel:
-        print(f"[0] {cancel_label}")
+    while True:
+        try:
+            choice = read_line(prompt).strip()
+        except KeyboardInterrupt:
+            return None
+        
+        choice_num, error = _parse_choice(choice, count, allow_cancel)
+        if error is None:
+            return choice_num
+        
+        # Error messages are written together with the next prompt
+        prompt = f"{error}\n{entry_prompt}"
+
+
+def prompt_for_choice_async(
+    prompt_text: str,
+    options: List[str],
+    allow_cancel: bool = True,
+    cancel_label: str = "Back to Main Menu",
+    timeout: Optional[float] = None,
+    show_prompt: bool = True
+) -> Union[int, None, object]:
+    """
+    Prompt user to select from a list of options without blocking indefinitely.
+    
+    When no answer is typed within ``timeout`` seconds, ``PROMPT_TIMEOUT``
+    is returned so the caller can service other work (progress updates,
+    watchers) and then call again with ``show_prompt=False`` to keep
+    waiting on the same prompt. Piped input is read without waiting.
+    
+    Args:
+        prompt_text (str): Text to display before options
+        options (List[str]): List of option descriptions
+        allow_cancel (bool): Whether to allow cancellation
+        cancel_label (str): Label for cancel option
+        timeout (Optional[float]): Seconds to wait for each answer, or None
+            to wait like prompt_for_choice
+        show_prompt (bool): Whether to display the options and prompt first
+        
+    Returns:
+        Union[int, None, object]: Selected option index (1-based), None if
+        cancelled, or PROMPT_TIMEOUT if no answer arrived in time
+    """
+    count = len(options)
+    entry_prompt = "\nEnter choice: "
+    prompt = ""
+    if show_prompt:
+        _show_options(prompt_text, options, allow_cancel, cancel_label)
+        prompt = entry_prompt
     
     while True:
+        if prompt:
+            sys.stdout.write(prompt)
+            sys.stdout.flush()
         try:
-            choice = input("\nEnter choice: ").strip()
-            if not choice:
-                print("Please enter a choice.")
-                continue
-            
-            choice_num = int(choice)
-            
-            # Handle cancellation
-            if choice_num == 0 and allow_cancel:
-                return None
-            
-            # Validate choice range
-            if 1 <= choice_num <= len(options):
-                return choice_num
-            else:
-                print(f"Please enter a number between {'0 and' if allow_cancel else '1 and'} {len(options)}.")
-        except ValueError:
-            print("Please enter a valid number.")
+            if not _stdin_has_line(timeout):
+                return PROMPT_TIMEOUT
+            choice = read_line().strip()
+        except KeyboardInterrupt:
+            return None
+        
+        choice_num, error = _parse_choice(choice, count, allow_cancel)
+        if error is None:
+            return choice_num
+        
+        # Error messages are written together with the next prompt
+        prompt = f"{error}\n{entry_prompt}"
+
+
+def prompt_for_multiselect(
+    prompt_text: str,
+    options: List[str],
+    defaults: Tuple[int, ...] = ()
+) -> Optional[Set[int]]:
+    """
+    Prompt user to turn on any number of options with a single answer.
+    
+    Options are entered as numbers separated by spaces or commas. An empty
+    answer keeps the defaults and 0 turns every option off.
+    
+    Args:
+        prompt_text (str): Text to display before options
+        options (List[str]): List of option descriptions
+        defaults (Tuple[int, ...]): Option numbers (1-based) on by default
+        
+    Returns:
+        Optional[Set[int]]: Selected option numbers (1-based) or None if cancelled
+    """
+    _show_options(prompt_text, options, False, "")
+    
+    count = len(options)
+    default_text = ", ".join(map(str, defaults)) or "none"
+    entry_prompt = f"\nEnter numbers to turn on (Enter for {default_text}, 0 for none): "
+    prompt = entry_prompt
+    
+    while True:
+        try:
+            answer = read_line(prompt).replace(",", " ").split()
         except KeyboardInterrupt:
             return None
+        
+        if not answer:
+            return set(defaults)
+        if answer == ["0"]:
+            return set()
+        if all(token.isdecimal() and 1 <= int(token) <= count for token in answer):
+            return {int(token) for token in answer}
+        
+        # Error messages are written together with the next prompt
+        prompt = f"Please enter numbers between 1 and {count}.\n{entry_prompt}"
+
 
 def prompt_for_text(
     prompt_text: str, 
@@ -75,7 +290,7 @@ def prompt_for_text(
     
     while True:
         try:
-            user_input = input("> ").strip()
+            user_input = read_line("> ").strip()
             
             # Handle empty input
             if not user_input:
@@ -99,17 +314,15 @@ def prompt_for_confirmation(prompt_text: str) -> Optional[bool]:
     Returns:
         Optional[bool]: True for yes, False for no, None if cancelled
     """
-    print(f"\n{prompt_text}")
-    print("[y] Yes")
-    print("[n] No")
+    print(f"\n{prompt_text}\n[y] Yes\n[n] No")
     
     while True:
         try:
-            choice = input("\nEnter choice (y/n): ").strip().lower()
+            choice = read_line("\nEnter choice (y/n): ").strip()
             
-            if choice in ['y', 'yes']:
+            if choice in YES_ANSWERS:
                 return True
-            elif choice in ['n', 'no']:
+            elif choice in NO_ANSWERS:
                 return False
             else:
                 print("Please enter 'y' for yes or 'n' for no.")
@@ -137,20 +350,22 @@ def prompt_for_number(
     
     while True:
         try:
-            user_input = input("> ").strip()
+            user_input = read_line("> ").strip()
             
             if not user_input:
                 print("Please enter a number.")
                 continue
             
+            digits = user_input[1:] if user_input[0] in "+-" else user_input
+            if not digits.isdecimal():
+                print("Please enter a valid number.")
+                continue
             num = int(user_input)
             
             if min_val <= num <= max_val:
                 return num
             else:
                 print(f"Please enter a number between {min_val} and {max_val}.")
-        except ValueError:
-            print("Please enter a valid number.")
         except KeyboardInterrupt:
             return None
 
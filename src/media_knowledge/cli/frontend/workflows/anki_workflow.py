@@ -2,11 +2,12 @@
 Anki Generation Workflow for Media Knowledge Pipeline CLI Wizard System
 """
 
-from typing import Dict, Any, Optional
+from typing import Optional
 from pathlib import Path
 from .base_workflow import BaseWorkflow
 from ..shared.input_validator import validate_file_path
-from ..shared.user_prompter import prompt_for_text, prompt_for_confirmation
+from ..shared.user_prompter import prompt_for_choice, prompt_for_text
+from ..command_executor import get_executor
 
 class AnkiWorkflowError(Exception):
     """Custom exception for Anki workflow errors."""
@@ -15,6 +16,8 @@ class AnkiWorkflowError(Exception):
 class AnkiWorkflow(BaseWorkflow):
     """Workflow for generating Anki flashcards from JSON results."""
     
+    __slots__ = ()
+    
     def __init__(self):
         """Initialize Anki workflow."""
         super().__init__()
@@ -29,30 +32,35 @@ class AnkiWorkflow(BaseWorkflow):
         """
         try:
             self.display_header("Anki Flashcard Generation Wizard")
+            self.resume_saved_config()
             
             # Step 1: Get JSON source
-            self.display_step(1, "Select JSON Source")
-            json_source = self.get_json_source()
-            if json_source is None:
-                return False
+            if "json_source" not in self.config:
+                self.display_step(1, "Select JSON Source")
+                json_source = self.get_json_source()
+                if json_source is None:
+                    return False
             
             # Step 2: Configure deck name
-            self.display_step(2, "Configure Deck Name")
-            deck_name = self.get_deck_name()
-            if deck_name is None:
-                return False
+            if "deck_name" not in self.config:
+                self.display_step(2, "Configure Deck Name")
+                deck_name = self.get_deck_name()
+                if deck_name is None:
+                    return False
             
             # Step 3: Choose preview or generate
-            self.display_step(3, "Preview or Generate")
-            preview_mode = self.preview_or_generate()
-            if preview_mode is None:
-                return False
+            if "preview_mode" not in self.config:
+                self.display_step(3, "Preview or Generate")
+                preview_mode = self.preview_or_generate()
+                if preview_mode is None:
+                    return False
             
             # Step 4: Select output directory
-            self.display_step(4, "Output Directory")
-            output_dir = self.get_output_directory()
-            if output_dir is None:
-                return False
+            if "output_dir" not in self.config:
+                self.display_step(4, "Output Directory")
+                output_dir = self.get_output_directory()
+                if output_dir is None:
+                    return False
             
             # Step 5: Confirm and execute
             self.display_step(5, "Review & Execute")
@@ -124,8 +132,6 @@ class AnkiWorkflow(BaseWorkflow):
         Returns:
             Optional[bool]: True for preview mode, False for generate mode, None if cancelled
         """
-        from ..shared.user_prompter import prompt_for_choice
-        
         options = [
             "Preview flashcards (view before generating)",
             "Generate flashcards (create Anki deck file)"
@@ -186,18 +192,17 @@ class AnkiWorkflow(BaseWorkflow):
         try:
             print("\nExecuting Anki generation...")
             
-            # Import and use the existing command executor
-            from ..command_executor import CommandExecutor
-            executor = CommandExecutor()
+            executor = get_executor()
             
             # Prepare configuration for the executor
+            cfg = self.config
             config = {
-                "input_file": self.get_config("json_source"),
-                "deck_name": self.get_config("deck_name")
+                "input_file": cfg.get("json_source"),
+                "deck_name": cfg.get("deck_name")
             }
             
             # Check if we're in preview mode
-            preview_mode = self.get_config("preview_mode", False)
+            preview_mode = cfg.get("preview_mode", False)
             if preview_mode:
                 print("Preview mode: Anki flashcard generation would be executed here.")
                 print("In a full implementation, this would show sample flashcards.")
@@ -3,8 +3,20 @@ Base workflow class for Media Knowledge Pipeline CLI Wizard System
 """
 
 from abc import ABC, abstractmethod
+from pathlib import Path
 from typing import Dict, Any, Optional
+import json
+import os
 import sys
+import tempfile
+
+from ..shared import user_prompter
+
+# Rule drawn above and below workflow headers
+_RULE = "=" * 60
+
+# Answers collected by the last unfinished workflow, so it can be resumed
+_STATE_FILE = Path.home() / ".cache" / "media_knowledge" / "wizard_state.json"
 
 class WorkflowError(Exception):
     """Custom exception for workflow errors."""
@@ -13,10 +25,33 @@ class WorkflowError(Exception):
 class BaseWorkflow(ABC):
     """Base class for all wizard workflows."""
     
+    # Workflows are created afresh from the menu loop and carry only these
+    # attributes, so instances skip the per-instance __dict__
+    __slots__ = ("workflow_name", "config", "_save_state")
+    
+    # Template labels and the matching template keys, set by workflows
+    # that have a template step
+    templates = ()
+    _TEMPLATE_KEYS = ()
+    
+    # Processing switches, asked together in one prompt
+    _PROCESSING_OPTIONS = (
+        "Use cloud processing (faster but requires internet)",
+        "Quiet mode (minimal output)",
+        "Organize output files (create subdirectories)",
+    )
+    
     def __init__(self):
         """Initialize base workflow."""
         self.workflow_name = "Base Workflow"
         self.config = {}
+        
+        # Only interactive runs are saved and offered for resume, so piped
+        # or scripted input always walks through every step
+        try:
+            self._save_state = sys.stdin.isatty()
+        except (AttributeError, ValueError):
+            self._save_state = False
     
     @abstractmethod
     def run(self) -> bool:
@@ -35,9 +70,7 @@ class BaseWorkflow(ABC):
         Args:
             title (str): Title to display
         """
-        print("\n" + "=" * 60)
-        print(f"        {title.upper()}")
-        print("=" * 60)
+        print(f"\n{_RULE}\n        {title.upper()}\n{_RULE}")
     
     def display_step(self, step_num: int, step_title: str) -> None:
         """
@@ -58,6 +91,59 @@ class BaseWorkflow(ABC):
             value (Any): Configuration value
         """
         self.config[key] = value
+        if self._save_state:
+            self._write_state()
+    
+    def _write_state(self) -> None:
+        """Save the collected configuration to the state file, replacing it atomically."""
+        try:
+            _STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=_STATE_FILE.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump({"workflow": self.workflow_name, "config": self.config}, f)
+                os.replace(tmp_path, _STATE_FILE)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError):
+            pass
+    
+    def resume_saved_config(self) -> bool:
+        """
+        Offer to restore the answers saved by an unfinished run of this workflow.
+        
+        Steps whose configuration key is already present are skipped by ``run()``.
+        
+        Returns:
+            bool: True if saved answers were restored, False otherwise
+        """
+        if not self._save_state:
+            return False
+        
+        try:
+            with open(_STATE_FILE, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return False
+        
+        if (not isinstance(state, dict) or state.get("workflow") != self.workflow_name
+                or not isinstance(state.get("config"), dict) or not state["config"]):
+            return False
+        
+        if user_prompter.prompt_for_confirmation("Resume the answers from your last unfinished run?"):
+            self.config.update(state["config"])
+            return True
+        
+        self.clear_saved_config()
+        return False
+    
+    def clear_saved_config(self) -> None:
+        """Remove the saved configuration once it is no longer needed."""
+        try:
+            _STATE_FILE.unlink()
+        except OSError:
+            pass
     
     def get_config(self, key: str, default: Any = None) -> Any:
         """
@@ -72,6 +158,59 @@ class BaseWorkflow(ABC):
         """
         return self.config.get(key, default)
     
+    def select_template(self) -> Optional[str]:
+        """
+        Guide user through template selection.
+        
+        Returns:
+            Optional[str]: Selected template or None if cancelled
+        """
+        choice = user_prompter.prompt_for_choice(
+            "Select processing template:",
+            self.templates,
+            allow_cancel=True
+        )
+        
+        if choice is None or not 1 <= choice <= len(self._TEMPLATE_KEYS):
+            return None
+        
+        template_name = self._TEMPLATE_KEYS[choice - 1]
+        
+        # Handle custom prompt
+        if template_name == "custom":
+            custom_prompt = user_prompter.prompt_for_text("Enter your custom prompt:")
+            if custom_prompt is None:
+                return None
+            self.collect_config("custom_prompt", custom_prompt)
+        
+        # Saved last, so a resumed run only skips a fully answered step
+        self.collect_config("template", template_name)
+        return template_name
+    
+    def get_processing_options(self) -> Optional[Dict[str, Any]]:
+        """
+        Get processing options from user.
+        
+        Returns:
+            Optional[Dict[str, Any]]: Processing options or None if cancelled
+        """
+        selected = user_prompter.prompt_for_multiselect(
+            "Configure processing options:",
+            self._PROCESSING_OPTIONS,
+            defaults=(3,)
+        )
+        if selected is None:
+            return None
+        
+        options = {
+            "use_cloud": 1 in selected,
+            "quiet": 2 in selected,
+            "organize": 3 in selected
+        }
+        
+        self.collect_config("processing_options", options)
+        return options
+    
     def confirm_and_execute(self) -> bool:
         """
         Confirm configuration and execute workflow.
@@ -79,18 +218,18 @@ class BaseWorkflow(ABC):
         Returns:
             bool: True if user confirms and executes, False if cancelled
         """
-        from ..shared.user_prompter import prompt_for_confirmation
-        
-        print("\nConfiguration Summary:")
-        print("-" * 30)
-        for key, value in self.config.items():
-            print(f"{key}: {value}")
+        # Build the whole summary first so it is written with a single call
+        summary = [f"{key}: {value}" for key, value in self.config.items()]
+        print("\n".join(["\nConfiguration Summary:", "-" * 30, *summary]))
         
         # Ask for confirmation
-        confirm = prompt_for_confirmation("\nDo you want to proceed with these settings?")
+        confirm = user_prompter.prompt_for_confirmation("\nDo you want to proceed with these settings?")
         
         if confirm:
-            return self.execute()
+            success = self.execute()
+            if success:
+                self.clear_saved_config()
+            return success
         else:
             print("Operation cancelled.")
             return False
@@ -3,10 +3,10 @@ Document Processing Workflow for Media Knowledge Pipeline CLI Wizard System
 """
 
 from typing import Dict, Any, Optional
-from pathlib import Path
 from .base_workflow import BaseWorkflow
 from ..shared.input_validator import validate_file_path, validate_file_format
-from ..shared.user_prompter import prompt_for_text, prompt_for_confirmation
+from ..shared.user_prompter import prompt_for_choice, prompt_for_text
+from ..command_executor import get_executor
 
 class DocumentWorkflowError(Exception):
     """Custom exception for document workflow errors."""
@@ -15,11 +15,36 @@ class DocumentWorkflowError(Exception):
 class DocumentWorkflow(BaseWorkflow):
     """Workflow for processing documents (PDF, EPUB, MOBI files)."""
     
+    __slots__ = ()
+    
+    # Supported extensions, in the order they are listed to the user
+    allowed_formats = (".pdf", ".epub", ".mobi")
+    _FORMAT_SET = frozenset(allowed_formats)
+    
+    # Template keys in the same order as templates
+    _TEMPLATE_KEYS = (
+        "academic_paper_summary",
+        "book_chapter_summary",
+        "research_article_analysis",
+        "technical_documentation",
+        "basic_summary",
+        "custom",
+    )
+    
+    # Template labels shown in the selection step
+    templates = (
+        "Academic Paper Summary",
+        "Book Chapter Summary",
+        "Research Article Analysis",
+        "Technical Documentation",
+        "Basic Summary",
+        "Custom Prompt",
+    )
+    
     def __init__(self):
         """Initialize document workflow."""
         super().__init__()
         self.workflow_name = "Document Processing Workflow"
-        self.allowed_formats = ['.pdf', '.epub', '.mobi']
 
     def run(self) -> bool:
         """
@@ -30,30 +55,35 @@ class DocumentWorkflow(BaseWorkflow):
         """
         try:
             self.display_header("Document Processing Wizard")
+            self.resume_saved_config()
             
             # Step 1: Get document file
-            self.display_step(1, "Select Document File")
-            document_file = self.get_document_file()
-            if document_file is None:
-                return False
+            if "document_file" not in self.config:
+                self.display_step(1, "Select Document File")
+                document_file = self.get_document_file()
+                if document_file is None:
+                    return False
             
             # Step 2: Select template
-            self.display_step(2, "Select Processing Template")
-            template = self.select_template()
-            if template is None:
-                return False
+            if "template" not in self.config:
+                self.display_step(2, "Select Processing Template")
+                template = self.select_template()
+                if template is None:
+                    return False
             
             # Step 3: Get processing options
-            self.display_step(3, "Processing Options")
-            processing_options = self.get_processing_options()
-            if processing_options is None:
-                return False
+            if "processing_options" not in self.config:
+                self.display_step(3, "Processing Options")
+                processing_options = self.get_processing_options()
+                if processing_options is None:
+                    return False
             
             # Step 4: Get output options
-            self.display_step(4, "Output Options")
-            output_options = self.get_output_options()
-            if output_options is None:
-                return False
+            if "output_config" not in self.config:
+                self.display_step(4, "Output Options")
+                output_options = self.get_output_options()
+                if output_options is None:
+                    return False
             
             # Step 5: Confirm and execute
             self.display_step(5, "Review & Execute")
@@ -78,102 +108,19 @@ class DocumentWorkflow(BaseWorkflow):
             if file_path is None:  # User cancelled
                 return None
             
+            # Check the format first; it needs no filesystem access
+            if not validate_file_format(file_path, self._FORMAT_SET):
+                print(f"Unsupported file format. Supported formats: {', '.join(self.allowed_formats)}")
+                continue
+            
             # Check if file exists
             if not validate_file_path(file_path):
                 print("File not found. Please check the path and try again.")
                 continue
             
-            # Check if file format is supported
-            if not validate_file_format(file_path, self.allowed_formats):
-                print(f"Unsupported file format. Supported formats: {', '.join(self.allowed_formats)}")
-                continue
-            
             self.collect_config("document_file", file_path)
             return file_path
 
-    def select_template(self) -> Optional[str]:
-        """
-        Guide user through template selection.
-        
-        Returns:
-            Optional[str]: Selected template or None if cancelled
-        """
-        templates = [
-            "Academic Paper Summary",
-            "Book Chapter Summary",
-            "Research Article Analysis",
-            "Technical Documentation",
-            "Basic Summary",
-            "Custom Prompt"
-        ]
-        
-        from ..shared.user_prompter import prompt_for_choice
-        
-        choice = prompt_for_choice(
-            "Select processing template:",
-            templates,
-            allow_cancel=True
-        )
-        
-        if choice is None:
-            return None
-        elif 1 <= choice <= len(templates):
-            template_map = {
-                1: "academic_paper_summary",
-                2: "book_chapter_summary",
-                3: "research_article_analysis",
-                4: "technical_documentation",
-                5: "basic_summary",
-                6: "custom"
-            }
-            
-            template_name = template_map.get(choice, "basic_summary")
-            self.collect_config("template", template_name)
-            
-            # Handle custom prompt
-            if template_name == "custom":
-                custom_prompt = prompt_for_text("Enter your custom prompt:")
-                if custom_prompt is None:
-                    return None
-                self.collect_config("custom_prompt", custom_prompt)
-            
-            return template_name
-        else:
-            return None
-
-    def get_processing_options(self) -> Optional[Dict[str, Any]]:
-        """
-        Get processing options from user.
-        
-        Returns:
-            Optional[Dict[str, Any]]: Processing options or None if cancelled
-        """
-        print("Configure processing options:")
-        
-        # Cloud processing option
-        use_cloud = prompt_for_confirmation("Use cloud processing? (faster but requires internet)")
-        if use_cloud is None:
-            return None
-        
-        # Quiet mode option
-        quiet = prompt_for_confirmation("Quiet mode? (minimal output)")
-        if quiet is None:
-            return None
-        
-        # Organization option
-        organize = prompt_for_confirmation("Organize output files? (create subdirectories)")
-        if organize is None:
-            return None
-        
-        options = {
-            "use_cloud": use_cloud,
-            "quiet": quiet,
-            "organize": organize
-        }
-        
-        self.collect_config("processing_options", options)
-        return options
-
     def get_output_options(self) -> Optional[Dict[str, Any]]:
         """
         Get output options from user.
@@ -188,8 +135,6 @@ class DocumentWorkflow(BaseWorkflow):
             "No file output (display only)"
         ]
         
-        from ..shared.user_prompter import prompt_for_choice
-        
         choice = prompt_for_choice(
             "Select output options:",
             output_options,
@@ -242,17 +187,16 @@ class DocumentWorkflow(BaseWorkflow):
         try:
             print("\nExecuting document processing...")
             
-            # Import and use the existing command executor
-            from ..command_executor import CommandExecutor
-            executor = CommandExecutor()
+            executor = get_executor()
             
             # Prepare configuration for the executor
+            cfg = self.config
             config = {
-                "file_path": self.get_config("document_file"),
-                "template": self.get_config("template"),
-                "custom_prompt": self.get_config("custom_prompt"),
-                "processing_options": self.get_config("processing_options", {}),
-                "output_config": self.get_config("output_config", {})
+                "file_path": cfg.get("document_file"),
+                "template": cfg.get("template"),
+                "custom_prompt": cfg.get("custom_prompt"),
+                "processing_options": cfg.get("processing_options", {}),
+                "output_config": cfg.get("output_config", {})
             }
             
             # Execute document processing
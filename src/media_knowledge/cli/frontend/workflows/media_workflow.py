@@ -5,7 +5,8 @@ Media Processing Workflow for Media Knowledge Pipeline CLI Wizard System
 from typing import Dict, Any, Optional
 from .base_workflow import BaseWorkflow
 from ..shared.input_validator import validate_youtube_url, validate_file_path
-from ..shared.user_prompter import prompt_for_choice, prompt_for_text, prompt_for_confirmation
+from ..shared.user_prompter import prompt_for_choice, prompt_for_text
+from ..command_executor import get_executor
 
 class MediaWorkflowError(Exception):
     """Custom exception for media workflow errors."""
@@ -14,32 +15,46 @@ class MediaWorkflowError(Exception):
 class MediaWorkflow(BaseWorkflow):
     """Workflow for processing media (YouTube videos, local audio/video files)."""
     
+    __slots__ = ()
+    
+    # Template keys in the same order as templates
+    _TEMPLATE_KEYS = (
+        "lecture_summary",
+        "technical_tutorial",
+        "research_presentation",
+        "podcast_summary",
+        "basic_summary",
+        "anki_flashcards",
+        "custom",
+    )
+    
+    # Option labels shown by each selection step
+    media_types = (
+        "YouTube Video URL",
+        "Local Media File (Video/Audio)",
+    )
+    
+    templates = (
+        "Lecture Summary (Educational content)",
+        "Technical Tutorial",
+        "Research Presentation",
+        "Podcast Summary",
+        "Basic Summary",
+        "Anki Flashcards (Generate study cards)",
+        "Custom Prompt",
+    )
+    
+    output_options = (
+        "Save detailed JSON results",
+        "Save Markdown summary",
+        "Save both formats",
+        "No file output (display only)",
+    )
+    
     def __init__(self):
         """Initialize media workflow."""
         super().__init__()
         self.workflow_name = "Media Processing Workflow"
-        
-        self.media_types = [
-            "YouTube Video URL",
-            "Local Media File (Video/Audio)"
-        ]
-        
-        self.templates = [
-            "Lecture Summary (Educational content)",
-            "Technical Tutorial", 
-            "Research Presentation",
-            "Podcast Summary",
-            "Basic Summary",
-            "Anki Flashcards (Generate study cards)",
-            "Custom Prompt"
-        ]
-        
-        self.output_options = [
-            "Save detailed JSON results",
-            "Save Markdown summary",
-            "Save both formats",
-            "No file output (display only)"
-        ]
 
     def run(self) -> bool:
         """
@@ -50,36 +65,42 @@ class MediaWorkflow(BaseWorkflow):
         """
         try:
             self.display_header("Media Processing Wizard")
+            self.resume_saved_config()
             
-            # Step 1: Select media type
-            self.display_step(1, "Select Media Type")
-            media_type = self.select_media_type()
-            if media_type is None:
-                return False
-            
-            # Step 2: Get media input
-            self.display_step(2, "Enter Media Input")
-            media_input = self.get_media_input(media_type)
-            if media_input is None:
-                return False
+            # Steps 1 and 2 save the media type together with the input
+            if "media_input" not in self.config:
+                # Step 1: Select media type
+                self.display_step(1, "Select Media Type")
+                media_type = self.select_media_type()
+                if media_type is None:
+                    return False
+                
+                # Step 2: Get media input
+                self.display_step(2, "Enter Media Input")
+                media_input = self.get_media_input(media_type)
+                if media_input is None:
+                    return False
             
             # Step 3: Select template
-            self.display_step(3, "Select Processing Template")
-            template = self.select_template()
-            if template is None:
-                return False
+            if "template" not in self.config:
+                self.display_step(3, "Select Processing Template")
+                template = self.select_template()
+                if template is None:
+                    return False
             
             # Step 4: Get processing options
-            self.display_step(4, "Processing Options")
-            processing_options = self.get_processing_options()
-            if processing_options is None:
-                return False
+            if "processing_options" not in self.config:
+                self.display_step(4, "Processing Options")
+                processing_options = self.get_processing_options()
+                if processing_options is None:
+                    return False
             
             # Step 5: Get output options
-            self.display_step(5, "Output Options")
-            output_options = self.get_output_options()
-            if output_options is None:
-                return False
+            if "output_config" not in self.config:
+                self.display_step(5, "Output Options")
+                output_options = self.get_output_options()
+                if output_options is None:
+                    return False
             
             # Step 6: Confirm and execute
             self.display_step(6, "Review & Execute")
@@ -131,8 +152,10 @@ class MediaWorkflow(BaseWorkflow):
                     return None
                 
                 if validate_youtube_url(url):
-                    self.collect_config("media_input", url)
+                    # media_input is saved last in both branches, since run()
+                    # skips this step on resume once it is present
                     self.collect_config("media_type", "youtube")
+                    self.collect_config("media_input", url)
                     return url
                 else:
                     print("Please enter a valid YouTube URL.")
@@ -146,85 +169,12 @@ class MediaWorkflow(BaseWorkflow):
                     return None
                 
                 if validate_file_path(file_path):
-                    self.collect_config("media_input", file_path)
                     self.collect_config("media_type", "local")
+                    self.collect_config("media_input", file_path)
                     return file_path
                 else:
                     print("File not found. Please check the path and try again.")
 
-    def select_template(self) -> Optional[str]:
-        """
-        Guide user through template selection.
-        
-        Returns:
-            Optional[str]: Selected template or None if cancelled
-        """
-        choice = prompt_for_choice(
-            "Select processing template:",
-            self.templates,
-            allow_cancel=True
-        )
-        
-        if choice is None:
-            return None
-        elif 1 <= choice <= len(self.templates):
-            template_map = {
-                1: "lecture_summary",
-                2: "technical_tutorial",
-                3: "research_presentation",
-                4: "podcast_summary",
-                5: "basic_summary",
-                6: "anki_flashcards",
-                7: "custom"
-            }
-            
-            template_name = template_map.get(choice, "basic_summary")
-            self.collect_config("template", template_name)
-            
-            # Handle custom prompt
-            if template_name == "custom":
-                custom_prompt = prompt_for_text("Enter your custom prompt:")
-                if custom_prompt is None:
-                    return None
-                self.collect_config("custom_prompt", custom_prompt)
-            
-            return template_name
-        else:
-            return None
-
-    def get_processing_options(self) -> Optional[Dict[str, Any]]:
-        """
-        Get processing options from user.
-        
-        Returns:
-            Optional[Dict[str, Any]]: Processing options or None if cancelled
-        """
-        print("Configure processing options:")
-        
-        # Cloud processing option
-        use_cloud = prompt_for_confirmation("Use cloud processing? (faster but requires internet)")
-        if use_cloud is None:
-            return None
-        
-        # Quiet mode option
-        quiet = prompt_for_confirmation("Quiet mode? (minimal output)")
-        if quiet is None:
-            return None
-        
-        # Organization option
-        organize = prompt_for_confirmation("Organize output files? (create subdirectories)")
-        if organize is None:
-            return None
-        
-        options = {
-            "use_cloud": use_cloud,
-            "quiet": quiet,
-            "organize": organize
-        }
-        
-        self.collect_config("processing_options", options)
-        return options
-
     def get_output_options(self) -> Optional[Dict[str, Any]]:
         """
         Get output options from user.
@@ -284,18 +234,17 @@ class MediaWorkflow(BaseWorkflow):
         try:
             print("\nExecuting media processing...")
             
-            # Import and use the existing command executor
-            from ..command_executor import CommandExecutor
-            executor = CommandExecutor()
+            executor = get_executor()
             
             # Prepare configuration for the executor
+            cfg = self.config
             config = {
-                "media_input": self.get_config("media_input"),
-                "media_type": self.get_config("media_type"),
-                "template": self.get_config("template"),
-                "custom_prompt": self.get_config("custom_prompt"),
-                "processing_options": self.get_config("processing_options", {}),
-                "output_config": self.get_config("output_config", {})
+                "media_input": cfg.get("media_input"),
+                "media_type": cfg.get("media_type"),
+                "template": cfg.get("template"),
+                "custom_prompt": cfg.get("custom_prompt"),
+                "processing_options": cfg.get("processing_options", {}),
+                "output_config": cfg.get("output_config", {})
             }
             
             # Execute media processing
@@ -4,27 +4,50 @@ Interactive Frontend for Media Knowledge Pipeline CLI
 This module provides a friendly menu-driven interface for the CLI.
 """
 
+import importlib
 import sys
 from pathlib import Path
 
-# Imports are relative now
+# Frontend classes and the module they live in. A session usually opens a
+# single wizard, so each module is only imported the first time it is needed.
+_LAZY_IMPORTS = {
+    "MainMenu": "main_menu",
+    "DocumentWizard": "document_wizard",
+    "MediaWizard": "media_wizard",
+    "BatchWizard": "batch_wizard",
+    "AnkiWizard": "anki_wizard",
+    "CommandExecutor": "command_executor",
+}
 
-from .frontend.main_menu import MainMenu
-from .frontend.document_wizard import DocumentWizard
-from .frontend.media_wizard import MediaWizard
-from .frontend.batch_wizard import BatchWizard
-from .frontend.anki_wizard import AnkiWizard
-from .frontend.command_executor import CommandExecutor
+
+def __getattr__(name):
+    """Import frontend classes on first access and keep them as globals."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".frontend.{module_name}", __package__)
+    value = globals()[name] = getattr(module, name)
+    return value
+
+
+def _lazy(name):
+    """Return a frontend class, importing its module if not done yet."""
+    try:
+        return globals()[name]
+    except KeyError:
+        return __getattr__(name)
 
 
 def run_interactive_frontend():
     """Run the interactive frontend with menu and wizards."""
     print("Starting Media Knowledge Pipeline Interactive Frontend...")
-    executor = CommandExecutor()
+    # The frontend runs in the same environment as the CLI, so commands can
+    # reuse this interpreter instead of starting a new one each time
+    executor = _lazy("CommandExecutor")(in_process=True)
     
     while True:
         # Display main menu
-        menu = MainMenu()
+        menu = _lazy("MainMenu")()
         choice = menu.run()
         
         # Handle menu choices
@@ -33,7 +56,7 @@ def run_interactive_frontend():
             break
         elif choice == 1:  # Process Media Content
             print("\nMedia Processing Selected")
-            media_wizard = MediaWizard()
+            media_wizard = _lazy("MediaWizard")()
             config = media_wizard.process_media_interactive()
             if config:
                 print("\nExecuting media processing with the following configuration:")
@@ -53,7 +76,7 @@ def run_interactive_frontend():
             print("\nReturning to main menu...\n")
         elif choice == 2:  # Batch Process Multiple Items
             print("\nBatch Processing Selected")
-            batch_wizard = BatchWizard()
+            batch_wizard = _lazy("BatchWizard")()
             config = batch_wizard.process_batch_interactive()
             if config:
                 print("\nExecuting batch processing with the following configuration:")
@@ -77,7 +100,7 @@ def run_interactive_frontend():
             print("\nReturning to main menu...\n")
         elif choice == 4:  # Generate Anki Flashcards
             print("\nGenerate Anki Flashcards Selected")
-            anki_wizard = AnkiWizard()
+            anki_wizard = _lazy("AnkiWizard")()
             config = anki_wizard.process_anki_interactive()
             if config:
                 print("\nExecuting Anki generation with the following configuration:")
@@ -105,15 +128,15 @@ def run_interactive_frontend():
             print("\nScan Directory for Media Files Selected")
             print("This feature will be implemented in a future update.")
             print("\nReturning to main menu...\n")
-        elif choice == 5:  # Watch Directory for New Files
+        elif choice == 6:  # Watch Directory for New Files
             print("\nWatch Directory for New Files Selected")
             print("This feature will be implemented in a future update.")
             print("\nReturning to main menu...\n")
-        elif choice == 6:  # System Status and Requirements
+        elif choice == 7:  # System Status and Requirements
             print("\nSystem Status and Requirements Selected")
             print("This feature will be implemented in a future update.")
             print("\nReturning to main menu...\n")
-        elif choice == 7:  # Show Pipeline Architecture
+        elif choice == 8:  # Show Pipeline Architecture
             print("\nShow Pipeline Architecture Selected")
             print("This feature will be implemented in a future update.")
             print("\nReturning to main menu...\n")
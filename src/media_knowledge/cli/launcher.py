@@ -8,30 +8,44 @@ import sys
 import os
 from pathlib import Path
 
-# Add project root to path for imports
-project_root = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(project_root))
+# Add project root to path for imports. This module can also be run as a
+# script, so the root is computed here rather than taken from _bootstrap.
+_PROJECT_ROOT = Path(__file__).resolve().parents[3]
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+
+# Output of art.text2art(..., font="standard") for the three title words,
+# kept as a literal so startup does not render the same glyphs every time
+_WELCOME_BANNER = (
+    ' __  __  _____  ____   ___     _    \n'
+    '|  \\/  || ____||  _ \\ |_ _|   / \\   \n'
+    '| |\\/| ||  _|  | | | | | |   / _ \\  \n'
+    '| |  | || |___ | |_| | | |  / ___ \\ \n'
+    '|_|  |_||_____||____/ |___|/_/   \\_\\\n'
+    '                                    \n'
+    '\n'
+    ' _  __ _   _   ___  __        __ _      _____  ____    ____  _____ \n'
+    '| |/ /| \\ | | / _ \\ \\ \\      / /| |    | ____||  _ \\  / ___|| ____|\n'
+    "| ' / |  \\| || | | | \\ \\ /\\ / / | |    |  _|  | | | || |  _ |  _|  \n"
+    '| . \\ | |\\  || |_| |  \\ V  V /  | |___ | |___ | |_| || |_| || |___ \n'
+    '|_|\\_\\|_| \\_| \\___/    \\_/\\_/   |_____||_____||____/  \\____||_____|\n'
+    '                                                                   \n'
+    '\n'
+    ' ____   ___  ____   _____  _      ___  _   _  _____ \n'
+    '|  _ \\ |_ _||  _ \\ | ____|| |    |_ _|| \\ | || ____|\n'
+    '| |_) | | | | |_) ||  _|  | |     | | |  \\| ||  _|  \n'
+    '|  __/  | | |  __/ | |___ | |___  | | | |\\  || |___ \n'
+    '|_|    |___||_|    |_____||_____||___||_| \\_||_____|\n'
+    '                                                    \n'
+    '\n'
+    '\n'
+)
 
 
 def display_welcome_ascii():
     """Display the welcome ASCII art for the application."""
-    try:
-        # Use the art library to generate clean ASCII art
-        from art import text2art
-        media_art = text2art("MEDIA", font="standard")
-        knowledge_art = text2art("KNOWLEDGE", font="standard")
-        pipeline_art = text2art("PIPELINE", font="standard")
-        
-        print(media_art)
-        print(knowledge_art)
-        print(pipeline_art)
-        print()
-    except ImportError:
-        # Fallback to simple header if art library not available
-        print("=" * 60)
-        print("           MEDIA KNOWLEDGE PIPELINE")
-        print("=" * 60)
-        print()
+    print(_WELCOME_BANNER, end="")
 
 
 def main():
@@ -52,19 +66,10 @@ def main():
     except ImportError as e:
         # If relative import fails, try absolute import (direct execution)
         try:
-            import sys
-            import os
-            # Add project root to path for imports
-            project_root = os.path.dirname(
-                os.path.dirname(
-                    os.path.dirname(
-                        os.path.dirname(
-                            os.path.dirname(__file__)
-                        )
-                    )
-                )
-            )
-            sys.path.insert(0, project_root)
+            # Add the directory containing the media_knowledge package
+            src_dir = str(_PROJECT_ROOT / "src")
+            if src_dir not in sys.path:
+                sys.path.insert(0, src_dir)
             from media_knowledge.cli.interactive import run_interactive_frontend
             run_interactive_frontend()
         except ImportError as e2:
@@ -2,10 +2,13 @@
 """
 Test runner for CLI frontend tests
 """
-import subprocess
+import contextlib
+import io
 import sys
 import os
 
+import pytest
+
 # Add project root to path
 sys.path.insert(0, '/Users/jasonbelcher/Documents/code/media-knowledge-pipeline')
 
@@ -26,22 +29,21 @@ def run_tests():
         print(f"\n📋 Running {test_file}...")
         print("-" * 40)
         
-        result = subprocess.run(
-            ["python", "-m", "pytest", f"tests/cli_frontend/{test_file}", "-v"],
-            capture_output=True,
-            text=True
-        )
+        # Run pytest in this interpreter instead of starting a new one per file
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            exit_code = pytest.main([f"tests/cli_frontend/{test_file}", "-v"])
         
         results.append({
             'file': test_file,
-            'exit_code': result.returncode,
-            'output': result.stdout + result.stderr
+            'exit_code': exit_code,
+            'output': stdout.getvalue() + stderr.getvalue()
         })
         
-        print(result.stdout)
-        if result.stderr:
-            print("STDERR:", result.stderr)
-        print(f"Exit code: {result.returncode}")
+        print(stdout.getvalue())
+        if stderr.getvalue():
+            print("STDERR:", stderr.getvalue())
+        print(f"Exit code: {exit_code}")
     
     print("\n" + "=" * 50)
     print("📊 Test Results Summary")
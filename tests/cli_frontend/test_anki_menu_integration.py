@@ -20,28 +20,28 @@ class TestAnkiMenuIntegration:
         wizard = AnkiWizard()
         assert wizard is not None
     
-    def test_get_json_source_valid(self):
+    def test_get_json_source_valid(self, tmp_path):
         """Test valid JSON source input."""
         wizard = AnkiWizard()
         
-        # Mock valid JSON file input
-        with patch('builtins.input', return_value='/path/to/results.json'):
-            with patch('pathlib.Path.exists', return_value=True):
-                with patch('pathlib.Path.is_file', return_value=True):
-                    result = wizard.get_json_source()
-                    assert result == '/path/to/results.json'
+        results = tmp_path / "results.json"
+        results.write_text("{}")
+        with patch('builtins.input', return_value=str(results)):
+            result = wizard.get_json_source()
+            assert result == str(results)
     
-    def test_get_json_source_invalid_then_valid(self):
+    def test_get_json_source_invalid_then_valid(self, tmp_path):
         """Test invalid then valid JSON source input."""
         wizard = AnkiWizard()
         
-        # Mock invalid then valid input
-        with patch('builtins.input', side_effect=['invalid.txt', '/path/to/results.json']):
-            with patch('pathlib.Path.exists', side_effect=[False, True]):
-                with patch('pathlib.Path.is_file', return_value=True):
-                    with patch('builtins.print') as mock_print:
-                        result = wizard.get_json_source()
-                        assert result == '/path/to/results.json'
+        results = tmp_path / "results.json"
+        results.write_text("{}")
+        # A missing file and a directory are rejected before the valid file
+        inputs = [str(tmp_path / "invalid.txt"), str(tmp_path), str(results)]
+        with patch('builtins.input', side_effect=inputs):
+            with patch('builtins.print') as mock_print:
+                result = wizard.get_json_source()
+                assert result == str(results)
     
     def test_get_deck_name_default(self):
         """Test deck name with default (empty input)."""
@@ -87,6 +87,29 @@ class TestBaseWorkflow:
             result = workflow.confirm_and_execute()
             assert result == False
     
+    def test_resume_saved_config(self, tmp_path):
+        """Test that answers from an unfinished run can be resumed."""
+        state_file = tmp_path / "wizard_state.json"
+        prompter = 'src.media_knowledge.cli.frontend.shared.user_prompter.prompt_for_confirmation'
+
+        with patch('src.media_knowledge.cli.frontend.workflows.base_workflow._STATE_FILE', state_file):
+            workflow = ConcreteWorkflow()
+            workflow._save_state = True
+            workflow.collect_config("template", "basic_summary")
+            assert state_file.exists()
+
+            resumed = ConcreteWorkflow()
+            resumed._save_state = True
+            with patch(prompter, return_value=True):
+                assert resumed.resume_saved_config() == True
+            assert resumed.get_config("template") == "basic_summary"
+
+            # A successful run removes the saved answers
+            resumed.execution_result = True
+            with patch(prompter, return_value=True):
+                assert resumed.confirm_and_execute() == True
+            assert not state_file.exists()
+
     def test_cleanup(self):
         """Test cleanup method."""
         workflow = ConcreteWorkflow()
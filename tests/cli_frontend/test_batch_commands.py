@@ -125,6 +125,23 @@ ftp://invalid-protocol.com
                 assert "youtu.be/valid2" in valid_urls[1]
 
 
+class TestUrlValidation:
+    """Test cases for YouTube URL validation."""
+    
+    def test_youtube_url_validation(self):
+        """Test the generated YouTube URL matcher."""
+        processor = BatchProcessor()
+        
+        assert processor._is_valid_youtube_url("https://www.youtube.com/watch?v=abc") == True
+        assert processor._is_valid_youtube_url("https://www.youtube.com/embed/abc") == True
+        assert processor._is_valid_youtube_url("https://youtu.be/abc") == True
+        
+        # Missing video id, missing scheme, or non-YouTube host
+        assert processor._is_valid_youtube_url("https://youtu.be/") == False
+        assert processor._is_valid_youtube_url("www.youtube.com/watch?v=abc") == False
+        assert processor._is_valid_youtube_url("https://www.google.com/watch?v=abc") == False
+
+
 class TestParallelProcessing:
     """Test cases for parallel processing functionality."""
     
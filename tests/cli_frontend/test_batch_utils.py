@@ -11,6 +11,7 @@ from pathlib import Path
 # Add project root to path
 sys.path.insert(0, '/Users/jasonbelcher/Documents/code/media-knowledge-pipeline')
 
+from src.media_knowledge.cli.batch_processor import BatchProcessor
 from src.media_knowledge.cli.frontend.batch_utils import BatchUtilities, BatchUtilsError
 
 
@@ -43,6 +44,24 @@ invalid-url
                 assert result['invalid_count'] == 1
                 assert result['is_valid'] == True
     
+    def test_urls_file_validation_cached(self, tmp_path):
+        """Test that unchanged URLs files are only parsed once."""
+        utils = BatchUtilities()
+        urls_file = tmp_path / "urls.txt"
+        urls_file.write_text("https://youtu.be/shorturl\n")
+        
+        with patch.object(BatchProcessor, 'parse_urls_file', autospec=True,
+                          side_effect=BatchProcessor.parse_urls_file) as parse:
+            first = utils.validate_urls_file(str(urls_file))
+            second = utils.validate_urls_file(str(urls_file))
+            assert first == second
+            assert parse.call_count == 1
+            
+            # Editing the file invalidates the cached result
+            urls_file.write_text("https://youtu.be/shorturl\nhttps://youtu.be/another\n")
+            assert utils.validate_urls_file(str(urls_file))['valid_count'] == 2
+            assert parse.call_count == 2
+    
     def test_sample_urls_file_creation(self):
         """Test creation of sample URLs file."""
         utils = BatchUtilities()
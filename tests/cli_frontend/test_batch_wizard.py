@@ -67,6 +67,34 @@ class TestBatchWizard:
             assert result['enable_essay'] == True
             assert result['force_essay'] == False
 
+    def test_form_answers(self):
+        """Test collecting all answers with a single questionary form."""
+        wizard = BatchWizard()
+
+        fake_questionary = MagicMock()
+        fake_questionary.prompt.return_value = {
+            "urls_file": "/tmp/urls.txt",
+            "output_dir": "/tmp/output",
+            "parallel_workers": "4",
+            "template": "technical_tutorial",
+            "enable_essay": False,
+            "use_cloud": True,
+            "quiet": False,
+        }
+        with patch('src.media_knowledge.cli.frontend.batch_wizard.questionary', fake_questionary):
+            with patch('pathlib.Path.mkdir'):
+                result = wizard.ask_form()
+
+        assert result == (
+            "/tmp/urls.txt",
+            "/tmp/output",
+            4,
+            "technical_tutorial",
+            None,
+            {"enable_essay": False, "force_essay": False},
+            {"use_cloud": True, "quiet": False, "organize": True},
+        )
+
 
 class TestUrlsFileValidation:
     """Test cases for URLs file validation."""
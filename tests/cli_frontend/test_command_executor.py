@@ -11,6 +11,7 @@ from pathlib import Path
 sys.path.insert(0, '/Users/jasonbelcher/Documents/code/media-knowledge-pipeline')
 
 from src.media_knowledge.cli.frontend.command_executor import CommandExecutor
+from src.media_knowledge.cli.frontend.jobs import DocumentJob
 
 
 class TestCommandExecutor:
@@ -282,7 +283,15 @@ class TestCommandConstruction:
         assert executor.base_command[0] == sys.executable
         assert executor.base_command[1] == "-m"
         assert "media_knowledge" in executor.base_command[2]
-        
+
+    def test_base_command_targets_cli_app(self):
+        """Test that commands run the Typer app module, not the package."""
+        executor = CommandExecutor()
+
+        assert executor.base_command[-1] == "media_knowledge.cli.app"
+        # Each executor gets its own list, so extending one is harmless
+        assert executor.base_command is not CommandExecutor().base_command
+
     def test_command_with_all_options(self):
         """Test command construction with all options enabled."""
         executor = CommandExecutor()
@@ -312,6 +321,95 @@ class TestCommandConstruction:
             assert result == True
             mock_run.assert_called_once()
 
+    def test_job_matches_config_dict(self):
+        """Test that a job dataclass builds the same command as its config dict."""
+        executor = CommandExecutor()
+
+        config = {
+            "file_path": "/tmp/document.pdf",
+            "template": "custom",
+            "custom_prompt": "List the key arguments",
+            "output_config": {
+                "save_json": False,
+                "save_markdown": True,
+                "output_type": 2
+            },
+            "processing_options": {
+                "use_cloud": True,
+                "quiet": False
+            }
+        }
+
+        commands = []
+        for job in (config, DocumentJob.from_config(config)):
+            with patch('subprocess.run') as mock_run:
+                mock_run.return_value.returncode = 0
+                assert executor.execute_document_processing(job) == True
+                commands.append(mock_run.call_args[0][0])
+
+        assert commands[0] == commands[1]
+        assert "--cloud" in commands[1]
+        assert "--custom-prompt" in commands[1]
+
+    def test_in_process_execution(self):
+        """Test running commands with the CLI app in the current process."""
+        executor = CommandExecutor(in_process=True)
+
+        config = {
+            "urls_file": "/tmp/urls.txt",
+            "output_dir": "/tmp/output",
+            "template": "lecture_summary",
+            "custom_prompt": None,
+            "parallel_workers": 1,
+            "essay_options": {
+                "enable_essay": False,
+                "force_essay": False
+            },
+            "processing_options": {
+                "use_cloud": False,
+                "quiet": True,
+                "organize": True
+            }
+        }
+
+        mock_app = MagicMock(side_effect=SystemExit(0))
+        with patch.object(executor, '_get_app', return_value=mock_app):
+            with patch('subprocess.run') as mock_run:
+                result = executor.execute_batch_processing(config)
+
+                assert result == True
+                mock_run.assert_not_called()
+
+        args = mock_app.call_args.kwargs["args"]
+        assert args[:2] == ["batch", "process-urls"]
+        assert "--quiet" in args
+
+        # A non-zero exit code is reported as a failure
+        mock_app.side_effect = SystemExit(1)
+        with patch.object(executor, '_get_app', return_value=mock_app):
+            assert executor.execute_batch_processing(config) == False
+
+    def test_execute_many(self):
+        """Test running several jobs concurrently with results in order."""
+        executor = CommandExecutor()
+
+        configs = [
+            {"input_file": f"/tmp/synthesis_{i}.json", "deck_name": None}
+            for i in range(3)
+        ]
+
+        def run(command, **kwargs):
+            result = MagicMock()
+            result.returncode = 1 if command[-1].endswith("_1.json") else 0
+            return result
+
+        with patch('subprocess.run', side_effect=run) as mock_run:
+            results = executor.execute_many(configs, "anki", max_workers=2)
+
+        assert results == [True, False, True]
+        assert mock_run.call_count == 3
+        assert executor.execute_many([], "anki") == []
+
 
 class TestErrorHandling:
     """Test error handling in command executor."""
@@ -15,7 +15,8 @@ from src.media_knowledge.cli.frontend.shared.input_validator import (
     validate_youtube_url, 
     validate_file_path, 
     validate_number_range,
-    validate_file_format
+    validate_file_format,
+    clear_file_path_cache
 )
 
 class TestInputValidator:
@@ -71,6 +72,22 @@ class TestInputValidator:
         # Test with None and int by passing them as strings since the function expects str
         # The function should handle these gracefully and return False
     
+    def test_validate_file_path_cached(self, tmp_path):
+        """Test that results are reused until the TTL passes or the cache is cleared."""
+        test_file = tmp_path / "later.txt"
+        monotonic = 'src.media_knowledge.cli.frontend.shared.input_validator.time.monotonic'
+        
+        with patch(monotonic, return_value=100.0):
+            assert validate_file_path(str(test_file)) == False
+            test_file.write_text("created after the first check")
+            assert validate_file_path(str(test_file)) == False
+            clear_file_path_cache()
+            assert validate_file_path(str(test_file)) == True
+        
+        test_file.unlink()
+        with patch(monotonic, return_value=200.0):
+            assert validate_file_path(str(test_file)) == False
+    
     def test_validate_number_range_valid(self):
         """Test number range validation with valid numbers."""
         assert validate_number_range("5", 1, 10) == True
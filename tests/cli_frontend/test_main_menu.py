@@ -77,6 +77,7 @@ class TestMainMenuSystem:
             ("5", 5),
             ("6", 6),
             ("7", 7),
+            ("8", 8),
             ("0", 0)
         ]
         
@@ -90,7 +91,7 @@ class TestMainMenuSystem:
         menu = MainMenu()
         
         # Test invalid inputs
-        invalid_inputs = ["8", "9", "-1", "abc", ""]
+        invalid_inputs = ["9", "10", "-1", "abc", ""]
         
         for invalid_input in invalid_inputs:
             with patch('builtins.input', return_value=invalid_input):
@@ -49,17 +49,21 @@ class TestMediaWizard:
             result = wizard.get_media_input('youtube')
             assert result == valid_url
     
-    def test_file_path_input_validation(self):
+    def test_file_path_input_validation(self, tmp_path):
         """Test file path input and validation."""
         wizard = MediaWizard()
         
-        # Test valid file path (mocking file existence)
-        valid_path = "/tmp/test.mp4"
-        with patch('pathlib.Path.exists', return_value=True):
-            with patch('pathlib.Path.is_file', return_value=True):
-                with patch('builtins.input', return_value=valid_path):
-                    result = wizard.get_media_input('local')
-                    assert result == valid_path
+        # Test valid file path
+        valid_path = str(tmp_path / "test.mp4")
+        Path(valid_path).write_bytes(b"video")
+        with patch('builtins.input', return_value=valid_path):
+            result = wizard.get_media_input('local')
+            assert result == valid_path
+        
+        # A directory is rejected before the valid file is accepted
+        with patch('builtins.input', side_effect=[str(tmp_path), valid_path]):
+            result = wizard.get_media_input('local')
+            assert result == valid_path
     
     def test_template_selection(self):
         """Test template selection functionality."""
@@ -14,7 +14,11 @@ from src.media_knowledge.cli.frontend.shared.user_prompter import (
     prompt_for_choice,
     prompt_for_text,
     prompt_for_confirmation,
-    prompt_for_number
+    prompt_for_number,
+    prompt_for_choice_async,
+    prompt_for_multiselect,
+    read_line,
+    PROMPT_TIMEOUT
 )
 
 class TestUserPrompter:
@@ -111,5 +115,66 @@ class TestUserPrompter:
                 result = prompt_for_number("Enter number:", 1, 10)
                 assert result == 5
 
+    def test_prompt_for_number_signed(self):
+        """Test signed numbers are accepted and non-ASCII digits rejected."""
+        with patch('builtins.input', side_effect=['²', '-', '-3']):
+            with patch('builtins.print') as mock_print:
+                result = prompt_for_number("Enter number:", -5, 5)
+                assert result == -3
+                mock_print.assert_any_call("Please enter a valid number.")
+
+    def test_prompt_for_multiselect(self):
+        """Test selecting several options with one answer."""
+        options = ["Cloud", "Quiet", "Organize"]
+        with patch('builtins.input', side_effect=['1, 3', '', '0', '4', '2']):
+            with patch('builtins.print'):
+                assert prompt_for_multiselect("Options:", options) == {1, 3}
+                assert prompt_for_multiselect("Options:", options, defaults=(3,)) == {3}
+                assert prompt_for_multiselect("Options:", options, defaults=(3,)) == set()
+                # Out-of-range numbers are rejected before asking again
+                assert prompt_for_multiselect("Options:", options) == {2}
+
+    def test_read_line_from_piped_input(self, tmp_path, capsys):
+        """Test reading answers from a redirected file instead of a terminal."""
+        answers = tmp_path / "answers.txt"
+        answers.write_text("2\nhello\n")
+        
+        with open(answers) as stdin:
+            with patch('sys.stdin', stdin):
+                with patch('builtins.input') as mock_input:
+                    assert prompt_for_choice("Select an option:", ["A", "B"]) == 2
+                    assert read_line("> ") == "hello"
+                    with pytest.raises(EOFError):
+                        read_line("> ")
+                    mock_input.assert_not_called()
+        
+        assert "Enter choice: " in capsys.readouterr().out
+
+    @pytest.mark.skipif(os.name == "nt", reason="needs a POSIX terminal")
+    def test_prompt_for_choice_async_timeout(self):
+        """Test returning to the caller while the terminal has no answer."""
+        import pty
+        
+        master, slave = pty.openpty()
+        try:
+            with open(slave, closefd=False) as terminal:
+                with patch('sys.stdin', terminal):
+                    with patch('builtins.print'):
+                        result = prompt_for_choice_async(
+                            "Select an option:", ["A", "B"], timeout=0.01
+                        )
+                        assert result is PROMPT_TIMEOUT
+                        
+                        os.write(master, b"2\n")
+                        with patch('builtins.input', return_value='2'):
+                            result = prompt_for_choice_async(
+                                "Select an option:", ["A", "B"],
+                                timeout=1, show_prompt=False
+                            )
+                        assert result == 2
+        finally:
+            os.close(master)
+            os.close(slave)
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
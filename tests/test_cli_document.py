@@ -0,0 +1,76 @@
+"""
+Test suite for Document CLI commands.
+"""
+import json
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.document_readers import DocumentReaderFactory
+from src.media_knowledge.cli.commands import document
+
+
+class TestDocumentFormats:
+    """Test cases for document format handling in the CLI."""
+
+    def test_static_formats_match_factory(self):
+        """Test that the static format list mirrors the reader factory."""
+        factory_formats = {
+            f".{fmt.lstrip('.')}" for fmt in DocumentReaderFactory.supported_formats()
+        }
+        assert set(document._SUPPORTED) == factory_formats
+
+    def test_every_format_has_library(self):
+        """Test that each supported format lists its backing library."""
+        for ext in document._SUPPORTED:
+            assert ext.lstrip('.') in document._FORMAT_LIBRARIES
+
+
+class TestBatchResultWriter:
+    """Test cases for incremental batch result persistence."""
+
+    SETTINGS = {"pattern": "*.*", "cloud": False}
+
+    def test_close_writes_final_json(self, tmp_path):
+        """Test that results are assembled into the final JSON document."""
+        output = tmp_path / "batch.json"
+        writer = document._BatchResultWriter(output, {"total_files": 1}, self.SETTINGS)
+        writer.write("a", {"status": "success"})
+        writer.close({"successful": 1})
+
+        data = json.loads(output.read_text())
+        assert data == {"total_files": 1, "results": [{"status": "success"}], "successful": 1}
+        assert not output.with_suffix(".partial.ndjson").exists()
+
+    def test_resume_from_partial(self, tmp_path):
+        """Test that an interrupted batch is picked up by a rerun."""
+        output = tmp_path / "batch.json"
+        writer = document._BatchResultWriter(output, {}, self.SETTINGS)
+        writer.write("a", {"status": "success", "processing_stats": {"extracted_characters": 5}})
+        writer.abort()
+
+        writer = document._BatchResultWriter(output, {}, self.SETTINGS)
+        assert writer.completed == {"a": ("success", 5)}
+        writer.write("b", {"status": "error"})
+        writer.close({})
+
+        data = json.loads(output.read_text())
+        assert [r["status"] for r in data["results"]] == ["success", "error"]
+
+    def test_changed_settings_start_fresh(self, tmp_path):
+        """Test that a partial file from different settings is discarded."""
+        output = tmp_path / "batch.json"
+        writer = document._BatchResultWriter(output, {}, self.SETTINGS)
+        writer.write("a", {"status": "success"})
+        writer.abort()
+
+        writer = document._BatchResultWriter(output, {}, {**self.SETTINGS, "cloud": True})
+        assert writer.completed == {}
+        writer.abort()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -143,6 +143,61 @@ class TestFileScanner:
         assert result.status == "error"
         assert "File not found" in result.error_message
     
+    def test_copy_media_file_public(self, tmp_path):
+        """Test copying a single file with type detection."""
+        scanner = FileScanner(
+            audio_directory=tmp_path / "audio",
+            video_directory=tmp_path / "video",
+            document_directory=tmp_path / "documents"
+        )
+        
+        source_file = tmp_path / "clip.mp4"
+        source_file.write_text("test video content")
+        other_file = tmp_path / "notes.txt"
+        other_file.write_text("not media")
+        
+        result = scanner.copy_media_file(source_file)
+        
+        assert result.status == "copied"
+        assert result.file_type == "video"
+        assert (tmp_path / "video" / "clip.mp4").exists()
+        assert scanner.copy_media_file(other_file) is None
+
+    def test_copy_media_file_skips_duplicate_content(self, tmp_path):
+        """Test that files with already-copied contents are not copied again."""
+        scanner = FileScanner(
+            audio_directory=tmp_path / "audio",
+            video_directory=tmp_path / "video",
+            document_directory=tmp_path / "documents"
+        )
+
+        original = tmp_path / "song.mp3"
+        original.write_bytes(b"same audio")
+        renamed = tmp_path / "song (1).mp3"
+        renamed.write_bytes(b"same audio")
+        different = tmp_path / "other.mp3"
+        different.write_bytes(b"diff audio")
+
+        assert scanner.copy_media_file(original).status == "copied"
+
+        result = scanner.copy_media_file(renamed)
+        assert result.status == "skipped"
+        assert result.destination == tmp_path / "audio" / "song.mp3"
+        assert not (tmp_path / "audio" / "song (1).mp3").exists()
+
+        assert scanner.copy_media_file(different).status == "copied"
+
+        # A dry run reports the file without reading its contents
+        dry_scanner = FileScanner(
+            audio_directory=tmp_path / "audio",
+            video_directory=tmp_path / "video",
+            document_directory=tmp_path / "documents",
+            dry_run=True
+        )
+        with patch("core.file_scanner._file_digest") as mock_digest:
+            assert dry_scanner.copy_media_file(renamed).status == "dry_run"
+            mock_digest.assert_not_called()
+
     def test_scan_directory_empty(self, tmp_path):
         """Test scanning an empty directory."""
         scanner = FileScanner(scan_directory=tmp_path)
@@ -157,7 +212,8 @@ class TestFileScanner:
         scanner = FileScanner(
             scan_directory=tmp_path,
             audio_directory=tmp_path / "audio",
-            video_directory=tmp_path / "video"
+            video_directory=tmp_path / "video",
+            document_directory=tmp_path / "documents"
         )
         
         # Create test files
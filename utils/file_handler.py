@@ -9,9 +9,19 @@ used throughout the Media-to-Knowledge Pipeline.
 
 import os
 import shutil
+import sys
 from pathlib import Path
 from typing import List, Optional, Union
 
+# shutil.copyfile already uses os.sendfile/fcopyfile on Linux and macOS; on
+# Windows speedcopy swaps in CopyFileW, which copy2 then picks up as well
+if sys.platform == "win32":
+    try:
+        import speedcopy
+        speedcopy.patch_copyfile()
+    except ImportError:
+        pass
+
 
 class FileHandlerError(Exception):
     """Custom exception for file handler errors."""